@@ -1,26 +1,266 @@
 import asyncio
+import datetime
+import hashlib
+import heapq
+import itertools
 import logging
+import time
 from abc import ABCMeta, abstractmethod
-from collections.abc import Iterable
-from typing import Any, Generic, Literal, TypedDict, TypeVar
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any, Generic, Literal, NamedTuple, TypedDict, TypeVar
 
 import logfire
 import telegram
 
+from src.crawler.article import ArticleRecord
 from src.crawler.base_crawler import BaseArticle
-from src.util import escape_markdown
+from src.util import SortedIdDict, TimedQueue, TokenBucket, escape_markdown
 
 MessageType = TypeVar("MessageType")
+Job = tuple[Literal["send", "edit", "delete"], BaseArticle]
+# 작업 우선순위 (작을수록 먼저 처리). 새 게시글 전송이 오래된 게시글의 수정/삭제에 밀리지 않도록 함
+JOB_PRIORITY: dict[str, int] = {"send": 0, "edit": 1, "delete": 2}
+
+_dispatch_latency_histogram = logfire.metric_histogram(
+    "bot.queue.latency", unit="s", description="메시지 작업을 큐에 넣은 뒤 처리를 시작하기까지 걸린 시간"
+)
+_dispatch_delay_histogram = logfire.metric_histogram(
+    "bot.dispatch.delay", unit="s", description="요청 속도 제한으로 메시지 작업을 미룬 시간"
+)
+_render_counter = logfire.metric_counter(
+    "bot.render", unit="1", description="메시지 렌더링 캐시 조회 수 (hit: 캐시 사용, miss: 새로 렌더링)"
+)
+_edit_skipped_counter = logfire.metric_counter(
+    "bot.edit.skipped", unit="1", description="보이는 내용이 바뀌지 않아 요청하지 않은 메시지 수정 작업 수"
+)
+_coalesce_counter = logfire.metric_counter(
+    "bot.queue.coalesced",
+    unit="1",
+    description="같은 게시글의 작업과 합쳐지거나(merged) 서로 상쇄된(cancelled) 메시지 작업 수",
+)
+
+
+class RetryLater(Exception):
+    """메시지 작업을 delay초 뒤에 다시 시도해야 하는 경우 (요청 제한 등) 발생시키는 예외
+
+    Args:
+        delay (float): 다시 시도할 때까지 기다릴 시간 (초)
+    """
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(f"Retry after {delay} secs")
+        self.delay = delay
+
+
+def job_key(job: Job) -> tuple[str, int]:
+    """작업 대상 게시글의 키 (크롤러 이름, 게시글 번호) 반환"""
+    return job[1]["crawler_name"], job[1]["article_id"]
+
+
+def merge_jobs(old: Job, new: Job, delivered: bool = False) -> Job | None:
+    """같은 게시글의 처리 대기 중인 작업(old)과 그 뒤에 들어온 작업(new)을 하나로 합친 작업 반환
+
+    아직 전송하지 않은 게시글의 수정은 최신 게시글 전송으로 합치고, 전송과 삭제는 서로 상쇄되므로 None 을 반환.
+    단, 일부 전송 대상에만 보내고 돌려놓은 전송이면 이미 보낸 메시지를 지워야 하므로 삭제를 남김.
+    그 외에는 나중에 들어온 작업만 남김.
+
+    Args:
+        old (Job): 먼저 들어온 작업
+        new (Job): 나중에 들어온 작업
+        delivered (bool, optional): 게시글의 메시지를 이미 보낸 전송 대상이 있는지 여부
+
+    Returns:
+        Job | None: 합친 작업. 두 작업 모두 처리할 필요가 없는 경우 None
+    """
+    if old[0] == "send":
+        if new[0] == "delete":
+            return new if delivered else None
+        return "send", new[1]
+    return new
+
+
+class JobQueue(TimedQueue[Job]):
+    """게시글별로 작업을 합치는 메시지 작업 우선순위 큐
+
+    작업은 전송 > 수정 > 삭제 순서(JOB_PRIORITY)로, 우선순위가 같으면 들어온 순서대로 꺼냄.
+    큐에 남아있는 같은 게시글의 작업은 merge_jobs 로 합쳐서 게시글당 하나만 유지하며, 합쳐지거나 상쇄되어 없어진 작업은
+    task_done 을 호출한 것으로 처리하므로 join 은 실제로 처리할 작업만 기다림.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        # {게시글 키: [우선순위, 순번, 처음 넣은 시각, 작업]}
+        self._queue: dict[tuple[str, int], list[Any]] = {}  # type: ignore[assignment]
+        # (우선순위, 순번, 게시글 키) 힙. 합치면서 우선순위가 바뀌거나 상쇄된 작업의 항목은 꺼낼 때 건너뜀
+        self._heap: list[tuple[int, int, tuple[str, int]]] = []
+        self._seq = itertools.count()
+        self._last_enqueued = 0.0
+        self._dropped = 0
+        self._requeueing = False
+        # 게시글의 메시지를 이미 보낸 전송 대상이 있는지 확인하는 함수 (merge_jobs 참고). 봇에서 설정
+        self.delivered: Callable[[tuple[str, int]], bool] = lambda key: False
+
+    def _push(self, key: tuple[str, int], item: Job, enqueued_at: float) -> None:
+        entry = [JOB_PRIORITY[item[0]], next(self._seq), enqueued_at, item]
+        self._queue[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+
+    def _put(self, item: Job) -> None:
+        key = job_key(item)
+        if (entry := self._queue.get(key)) is None:
+            self._push(key, item, time.monotonic())
+            return
+        # 돌려놓는 작업은 큐에 남아있는 작업보다 먼저 들어온 작업임
+        old, new = (item, entry[3]) if self._requeueing else (entry[3], item)
+        merged = merge_jobs(old, new, self.delivered(key))
+        if merged is None:
+            del self._queue[key]
+            self._dropped += 2
+            _coalesce_counter.add(2, {"result": "cancelled"})
+            return
+        self._dropped += 1
+        _coalesce_counter.add(1, {"result": "merged"})
+        if JOB_PRIORITY[merged[0]] == entry[0]:
+            entry[3] = merged
+        else:
+            # 우선순위가 바뀐 경우 새 순번으로 다시 넣고, 큐에서 기다린 시간은 처음 넣은 시각부터 계산
+            self._push(key, merged, entry[2])
+
+    def _get(self) -> Job:
+        while True:
+            _, seq, key = heapq.heappop(self._heap)
+            entry = self._queue.get(key)
+            if entry is not None and entry[1] == seq:
+                break
+        del self._queue[key]
+        self._last_enqueued = entry[2]
+        return entry[3]
+
+    def put_nowait(self, item: Job) -> None:
+        super().put_nowait(item)
+        dropped, self._dropped = self._dropped, 0
+        for _ in range(dropped):
+            self.task_done()
+
+    def requeue(self, item: Job) -> None:
+        """처리하지 못한 작업을 큐에 돌려놓음. 같은 게시글의 작업이 큐에 있으면 돌려놓는 작업이 먼저 들어온 것으로 보고 합침"""
+        self._requeueing = True
+        try:
+            self.put_nowait(item)
+        finally:
+            self._requeueing = False
+
+
+# 게시글을 메시지 전송 인자(send_message, edit_text 의 키워드 인자)로 바꾸는 함수
+MessageTemplate = Callable[[BaseArticle], dict[str, Any]]
+
+
+class RenderedMessage(TypedDict):
+    """렌더링한 메시지
+
+    kwargs: 메시지 전송/수정 요청에 넘길 키워드 인자 (공유하는 객체이므로 수정하지 않을 것)
+    digest: 본문과 버튼으로 계산한 해시. 메시지에 보이는 내용이 같은지 비교하는 용도
+    """
+
+    kwargs: dict[str, Any]
+    digest: bytes
+
+
+def _message_digest(kwargs: Mapping[str, Any]) -> bytes:
+    """메시지 본문과 버튼으로 해시 계산. 프로세스가 바뀌어도 같은 값이 나오도록 blake2b 사용"""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(kwargs.get("text", "")).encode())
+    if (markup := kwargs.get("reply_markup")) is not None:
+        h.update(b"\0")
+        h.update(markup.to_json().encode() if isinstance(markup, telegram.TelegramObject) else repr(markup).encode())
+    return h.digest()
+
+
+class RenderCache:
+    """메시지 렌더링 결과 캐시
+
+    (템플릿, 게시글 내용)이 같으면 렌더링 결과를 재사용하므로 같은 템플릿을 쓰는 여러 봇/전송 대상이 한 번만 렌더링함.
+    오래 사용하지 않은 결과부터 지움.
+
+    Args:
+        maxsize (int, optional): 저장할 최대 렌더링 결과 수
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[tuple, RenderedMessage] = OrderedDict()
+
+    @staticmethod
+    def _key(template: MessageTemplate, article: BaseArticle) -> tuple:
+        extra = article.get("extra") or {}
+        return (
+            template,
+            *((key, value) for key, value in article.items() if key != "extra"),
+            *extra.items(),
+        )
+
+    def render(self, template: MessageTemplate, article: BaseArticle) -> RenderedMessage:
+        """게시글을 템플릿으로 렌더링. 같은 템플릿과 게시글 내용으로 렌더링한 결과가 있으면 재사용"""
+        try:
+            key = self._key(template, article)
+            rendered = self._cache.get(key)
+        except TypeError:
+            # 해시할 수 없는 값이 있는 게시글은 캐시하지 않음
+            kwargs = template(article)
+            return {"kwargs": kwargs, "digest": _message_digest(kwargs)}
+        if rendered is not None:
+            self._cache.move_to_end(key)
+            _render_counter.add(1, {"result": "hit"})
+            return rendered
+        _render_counter.add(1, {"result": "miss"})
+        kwargs = template(article)
+        rendered = {"kwargs": kwargs, "digest": _message_digest(kwargs)}
+        self._cache[key] = rendered
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# 모든 봇이 공유하는 렌더링 캐시
+render_cache = RenderCache()
+
+
+class MessageHandle(NamedTuple):
+    """메시지 수정/삭제에 필요한 값만 저장하는 메시지 핸들. JSON 으로 직렬화하면 [chat_id, message_id] 목록이 됨
+
+    chat_id: 메시지를 보낸 채팅방 ID
+    message_id: 메시지 ID
+    """
+
+    chat_id: int
+    message_id: int
+
+    @classmethod
+    def from_dump(cls, data: Any) -> "MessageHandle | None":
+        """덤프 파일에 저장된 메시지로 핸들 생성. 이전 버전의 telegram.Message 딕셔너리도 변환함. 변환할 수 없는 경우 None 반환"""
+        if isinstance(data, (list, tuple)) and len(data) == 2:
+            return cls(int(data[0]), int(data[1]))
+        if isinstance(data, dict):
+            try:
+                return cls(int(data["chat"]["id"]), int(data["message_id"]))
+            except (KeyError, TypeError, ValueError):
+                return None
+        return None
 
 
 def message_serializer(obj: Any) -> Any:
-    """메시지 객체를 직렬화할 때 사용하는 함수
+    """메시지 객체를 직렬화할 때 사용하는 함수 (MessageHandle 은 튜플이므로 그대로 직렬화됨)
 
     Args:
-        obj: 직렬화할 객체, 현재 telegram.Message 객체만 지원
+        obj: 직렬화할 객체, 현재 telegram.Message, ArticleRecord 객체만 지원
     """
     if isinstance(obj, telegram.Message):
         return obj.to_dict()
+    elif isinstance(obj, ArticleRecord):
+        return obj.to_dict()
     else:
         raise TypeError
 
@@ -33,18 +273,45 @@ class SerializedBotData(TypedDict, Generic[MessageType]):
     """
 
     queue: list[tuple[Literal["send", "edit", "delete"], BaseArticle]]
-    cache: dict[str, dict[int, MessageType]]
+    cache: dict[str, SortedIdDict[MessageType]]
 
 
 class BaseBot(Generic[MessageType], metaclass=ABCMeta):
+    """메시지 봇 기본 클래스
+
+    큐에 들어온 메시지 작업은 workers개의 작업자가 동시에 처리하며, 같은 게시글의 작업은 들어온 순서대로 하나씩 처리함.
+    요청 제한으로 미뤄야 하는 작업은 대기 힙에 넣어두고 처리할 시각이 되면 다시 처리하므로, 작업자는 기다리지 않고 다음 작업을 처리함.
+
+    Args:
+        name (str): 봇 이름
+        workers (int, optional): 동시에 처리할 메시지 작업 수
+    """
+
+    default_workers = 1
+
     def __init__(self, name: str, **kwargs) -> None:
         self.name = name
         self.cls_name = self.__class__.__name__
         self.config = kwargs
         self.logger = logging.getLogger(f"bot.{self.__class__.__name__}")
-        self.cache: dict[str, dict[int, MessageType]] = dict()
-        self.queue: asyncio.Queue[tuple[Literal["send", "edit", "delete"], BaseArticle]] = asyncio.Queue()
+        # 게시글 번호 순서로 정렬된 키 목록을 유지해서 만료된 메시지 객체를 이분 탐색으로 찾음
+        self.cache: dict[str, SortedIdDict[MessageType]] = dict()
+        self.queue = JobQueue()
+        self.queue.delivered = self._delivered
         self.is_running = True
+        self.workers: int = max(1, kwargs.get("workers", self.default_workers))
+        # 아이템을 처리하는 중인 작업자 수
+        self.dispatching = 0
+        # {(crawler_name, article_id): 같은 게시글의 처리 대기 중인 작업}. 처리 중이거나 미뤄진 작업이 있는 게시글만 포함
+        # 대기 중인 작업도 merge_jobs 로 합치므로 게시글당 최대 하나
+        self._held: dict[tuple[str, int], deque[Job]] = {}
+        # (처리할 시각, 순번, 게시글 키, 작업, 요청 제한 예약 여부) 힙
+        self._delayed: list[tuple[float, int, tuple[str, int], Job, bool]] = []
+        self._delayed_seq = itertools.count()
+        self._delayed_wakeup = asyncio.Event()
+        self._worker_tasks: list[asyncio.Task] = []
+        self._busy_workers: set[asyncio.Task] = set()
+        self._resumed_tasks: set[asyncio.Task] = set()
         self.consumer_task: asyncio.Task | None = asyncio.create_task(self.consumer())
 
     async def get_msg_obj(self, data: BaseArticle) -> MessageType | None:
@@ -68,7 +335,7 @@ class BaseBot(Generic[MessageType], metaclass=ABCMeta):
         """
         crawler_name = data["crawler_name"]
         if crawler_name not in self.cache:
-            self.cache[crawler_name] = {}
+            self.cache[crawler_name] = SortedIdDict()
         self.cache[crawler_name][data["article_id"]] = msg_obj
 
     async def remove_msg_obj(self, crawler_name: str, article_id: int):
@@ -94,57 +361,211 @@ class BaseBot(Generic[MessageType], metaclass=ABCMeta):
         """
         if crawler_name not in self.cache:
             self.logger.debug("Cache for %s not found", crawler_name)
-            self.cache[crawler_name] = {}
+            self.cache[crawler_name] = SortedIdDict()
             return
-        messages = self.cache[crawler_name]
-        remove_list = [i for i in messages.keys() if i < id_min]
-        for article_id in remove_list:
-            messages.pop(article_id, None)
+        for article_id in self.cache[crawler_name].remove_below(id_min):
             self.logger.debug("Removed expired message object (%s/%s)", crawler_name, article_id)
 
     async def consumer(self):
-        """메시지 전송 작업을 처리하는 코루틴. 큐에 아이템이 들어오면 해당 아이템을 처리.
-        별도의 작업이 없을 때는 1초마다 큐에 아이템이 있는지 확인.
+        """메시지 전송 작업을 처리하는 코루틴. 작업자 workers개와 미뤄진 작업을 처리하는 작업을 실행하고 모두 끝날 때까지 대기.
+        큐에 넣은 뒤 처리를 시작하기까지 걸린 시간은 bot.queue.latency 메트릭으로 기록.
         """
-        item = None
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        delay_task = asyncio.create_task(self._delay_loop())
+        try:
+            await asyncio.gather(*self._worker_tasks)
+            # 정지한 경우 미뤄진 작업은 더 꺼내지 않고, 이미 다시 처리 중인 작업만 끝날 때까지 대기
+            delay_task.cancel()
+            if self._resumed_tasks:
+                await asyncio.wait(list(self._resumed_tasks))
+        except asyncio.CancelledError:
+            # 작업이 취소됐다면 처리 중이던 아이템을 큐에 다시 넣어준 다음 consumer task 종료.
+            self.logger.info("Consumer task cancelled")
+            tasks = [*self._worker_tasks, *self._resumed_tasks]
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+        finally:
+            delay_task.cancel()
+            await asyncio.wait([delay_task])
+            # 대기 힙에 남은 작업은 큐에 다시 넣어서 다음에 실행할 때 (또는 덤프 파일에 저장해서) 처리
+            self._requeue_delayed()
+
+    async def _worker(self):
+        """큐에서 아이템을 꺼내 처리하는 작업자. 같은 게시글의 작업을 처리 중인 경우 해당 게시글의 대기 목록에 넣음"""
+        task = asyncio.current_task()
         try:
             while self.is_running:
-                if self.queue.empty():
-                    # self.logger.debug("Consumer task waiting for item")
-                    await asyncio.sleep(1)
+                item, enqueued_at = await self.queue.get_timed()
+                latency = time.monotonic() - enqueued_at
+                _dispatch_latency_histogram.record(latency, {"bot": self.name, "action": item[0]})
+                self.logger.debug(
+                    "Consumer task got item: <%s.%s> %s (%.3fs queued)",
+                    item[1]["crawler_name"],
+                    item[0],
+                    item[1]["title"],
+                    latency,
+                )
+                key = job_key(item)
+                if key in self._held:
+                    self._park(key, item)
                     continue
-                item = await self.queue.get()
-                self.logger.debug("Consumer task got item: <%s.%s> %s", item[1]['crawler_name'], item[0], item[1]['title'])
+                self._held[key] = deque()
+                self.dispatching += 1
+                self._busy_workers.add(task)  # type: ignore
                 try:
-                    match item[0]:
-                        case "send":
-                            await self._send(item[1])
-                        case "edit":
-                            await self._edit(item[1])
-                        case "delete":
-                            await self._delete(item[1])
-                except Exception as e:
-                    self.logger.exception(e)
-                item = None
+                    await self._dispatch_key(key, item)
+                finally:
+                    self.dispatching -= 1
+                    self._busy_workers.discard(task)  # type: ignore
         except asyncio.CancelledError:
-            # 작업이 취소됐다면 남아있는 아이템을 큐에 다시 넣어준 다음 consumer task 종료.
-            self.logger.info("Consumer task cancelled")
-            if item is not None:
-                await self.queue.put(item)
+            # 큐를 기다리던 중에 취소된 경우는 꺼낸 아이템이 없으므로 그대로 종료.
             return
 
+    async def _dispatch_key(self, key: tuple[str, int], item: Job, reserved: bool = False):
+        """게시글 하나의 작업을 처리하고, 같은 게시글의 대기 중인 작업이 있으면 이어서 처리
+
+        요청 제한으로 작업을 미뤄야 하는 경우 대기 힙에 넣고 반환하며, 해당 게시글의 대기 목록은 미룬 작업이 처리될 때까지 유지됨.
+
+        Args:
+            key (tuple[str, int]): (크롤러 이름, 게시글 번호)
+            item (Job): 처리할 작업
+            reserved (bool, optional): 요청 제한 토큰을 이미 예약했는지 여부
+        """
+        current: Job | None = item
+        try:
+            while current is not None:
+                if current[0] == "edit" and self._is_unchanged(current[1]):
+                    # 보이는 내용이 바뀌지 않은 수정은 요청하지 않고 (요청 제한 토큰도 쓰지 않고) 완료 처리
+                    self.logger.debug(
+                        "Skip edit, message not modified: <%s> %s", current[1]["crawler_name"], current[1]["title"]
+                    )
+                    _edit_skipped_counter.add(1, {"bot": self.name})
+                else:
+                    if not reserved and (wait := self._reserve(*current)) > 0:
+                        self._schedule(wait, key, current, reserved=True)
+                        return
+                    try:
+                        match current[0]:
+                            case "send":
+                                await self._send(current[1])
+                            case "edit":
+                                await self._edit(current[1])
+                            case "delete":
+                                await self._delete(current[1])
+                    except RetryLater as e:
+                        self._schedule(e.delay, key, current, reserved=False)
+                        return
+                    except Exception as e:
+                        self.logger.exception(e)
+                reserved = False
+                self.queue.task_done()
+                waiting = self._held[key]
+                current = waiting.popleft() if waiting else None
+            del self._held[key]
+        except asyncio.CancelledError:
+            # 처리 중이던 아이템과 같은 게시글의 대기 중인 작업을 순서대로 큐에 다시 넣음
+            if current is not None:
+                self._release(key, current)
+            raise
+
+    def _park(self, key: tuple[str, int], item: Job):
+        """처리 중이거나 미뤄진 작업이 있는 게시글의 작업을 대기 목록에 넣음. 대기 중인 작업이 있으면 합침"""
+        waiting = self._held[key]
+        if not waiting:
+            waiting.append(item)
+            return
+        if (merged := merge_jobs(waiting[-1], item, self._delivered(key))) is None:
+            waiting.pop()
+            self.queue.task_done()
+            _coalesce_counter.add(2, {"result": "cancelled"})
+        else:
+            waiting[-1] = merged
+            _coalesce_counter.add(1, {"result": "merged"})
+        self.queue.task_done()
+
+    def _delivered(self, key: tuple[str, int]) -> bool:
+        """게시글의 메시지를 이미 보낸 전송 대상이 있는지 여부 (메시지 객체가 저장되어 있는지로 판단)
+
+        Args:
+            key: 게시글 키 (크롤러 이름, 게시글 번호)
+        """
+        return bool((msg_data := self.cache.get(key[0])) is not None and msg_data.get(key[1]))
+
+    def _is_unchanged(self, data: BaseArticle) -> bool:
+        """게시글을 수정해도 메시지에 보이는 내용이 마지막으로 보낸 내용과 같은지 여부. 렌더링 결과를 비교할 수 있는 봇에서 오버라이드
+
+        Args:
+            data: 게시글 객체
+        """
+        return False
+
+    def _reserve(self, action: Literal["send", "edit", "delete"], data: BaseArticle) -> float:
+        """작업에 필요한 요청 제한 토큰을 예약하고 기다려야 하는 시간(초)을 반환. 요청 제한이 있는 봇에서 오버라이드
+
+        Args:
+            action: 작업 종류
+            data: 게시글 객체
+        """
+        return 0.0
+
+    def _schedule(self, delay: float, key: tuple[str, int], item: Job, reserved: bool):
+        """작업을 delay초 뒤에 처리하도록 대기 힙에 넣음"""
+        _dispatch_delay_histogram.record(delay, {"bot": self.name, "reason": "reserved" if reserved else "retry"})
+        heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._delayed_seq), key, item, reserved))
+        self._delayed_wakeup.set()
+
+    async def _delay_loop(self):
+        """대기 힙에서 처리할 시각이 된 작업을 꺼내 처리"""
+        while True:
+            self._delayed_wakeup.clear()
+            if not self._delayed:
+                await self._delayed_wakeup.wait()
+                continue
+            if (wait := self._delayed[0][0] - time.monotonic()) > 0:
+                try:
+                    await asyncio.wait_for(self._delayed_wakeup.wait(), wait)
+                except TimeoutError:
+                    pass
+                continue
+            _, _, key, item, reserved = heapq.heappop(self._delayed)
+            task = asyncio.create_task(self._dispatch_key(key, item, reserved))
+            self._resumed_tasks.add(task)
+            task.add_done_callback(self._resumed_tasks.discard)
+
+    def _release(self, key: tuple[str, int], item: Job):
+        """처리하지 못한 작업과 같은 게시글의 대기 중인 작업을 하나로 합쳐서 큐에 다시 넣음"""
+        jobs = [item, *self._held.pop(key, ())]
+        job: Job | None = None
+        for j in jobs:
+            job = j if job is None else merge_jobs(job, j, self._delivered(key))
+        if job is not None:
+            self.queue.requeue(job)
+        for _ in jobs:
+            self.queue.task_done()
+
+    def _requeue_delayed(self):
+        """대기 힙에 남아있는 작업을 처리할 시각 순서대로 큐에 다시 넣음"""
+        while self._delayed:
+            _, _, key, item, _ = heapq.heappop(self._delayed)
+            self._release(key, item)
+
     async def run_consumer(self):
         """Consumer 작업 생성해 시작"""
         self.is_running = True
         self.consumer_task = asyncio.create_task(self.consumer())
 
     async def stop_consumer(self):
-        """Consumer 작업 정지"""
+        """Consumer 작업 정지. 처리 중인 아이템이 있으면 최대 5초 동안 완료를 기다림"""
         self.is_running = False
         if self.consumer_task is None:
             return
         if self.consumer_task.done():
             return
+        # 큐를 기다리는 작업자는 바로 취소 (꺼낸 아이템이 없으므로 큐는 그대로 유지됨)
+        for task in self._worker_tasks:
+            if task not in self._busy_workers:
+                task.cancel()
         try:
             await asyncio.wait_for(self.consumer_task, timeout=5)
         except asyncio.TimeoutError:
@@ -278,10 +699,11 @@ class DummyBot(BaseBot):
 
     Args:
         name (str): 봇 이름
+        workers (int, optional): 동시에 처리할 메시지 작업 수
     """
 
-    def __init__(self, name: str) -> None:
-        super().__init__(name)
+    def __init__(self, name: str, **kwargs) -> None:
+        super().__init__(name, **kwargs)
 
     async def _send(self, data: BaseArticle) -> None:
         self.logger.debug("Send message: %s.%s", data['crawler_name'], data['article_id'])
@@ -297,110 +719,378 @@ class DummyBot(BaseBot):
     async def from_dict(self, data: SerializedBotData) -> None:
         self.cache = {}
         for c_name, b_data in data["cache"].items():
-            self.cache[c_name] = {}
+            self.cache[c_name] = SortedIdDict()
             for a_id, msg in b_data.items():
                 self.cache[c_name][int(a_id)] = msg
         for job in data["queue"]:
             await self.queue.put(job)
 
 
-class TelegramBot(BaseBot[telegram.Message]):
-    def __init__(self, name: str, token: str, target: str):
-        super().__init__(name, token=token, target=target)
+def make_telegram_message(d: BaseArticle) -> dict[str, Any]:
+    """텔레그램 메시지 기본 템플릿. 게시글 제목, 가격/배송비, 게시글 링크 버튼으로 메시지를 만듦 (종료된 게시글은 취소선)"""
+    if d["category"]:
+        md = escape_markdown("[{category}] {title}".format(**d))
+    else:
+        md = escape_markdown("{title}".format(**d))
+    if d["extra"].get("price") and d["extra"].get("delivery"):
+        delivery_direct = d["extra"].get("direct_delivery")
+        if delivery_direct is None:
+            md += escape_markdown("\n{price} / {delivery}".format(**d["extra"]))
+        elif delivery_direct:
+            md += escape_markdown("\n{price} / {delivery} (직배 가능)".format(**d["extra"]))
+        else:
+            md += escape_markdown("\n{price} / {delivery} (직배 불가능)".format(**d["extra"]))
+    if d["is_end"]:
+        md = f"~{md}~"
+    btn = [[telegram.InlineKeyboardButton("자세히 보기 ({site_name} {board_name})".format(**d), d["url"])]]
+    result = {
+        "text": md,
+        "reply_markup": telegram.InlineKeyboardMarkup(btn),
+        "parse_mode": telegram.constants.ParseMode.MARKDOWN_V2,
+    }
+    return result
+
+
+class TelegramRateLimits(TypedDict, total=False):
+    """텔레그램 봇 API 요청 제한 설정 (0인 경우 해당 제한 없음)
+
+    global_rps: 봇 전체 초당 최대 메시지 수
+    chat_rps: 채팅방별 초당 최대 메시지 수
+    group_per_minute: 그룹/채널별 분당 최대 메시지 수
+    """
+
+    global_rps: float
+    chat_rps: float
+    group_per_minute: float
+
+
+# 텔레그램 봇 API 문서의 기본 제한
+DEFAULT_TELEGRAM_RATE_LIMITS: TelegramRateLimits = {
+    "global_rps": 30,
+    "chat_rps": 1,
+    "group_per_minute": 20,
+}
+
+
+# 전송 대상별 메시지 핸들 {전송 대상: 메시지 핸들}
+TargetHandles = dict[str, MessageHandle]
+
+
+class TelegramBot(BaseBot[TargetHandles]):
+    """텔레그램 봇
+
+    하나의 봇으로 여러 전송 대상(채팅방/채널)에 같은 메시지를 보냄. 게시글은 한 번만 렌더링하고, 작업 큐와 작업자,
+    HTTP 연결은 모든 전송 대상이 공유함.
+    보낸 메시지는 telegram.Message 대신 전송 대상별 (채팅방 ID, 메시지 ID) 핸들로 저장하고, 수정/삭제는 ID로 요청함.
+    메시지 작업은 봇 전체, 채팅방별, 그룹/채널별 토큰 버킷으로 전송 대상마다 따로 속도를 제한하며, 요청 제한에 걸리거나
+    RetryAfter 응답을 받은 전송 대상만 대기 힙에서 다시 시도함. (이미 처리한 전송 대상은 다시 요청하지 않음)
+
+    Args:
+        name (str): 봇 이름
+        token (str): 텔레그램 봇 토큰
+        target (str | list[str]): 메시지 전송 대상 (채팅 ID 또는 채널 이름), 또는 전송 대상 목록
+        workers (int, optional): 동시에 처리할 메시지 작업 수
+        rate_limits (TelegramRateLimits, optional): 요청 제한 설정
+    """
+
+    default_workers = 4
+
+    def __init__(self, name: str, token: str, target: str | list[str], **kwargs):
+        super().__init__(name, token=token, target=target, **kwargs)
         self.bot = telegram.Bot(token)
-        self.target = target
+        # YAML 설정의 채팅 ID는 숫자일 수 있으므로 문자열로 통일 (덤프 파일의 키와 같은 형식)
+        self.targets: list[str] = [str(t) for t in (target if isinstance(target, list) else [target])]
+        self.rate_limits: TelegramRateLimits = {**DEFAULT_TELEGRAM_RATE_LIMITS, **kwargs.get("rate_limits", {})}
+        global_rps = self.rate_limits["global_rps"]
+        self.global_bucket = TokenBucket(global_rps, global_rps) if global_rps > 0 else None
+        self.chat_buckets: dict[str, list[TokenBucket]] = {}
+        self.template: MessageTemplate = make_telegram_message
+        # {crawler_name: {article_id: {전송 대상: 마지막으로 보낸 메시지 내용의 해시}}}
+        self.digests: dict[str, SortedIdDict[dict[str, bytes]]] = {}
+        # {(crawler_name, article_id, 전송 대상): 요청 제한 토큰을 예약한 요청 가능 시각}
+        self._booked: dict[tuple[str, int, str], float] = {}
+        # {(crawler_name, article_id): 처리 중인 작업에서 실패해 다시 시도하지 않을 전송 대상}
+        self._failed_targets: dict[tuple[str, int], set[str]] = {}
+
+    def _render(self, data: BaseArticle) -> RenderedMessage:
+        return render_cache.render(self.template, data)
+
+    def _handles(self, data: BaseArticle) -> TargetHandles:
+        if (msg_data := self.cache.get(data["crawler_name"])) is None:
+            return {}
+        return msg_data.get(data["article_id"]) or {}
+
+    def _remember(self, data: BaseArticle, target: str, rendered: RenderedMessage):
+        """전송 대상에 보낸 메시지 내용의 해시 저장"""
+        if (digests := self.digests.get(data["crawler_name"])) is None:
+            digests = self.digests[data["crawler_name"]] = SortedIdDict()
+        digests.setdefault(data["article_id"], {})[target] = rendered["digest"]
+
+    def _digests(self, data: BaseArticle) -> dict[str, bytes]:
+        if (digests := self.digests.get(data["crawler_name"])) is None:
+            return {}
+        return digests.get(data["article_id"]) or {}
+
+    def _is_unchanged(self, data: BaseArticle) -> bool:
+        if not (handles := self._handles(data)):
+            return False
+        digest = self._render(data)["digest"]
+        digests = self._digests(data)
+        return all(digests.get(target) == digest for target in handles)
+
+    def _pending_targets(self, action: Literal["send", "edit", "delete"], data: BaseArticle) -> list[str]:
+        """작업을 아직 처리하지 않은 전송 대상 목록
+
+        전송은 메시지 핸들이 없는 전송 대상, 수정은 보낸 내용이 다른 전송 대상, 삭제는 메시지 핸들이 남아있는 전송 대상.
+        처리 중인 작업에서 실패한 전송 대상은 제외.
+        """
+        failed = self._failed_targets.get((data["crawler_name"], data["article_id"]), ())
+        handles = self._handles(data)
+        match action:
+            case "send":
+                targets = [t for t in self.targets if t not in handles]
+            case "edit":
+                digest = self._render(data)["digest"]
+                digests = self._digests(data)
+                targets = [t for t in handles if digests.get(t) != digest]
+            case "delete":
+                targets = list(handles)
+        return [t for t in targets if t not in failed]
 
-    async def _send(self, data: BaseArticle, retry: bool = False) -> telegram.Message | None:
-        kwargs = self._make_message(data)
-        msg = None
+    async def remove_msg_obj(self, crawler_name: str, article_id: int):
+        await super().remove_msg_obj(crawler_name, article_id)
+        if crawler_name in self.digests:
+            self.digests[crawler_name].pop(article_id, None)
 
-        with logfire.span("telegram_send_message", article_title=data.get("title", ""), target=self.target):
-            try:
-                msg = await self.bot.send_message(chat_id=self.target, **kwargs)
-                self.logger.debug("Message send to %s %s", self.target, msg.message_id)
+    async def remove_expired_msg_obj(self, crawler_name: str, id_min: int):
+        await super().remove_expired_msg_obj(crawler_name, id_min)
+        if crawler_name in self.digests:
+            self.digests[crawler_name].remove_below(id_min)
+        for key in [key for key in self._booked if key[0] == crawler_name and key[1] < id_min]:
+            del self._booked[key]
+
+    def _release(self, key: tuple[str, int], item: Job):
+        super()._release(key, item)
+        # 큐에 돌려놓은 작업은 다시 처리할 때 (덤프 파일에서 불러온 경우 포함) 모든 전송 대상에 다시 시도
+        self._failed_targets.pop(key, None)
+
+    def _chat_buckets(self, chat_id: str) -> list[TokenBucket]:
+        """채팅방별 토큰 버킷 목록. 그룹/채널(음수 ID 또는 @채널 이름)은 분당 제한 버킷을 함께 사용"""
+        if chat_id not in self.chat_buckets:
+            buckets = []
+            if self.rate_limits["chat_rps"] > 0:
+                buckets.append(TokenBucket(self.rate_limits["chat_rps"]))
+            if str(chat_id).startswith(("-", "@")) and self.rate_limits["group_per_minute"] > 0:
+                buckets.append(TokenBucket(self.rate_limits["group_per_minute"] / 60))
+            self.chat_buckets[chat_id] = buckets
+        return self.chat_buckets[chat_id]
+
+    def _book(self, action: Literal["send", "edit", "delete"], data: BaseArticle, target: str, now: float) -> float:
+        """전송 대상에 요청할 토큰을 예약하고 요청 가능 시각 반환. 이미 예약한 경우 예약한 시각 반환"""
+        key = (data["crawler_name"], data["article_id"], target)
+        if (due := self._booked.get(key)) is None:
+            buckets = [self.global_bucket] if self.global_bucket is not None else []
+            # 메시지 삭제는 채팅방별 메시지 수 제한에 포함되지 않음
+            if action != "delete":
+                buckets.extend(self._chat_buckets(target))
+            due = self._booked[key] = now + max((bucket.reserve(now) for bucket in buckets), default=0.0)
+        return due
+
+    def _reserve(self, action: Literal["send", "edit", "delete"], data: BaseArticle) -> float:
+        # 처리할 전송 대상마다 토큰을 예약하고, 가장 먼저 요청할 수 있는 전송 대상까지 기다릴 시간 반환
+        now = time.monotonic()
+        waits = [self._book(action, data, target, now) - now for target in self._pending_targets(action, data)]
+        return max(0.0, min(waits, default=0.0))
+
+    def _retry_later(self, e: telegram.error.RetryAfter, target: str) -> RetryLater:
+        """RetryAfter 응답을 받은 경우 전송 대상의 채팅방 버킷을 해당 시간만큼 멈추고, 작업을 다시 시도할 RetryLater 예외 반환"""
+        retry_after = e.retry_after
+        delay = retry_after.total_seconds() if isinstance(retry_after, datetime.timedelta) else float(retry_after)
+        for bucket in self._chat_buckets(target):
+            bucket.penalize(delay)
+        logfire.warn("Rate limited, retrying", retry_after=delay, target=target)
+        return RetryLater(delay)
+
+    async def _fan_out(
+        self,
+        action: Literal["send", "edit", "delete"],
+        data: BaseArticle,
+        request: Callable[[str], Awaitable[bool]],
+    ):
+        """요청 가능 시각이 된 전송 대상에 동시에 요청하고, 남은 전송 대상이 있으면 RetryLater 발생
+
+        Args:
+            action: 작업 종류
+            data: 게시글 객체
+            request: 전송 대상 하나에 요청하는 코루틴 함수. 실패해서 다시 시도하지 않을 경우 False 반환
+        """
+        key = (data["crawler_name"], data["article_id"])
+        now = time.monotonic()
+        ready: list[str] = []
+        waits: list[float] = []
+        pending = self._pending_targets(action, data)
+        # 예약한 뒤 이미 처리된 전송 대상의 예약은 지움. 남겨두면 같은 게시글의 다음 작업이 예약 시각을 재사용해
+        # 토큰 버킷을 거치지 않고 요청하게 됨
+        for target in {*self.targets, *self._handles(data)}.difference(pending):
+            self._booked.pop((*key, target), None)
+        for target in pending:
+            if (due := self._book(action, data, target, now)) <= now:
+                del self._booked[(*key, target)]
+                ready.append(target)
+            else:
+                waits.append(due - now)
+        results = await asyncio.gather(*(request(target) for target in ready), return_exceptions=True)
+        for target, result in zip(ready, results):
+            if isinstance(result, RetryLater):
+                waits.append(result.delay)
+            elif result is not True:
+                if isinstance(result, BaseException):
+                    self.logger.exception(result)
+                self._failed_targets.setdefault(key, set()).add(target)
+        if waits:
+            raise RetryLater(min(waits))
+        self._failed_targets.pop(key, None)
+
+    async def _send(self, data: BaseArticle) -> TargetHandles | None:
+        rendered = self._render(data)
+
+        async def send_to(target: str) -> bool:
+            with logfire.span("telegram_send_message", article_title=data.get("title", ""), target=target):
+                try:
+                    msg = await self.bot.send_message(chat_id=target, **rendered["kwargs"])
+                except telegram.error.RetryAfter as e:
+                    self.logger.warning(
+                        "Retry send message after %s secs: (%s): %s (%s) -> %s",
+                        e.retry_after,
+                        e,
+                        data["title"],
+                        data["url"],
+                        target,
+                    )
+                    # 작업자를 멈추지 않고 대기 힙에서 다시 시도
+                    raise self._retry_later(e, target) from e
+                except telegram.error.TimedOut as e:
+                    self.logger.error("Send message timeout (%s): %s (%s) -> %s", e, data["title"], data["url"], target)
+                    logfire.error("Send message timeout", error=str(e), target=target)
+                    return False
+                except telegram.error.TelegramError as e:
+                    self.logger.error(
+                        "Send message failed: %s (%s): %s (%s) -> %s",
+                        e.__class__.__name__,
+                        e,
+                        data["title"],
+                        data["url"],
+                        target,
+                    )
+                    logfire.error("Telegram error", error=str(e), error_type=e.__class__.__name__, target=target)
+                    return False
+                self.logger.debug("Message send to %s %s", target, msg.message_id)
                 logfire.info(
                     "Message sent successfully",
-                    chat_id=self.target,
+                    chat_id=target,
                     message_id=msg.message_id,
                     article_title=data.get("title", ""),
                 )
+                handles = self._handles(data)
+                handles[target] = MessageHandle(msg.chat_id, msg.message_id)
+                await self.set_msg_obj(data, handles)
+                self._remember(data, target, rendered)
+                return True
+
+        await self._fan_out("send", data, send_to)
+        return self._handles(data) or None
+
+    async def _edit(self, data: BaseArticle):
+        if not self._handles(data):
+            self.logger.warning("Message not found: %s (%s)", data["title"], data["url"])
+            return
+        rendered = self._render(data)
+
+        async def edit_to(target: str) -> bool:
+            msg = self._handles(data)[target]
+            try:
+                await self.bot.edit_message_text(chat_id=msg.chat_id, message_id=msg.message_id, **rendered["kwargs"])
             except telegram.error.RetryAfter as e:
                 self.logger.warning(
-                    "Retry send message after %s secs: (%s): %s (%s) -> %s",
-                    e.retry_after, e, data["title"], data["url"], self.target
+                    "Retry edit message after %s secs: (%s): %s (%s) <- %s",
+                    e.retry_after,
+                    e,
+                    data["title"],
+                    data["url"],
+                    msg.message_id,
                 )
-                logfire.warn("Rate limited, retrying", retry_after=e.retry_after, target=self.target)
-                await asyncio.sleep(e.retry_after)
-                msg = await self._send(data, retry=False)
+                raise self._retry_later(e, target) from e
             except telegram.error.TimedOut as e:
                 self.logger.error(
-                    "Send message timeout (%s): %s (%s) -> %s",
-                    e, data["title"], data["url"], self.target
+                    "Edit message timeout (%s): %s (%s) <- %s", e, data["title"], data["url"], msg.message_id
                 )
-                logfire.error("Send message timeout", error=str(e), target=self.target)
+                return False
+            except telegram.error.BadRequest as e:
+                if "not modified" not in e.message.lower():
+                    self.logger.error(
+                        "Edit message failed (%s): %s (%s) <- %s", e, data["title"], data["url"], msg.message_id
+                    )
+                    return False
+                # 재시작 등으로 해시가 없어 같은 내용으로 수정을 요청한 경우
+                self.logger.debug("Message not modified: %s (%s) <- %s", data["title"], data["url"], msg.message_id)
             except telegram.error.TelegramError as e:
                 self.logger.error(
-                    "Send message failed: %s (%s): %s (%s) -> %s",
-                    e.__class__.__name__, e, data["title"], data["url"], self.target
+                    "Edit message failed: %s (%s): %s (%s) <- %s",
+                    e.__class__.__name__,
+                    e,
+                    data["title"],
+                    data["url"],
+                    msg.message_id,
                 )
-                logfire.error("Telegram error", error=str(e), error_type=e.__class__.__name__, target=self.target)
-            finally:
-                if msg is None and retry:
-                    msg = await self._send(data, retry=False)
-                if msg is not None:
-                    await self.set_msg_obj(data, msg)
-                return msg
-
-    async def _edit(self, data: BaseArticle, retry: bool = False):
-        msg = await self.get_msg_obj(data)
-        if msg is None:
-            self.logger.warning("Message not found: %s (%s)", data["title"], data["url"])
-            return
-        try:
-            kwargs = self._make_message(data)
-            await msg.edit_text(**kwargs)
-        except telegram.error.RetryAfter as e:
-            self.logger.warning(
-                "Retry edit message after %s secs: (%s): %s (%s) <- %s",
-                e.retry_after, e, data["title"], data["url"], msg.message_id
-            )
-            await asyncio.sleep(e.retry_after)
-            await self._edit(data, retry=False)
-        except telegram.error.TimedOut as e:
-            self.logger.error(
-                "Edit message timeout (%s): %s (%s) <- %s",
-                e, data["title"], data["url"], msg.message_id
-            )
-        except telegram.error.BadRequest as e:
-            self.logger.error(
-                "Edit message failed (%s): %s (%s) <- %s",
-                e, data["title"], data["url"], msg.message_id
-            )
-        except telegram.error.TelegramError as e:
-            self.logger.error(
-                "Edit message failed: %s (%s): %s (%s) <- %s",
-                e.__class__.__name__, e, data["title"], data["url"], msg.message_id
-            )
+                return False
+            self._remember(data, target, rendered)
+            return True
+
+        await self._fan_out("edit", data, edit_to)
 
     async def _delete(self, data: BaseArticle):
-        """메시지 객체를 찾은 다음, 텔레그램 채널의 메시지를 삭제"""
-        msg = await self.get_msg_obj(data)
-        if msg is None:
+        """메시지 핸들을 찾은 다음, 전송 대상마다 메시지를 삭제"""
+        if not self._handles(data):
             self.logger.warning("Message not found: %s (%s)", data["title"], data["url"])
             return
 
-        try:
-            await msg.delete()
-        except telegram.error.BadRequest as e:
-            self.logger.error(
-                "Delete message failed (%s): %s (%s) <- %s",
-                e, data["title"], data["url"], msg.message_id
-            )
-        except telegram.error.TelegramError as e:
-            self.logger.error(
-                "Delete message failed: %s (%s): %s (%s) <- %s",
-                e.__class__.__name__, e, data["title"], data["url"], msg.message_id
-            )
+        async def delete_to(target: str) -> bool:
+            msg = self._handles(data)[target]
+            try:
+                await self.bot.delete_message(chat_id=msg.chat_id, message_id=msg.message_id)
+            except telegram.error.RetryAfter as e:
+                self.logger.warning(
+                    "Retry delete message after %s secs: (%s): %s (%s) <- %s",
+                    e.retry_after,
+                    e,
+                    data["title"],
+                    data["url"],
+                    msg.message_id,
+                )
+                raise self._retry_later(e, target) from e
+            except telegram.error.BadRequest as e:
+                self.logger.error(
+                    "Delete message failed (%s): %s (%s) <- %s", e, data["title"], data["url"], msg.message_id
+                )
+                return False
+            except telegram.error.TelegramError as e:
+                self.logger.error(
+                    "Delete message failed: %s (%s): %s (%s) <- %s",
+                    e.__class__.__name__,
+                    e,
+                    data["title"],
+                    data["url"],
+                    msg.message_id,
+                )
+                return False
+            # 삭제한 전송 대상의 핸들은 지워서 다시 삭제하지 않도록 함
+            handles = self._handles(data)
+            handles.pop(target, None)
+            if not handles:
+                await self.remove_msg_obj(data["crawler_name"], data["article_id"])
+            return True
+
+        await self._fan_out("delete", data, delete_to)
 
     async def from_dict(self, data: SerializedBotData) -> None:
         """메시지 목록 및 작업 큐 역직렬화
@@ -411,36 +1101,29 @@ class TelegramBot(BaseBot[telegram.Message]):
         # cache
         for crawler_name, msg_data in data["cache"].items():
             if crawler_name not in self.cache:
-                self.cache[crawler_name] = {}
+                self.cache[crawler_name] = SortedIdDict()
             for msg_id, msg in msg_data.items():
-                msg_obj = telegram.Message.de_json(msg, self.bot)
-                if msg_obj is None:
+                handles = self._load_handles(msg)
+                if not handles:
                     self.logger.warning("Failed to deserialize message object: %s/%s", crawler_name, msg_id)
                     continue
-                self.cache[crawler_name][int(msg_id)] = msg_obj
+                self.cache[crawler_name][int(msg_id)] = handles
         # queue
         for job in data["queue"]:
             await self.queue.put(job)
 
-    def _make_message(self, d: BaseArticle) -> dict:
-        if d["category"]:
-            md = escape_markdown("[{category}] {title}".format(**d))
-        else:
-            md = escape_markdown("{title}".format(**d))
-        if d["extra"].get("price") and d["extra"].get("delivery"):
-            delivery_direct = d["extra"].get("direct_delivery")
-            if delivery_direct is None:
-                md += escape_markdown("\n{price} / {delivery}".format(**d["extra"]))
-            elif delivery_direct:
-                md += escape_markdown("\n{price} / {delivery} (직배 가능)".format(**d["extra"]))
-            else:
-                md += escape_markdown("\n{price} / {delivery} (직배 불가능)".format(**d["extra"]))
-        if d["is_end"]:
-            md = f"~{md}~"
-        btn = [[telegram.InlineKeyboardButton("자세히 보기 ({site_name} {board_name})".format(**d), d["url"])]]
-        result = {
-            "text": md,
-            "reply_markup": telegram.InlineKeyboardMarkup(btn),
-            "parse_mode": telegram.constants.ParseMode.MARKDOWN_V2,
-        }
-        return result
+    def _load_handles(self, msg: Any) -> TargetHandles:
+        """덤프 파일에 저장된 메시지를 전송 대상별 핸들로 변환
+
+        {전송 대상: [chat_id, message_id]} 형식 외에 이전 버전의 단일 핸들과 telegram.Message 딕셔너리는 첫 번째 전송 대상의
+        메시지로 변환함.
+        """
+        if (handle := MessageHandle.from_dump(msg)) is not None:
+            return {self.targets[0]: handle}
+        if not isinstance(msg, dict):
+            return {}
+        handles: TargetHandles = {}
+        for target, value in msg.items():
+            if (handle := MessageHandle.from_dump(value)) is not None:
+                handles[str(target)] = handle
+        return handles
@@ -1,19 +1,60 @@
 from .arcalive import ArcaLiveCrawler
-from .base_crawler import ArticleCollection, BaseArticle, BaseCrawler
+from .article import ArticleExtra, ArticleRecord
+from .base_crawler import (
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    ArticleCache,
+    ArticleCollection,
+    BaseArticle,
+    BaseCrawler,
+)
+from .changes import ArticleChange, detect_changes
 from .clien import ClienCrawler
+from .connection import CharsetCache, ConnectionStats, HttpConfig, create_session, host_charsets, session_config
 from .coolenjoy import CoolenjoyCrawler, CoolenjoyRSSCrawler
 from .damoang import DamoangCrawler
 from .dummy import DummyCrawler
+from .executor import ParseExecutor, ParserConfig
+from .fetch_cache import FetchCache, fetch_cache
 from .fmkorea import FmkoreaCrawler
+from .governor import HostGovernor, PolitenessConfig, host_governor
 from .ppomppu import PpomppuCrawler, PpomppuRSSCrawler
 from .quasarzone import QuasarzoneCrawler, QuasarzoneMobileCrawler
+from .retry import BreakerConfig, RetryConfig, RetryPolicy, circuit_breakers
+from .rss import BaseRSSCrawler, FeedConfig
 from .ruliweb import RuliwebCrawler
 from .zod import ZodCrawler
 
 __all__ = [
     "BaseCrawler",
     "BaseArticle",
+    "BaseRSSCrawler",
+    "FeedConfig",
     "ArticleCollection",
+    "ArticleCache",
+    "ArticleRecord",
+    "ArticleExtra",
+    "ArticleChange",
+    "detect_changes",
+    "PARSER_BACKENDS",
+    "DEFAULT_PARSER_BACKEND",
+    "ParseExecutor",
+    "ParserConfig",
+    "HttpConfig",
+    "ConnectionStats",
+    "create_session",
+    "session_config",
+    "CharsetCache",
+    "host_charsets",
+    "RetryConfig",
+    "RetryPolicy",
+    "BreakerConfig",
+    "circuit_breakers",
+    "PolitenessConfig",
+    "HostGovernor",
+    "host_governor",
+    "FetchCache",
+    "fetch_cache",
     "DummyCrawler",
     "ClienCrawler",
     "FmkoreaCrawler",
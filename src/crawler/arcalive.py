@@ -3,14 +3,12 @@
 # API 문서화되면 전환 예정
 import re
 
-from bs4 import BeautifulSoup
-
 from .base_crawler import BaseArticle, BaseCrawler
 
 
 class ArcaLiveCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
 
         # 채널 이름
         if (_board_name := soup.select_one(".board-title .title")) is None or (
@@ -49,6 +47,16 @@ class ArcaLiveCrawler(BaseCrawler):
                 continue
             if (_store_name_tag := row.select_one(".deal-store")) is None:
                 continue
+            if (_price_tag := row.select_one(".deal-price")) is None:
+                self.logger.warning("Cannot get price tag")
+                continue
+            is_end = True if (row.select_one(".deal-close") is not None) else False
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (
+                article := self.known_article(_id, title=title, is_end=is_end, extra={"price": _price_tag.text.strip()})
+            ) is not None:
+                data[_id] = article
+                continue
             if (_writer_tag := row.select_one(".user-info span:first-child")) is None:
                 self.logger.warning("Cannot get writer tag")
                 continue
@@ -58,13 +66,9 @@ class ArcaLiveCrawler(BaseCrawler):
             if (_view_tag := row.select_one(".col-view")) is None:
                 self.logger.warning("Cannot get view count tag")
                 continue
-            if (_price_tag := row.select_one(".deal-price")) is None:
-                self.logger.warning("Cannot get price tag")
-                continue
             if (_delivery_tag := row.select_one(".deal-delivery")) is None:
                 self.logger.warning("Cannot get delivery price tag")
                 continue
-            is_end = True if (row.select_one(".deal-close") is not None) else False
 
             data[_id] = {
                 "article_id": _id,
@@ -0,0 +1,190 @@
+import sys
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any, Literal
+
+# 게시글마다 같은 값이 반복되므로 intern 해서 하나의 문자열 객체를 공유하는 항목
+INTERNED_FIELDS = frozenset(("category", "site_name", "board_name", "crawler_name"))
+
+ChangeField = Literal["status", "title", "price"]
+
+# 메시지 수정이 필요한 변경 항목과 게시글에서 해당 값을 가져오는 함수
+WATCHED_FIELDS: dict[ChangeField, Callable[[Mapping[str, Any]], Any]] = {
+    "status": lambda article: article["is_end"],
+    "title": lambda article: article["title"],
+    "price": lambda article: (article.get("extra") or {}).get("price"),
+}
+# 값이 바뀌면 지문을 다시 계산해야 하는 게시글 항목
+_WATCHED_KEYS = frozenset(("is_end", "title", "extra"))
+
+
+def fingerprint(article: Mapping[str, Any]) -> int:
+    """변경 확인 항목(WATCHED_FIELDS) 값으로 게시글 지문 계산. 같은 프로세스 안에서만 비교 가능 (저장하지 않음)"""
+    return hash(tuple(get(article) for get in WATCHED_FIELDS.values()))
+
+
+class ArticleExtra(MutableMapping[str, Any]):
+    """게시글 추가 데이터(extra). 자주 쓰이는 항목은 슬롯에 저장하고 나머지 항목만 딕셔너리에 저장
+
+    Args:
+        data (Mapping[str, Any], optional): 추가 데이터
+    """
+
+    __slots__ = ("price", "delivery", "recommend", "view", "_other")
+    _fields = ("price", "delivery", "recommend", "view")
+
+    def __init__(self, data: Mapping[str, Any] = {}) -> None:
+        self._other: dict[str, Any] | None = None
+        for key, value in data.items():
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._other is None:
+            raise KeyError(key)
+        return self._other[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._fields:
+            # 배송비 문구는 대부분 "무료" 등 몇 가지 값이 반복됨
+            setattr(self, key, sys.intern(value) if key == "delivery" and type(value) is str else value)
+        else:
+            if self._other is None:
+                self._other = {}
+            self._other[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._fields:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._other is None:
+            raise KeyError(key)
+        del self._other[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key
+        if self._other:
+            yield from self._other
+
+    def __len__(self) -> int:
+        return sum(hasattr(self, key) for key in self._fields) + len(self._other or ())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class ArticleRecord(MutableMapping[str, Any]):
+    """게시글 캐시에 저장하는 게시글 데이터. 딕셔너리 대신 슬롯에 값을 저장해 게시글당 메모리 사용량을 줄임
+
+    BaseArticle 딕셔너리와 같은 방식(article["title"], article.get("extra"), dict(article) 등)으로 사용할 수 있음.
+    변경 확인용 지문(fingerprint)은 처음 사용할 때 계산해서 저장하며, 변경 확인 항목을 다시 설정하면 새로 계산함.
+    (extra 의 값을 직접 수정한 경우는 반영되지 않으므로 extra 전체를 다시 설정할 것)
+
+    Args:
+        data (Mapping[str, Any]): 게시글 데이터 (BaseArticle)
+    """
+
+    _fields = (
+        "article_id",
+        "title",
+        "category",
+        "site_name",
+        "board_name",
+        "writer_name",
+        "crawler_name",
+        "url",
+        "is_end",
+        "extra",
+    )
+    _field_set = frozenset(_fields)
+    __slots__ = (*_fields, "_fingerprint")
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._fingerprint: int | None = None
+        self.update(data)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._field_set:
+            raise KeyError(f"Unknown article field: {key}")
+        if key == "extra":
+            value = value if isinstance(value, ArticleExtra) else ArticleExtra(value)
+        elif key in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        if key in _WATCHED_KEYS:
+            self._fingerprint = None
+        setattr(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._field_set:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+        self._fingerprint = None
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(hasattr(self, key) for key in self._fields)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return self.__class__, (self.to_dict(),)
+
+    def update(self, data: Any = (), /, **kwargs: Any) -> None:
+        if isinstance(data, ArticleRecord):
+            # 이미 변환된 게시글은 슬롯 값과 지문을 그대로 복사 (추가 데이터 객체는 공유)
+            for key in data._fields:
+                try:
+                    setattr(self, key, getattr(data, key))
+                except AttributeError:
+                    continue
+            self._fingerprint = data._fingerprint
+        else:
+            items = data.items() if isinstance(data, Mapping) else data
+            for key, value in items:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @property
+    def fingerprint(self) -> int:
+        """변경 확인 항목(상태, 제목, 가격)으로 계산한 게시글 지문"""
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(self)
+        return self._fingerprint
+
+    def copy(self) -> "ArticleRecord":
+        return self.__class__(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화 등을 위해 일반 딕셔너리(BaseArticle)로 변환"""
+        data = dict(self)
+        if "extra" in data:
+            data["extra"] = dict(data["extra"])
+        return data
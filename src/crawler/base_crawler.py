@@ -1,18 +1,59 @@
 import asyncio
+import codecs
 import datetime
+import hashlib
 import logging
 import os
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Any, Self, TypedDict
+from collections.abc import Mapping, Set
+from contextvars import ContextVar
+from typing import Any, Self, TypedDict, cast
+from urllib.parse import urlsplit
 
 import aiohttp
 import logfire
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+from src.util import SortedIdDict
+
+from .article import ArticleRecord
+from .connection import host_charsets
+from .executor import ParseExecutor
+from .fetch_cache import FetchedPage, fetch_cache
+from .governor import host_governor
+from .region import slice_regions
+from .retry import RetryPolicy, circuit_breakers, parse_retry_after, record_retry
+
+# 사용 가능한 HTML 파서 백엔드 (BeautifulSoup 트리 빌더 이름)
+# html.parser: 파이썬 내장 파서 (기본값, 호환성 대체용), lxml: lxml 설치 시 사용 가능한 빠른 파서
+PARSER_BACKENDS = ("html.parser", "lxml")
+DEFAULT_PARSER_BACKEND = "html.parser"
+# 응답 본문(bytes)을 디코딩하지 않고 인코딩 정보와 함께 바로 넘길 수 있는 파서 백엔드
+BYTES_BACKENDS = ("lxml",)
+
+# 파싱 중인 응답 본문의 인코딩 (파싱 작업자 스레드/프로세스마다 따로 유지됨)
+_encoding_hint: ContextVar[str | None] = ContextVar("encoding_hint", default=None)
+# 파싱 중인 크롤러가 이미 추적 중인 게시글 목록 (프로세스 풀에서 파싱하는 경우 게시글 번호만 전달됨)
+_known_articles: ContextVar[Mapping[int, "BaseArticle"] | Set[int] | None] = ContextVar("known_articles", default=None)
+
+
+def _merge_known(article: "BaseArticle", fields: Mapping[str, Any]) -> "BaseArticle":
+    """추적 중인 게시글 데이터에 새로 파싱한 값을 덮어쓴 사본 반환 (extra 는 기존 extra 에 합침)"""
+    return cast("BaseArticle", {**article, **fields, "extra": {**article["extra"], **fields.get("extra", {})}})
 
 
 class CrawlerExcpetion(Exception):
     pass
 
 
+class PageNotModified(CrawlerExcpetion):
+    """직전 요청 이후 페이지 내용이 변경되지 않은 경우 (304 응답 또는 동일한 본문) 발생하는 예외"""
+
+    pass
+
+
 class BaseArticle(TypedDict):
     article_id: int  # 게시글 번호
     title: str  # 게시글 제목
@@ -26,10 +67,38 @@ class BaseArticle(TypedDict):
     extra: dict[str, Any]  # 기타 데이터 저장용
 
 
-class ArticleCollection(dict[int, BaseArticle]):
-    def __init__(self, data: dict[int, BaseArticle] = {}):
-        for k, v in data.items():
-            self[k] = v
+class PageCache(TypedDict):
+    """URL별 조건부 요청 검증자 및 직전 파싱 결과 캐시
+
+    etag: 응답의 ETag 헤더 값
+    last_modified: 응답의 Last-Modified 헤더 값
+    digest: 응답 본문 해시값
+    articles: 직전 파싱 결과
+    """
+
+    etag: str | None
+    last_modified: str | None
+    digest: str
+    articles: dict[int, BaseArticle]
+
+
+class ParseMetrics(TypedDict):
+    """크롤러별 파싱 소요 시간 통계
+
+    count: 파싱 횟수
+    total: 총 소요 시간 (초)
+    last: 마지막 파싱 소요 시간 (초)
+    max: 최대 소요 시간 (초)
+    """
+
+    count: int
+    total: float
+    last: float
+    max: float
+
+
+class ArticleCollection(SortedIdDict[BaseArticle]):
+    """게시글 번호를 키로 하는 게시글 목록. 게시글 번호 순서로 정렬된 키 목록을 함께 유지함"""
 
     def __setitem__(self, __key: int | str, __value: BaseArticle) -> None:
         return super().__setitem__(int(__key), __value)
@@ -37,8 +106,8 @@ class ArticleCollection(dict[int, BaseArticle]):
     def __getitem__(self, __key: int) -> BaseArticle:
         return super().__getitem__(__key)
 
-    def __sub__(self, b: Self) -> "ArticleCollection":
-        return ArticleCollection({k: v for k, v in self.items() if k not in b})
+    def __sub__(self, b: Self) -> Self:
+        return self.__class__({k: v for k, v in self.items() if k not in b})
 
     def remove_expired(self, i: int) -> None:
         """article_id 값이 i보다 작은 게시글들을 삭제
@@ -46,72 +115,230 @@ class ArticleCollection(dict[int, BaseArticle]):
         Args:
             i (int): 비교할 article_id 값
         """
-        # {n: m for n, m in self.article_cache[name].items() if n >= id_min}
-        remove_list = [k for k in self.keys() if k < i]
-        for k in remove_list:
-            self.pop(k)
+        self.remove_below(i)
 
-    def get_new(self, i: int) -> "ArticleCollection":
+    def get_new(self, i: int) -> Self:
         """article_id 값이 i보다 큰 게시글들을 모아 새 객체로 반환
 
+        새 게시글은 추가된 순서(크롤링 결과에서는 게시판 페이지 순서)를 유지하므로 메시지도 같은 순서로 전송됨.
+        새 게시글이 없는 경우는 정렬된 키 목록만 확인함.
+
         Args:
             i (int): 비교할 article_id 값
 
         Returns:
             ArticleCollection: 새로운 게시글 모음
         """
-        return ArticleCollection({k: v for k, v in self.items() if k > i})
+        if not (new_keys := self.sorted_keys(i + 1)):
+            return self.__class__()
+        if len(new_keys) == len(self):
+            return self.copy()
+        new = set(new_keys)
+        return self.__class__((k, v) for k, v in self.items() if k in new)
+
+
+class ArticleCache(ArticleCollection):
+    """크롤러별 게시글 캐시. 크롤링 결과(ArticleCollection)와 같은 방식으로 사용 가능
+
+    게시글은 오래 보관되므로 메모리 사용량을 줄이기 위해 추가할 때 ArticleRecord 객체로 변환해서 저장함.
+    크롤러가 반환하는 ArticleCollection 은 일반 딕셔너리를 그대로 저장함.
+    """
+
+    def __setitem__(self, __key: int | str, __value: BaseArticle) -> None:
+        if not isinstance(__value, ArticleRecord):
+            __value = cast(BaseArticle, ArticleRecord(__value))
+        return super().__setitem__(__key, __value)
 
 
 class BaseCrawler(metaclass=ABCMeta):
-    def __init__(self, name: str, url_list: list[str], session: aiohttp.ClientSession | None = None) -> None:
+    # 파싱 작업을 다른 프로세스로 보낼 때 제외할 속성들
+    _unpicklable_attrs: tuple[str, ...] = ("session", "executor", "_page_cache")
+    # 파싱에 필요한 영역(게시판 이름, 게시글 목록 등)의 시작 태그 안에 있는 문자열 목록.
+    # 지정한 경우 해당 영역만 잘라내 파싱하고, 영역을 찾지 못하면 전체 HTML 파싱
+    regions: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        name: str,
+        url_list: list[str],
+        session: aiohttp.ClientSession | None = None,
+        executor: ParseExecutor | None = None,
+        **kwargs,
+    ) -> None:
         self.session: aiohttp.ClientSession = session if session is not None else aiohttp.ClientSession(trust_env=True)
+        self.executor: ParseExecutor = executor if executor is not None else ParseExecutor()
         self.url_list: list[str] = url_list
         self.cls_name = self.__class__.__name__
         self.name = name
+        self.config = kwargs
         self.logger = logging.getLogger(f"crawler.{self.__class__.__name__}")
         self._prev_status = 200
+        self._page_cache: dict[str, PageCache] = {}
+        # 모든 URL 요청/파싱에 실패한 연속 횟수
+        self.failures = 0
+        # 동시에 요청할 수 있는 URL 수
+        self.concurrency: int = max(1, kwargs.get("concurrency", 3))
+        self.retry = RetryPolicy(kwargs.get("retry"))
+        self.parse_metrics: ParseMetrics = {"count": 0, "total": 0.0, "last": 0.0, "max": 0.0}
+        self.parser_backend: str = self._select_parser_backend(kwargs.get("parser", DEFAULT_PARSER_BACKEND))
+        # 게시글 목록 영역만 잘라내 파싱할지 여부
+        self.region_slicing: bool = kwargs.get("region_slicing", True)
+
+    def _select_parser_backend(self, backend: str) -> str:
+        """설정된 HTML 파서 백엔드를 사용할 수 있는지 확인하고, 사용할 수 없는 경우 기본 백엔드 반환
 
-    async def get(self) -> ArticleCollection:
+        Args:
+            backend (str): 파서 백엔드 이름
+
+        Returns:
+            str: 실제로 사용할 파서 백엔드 이름
+        """
+        if backend not in PARSER_BACKENDS:
+            self.logger.warning("Unknown parser backend: %s, fallback to %s", backend, DEFAULT_PARSER_BACKEND)
+            return DEFAULT_PARSER_BACKEND
+        if builder_registry.lookup(backend) is None:
+            self.logger.warning("Parser backend not installed: %s, fallback to %s", backend, DEFAULT_PARSER_BACKEND)
+            return DEFAULT_PARSER_BACKEND
+        return backend
+
+    def soup(self, html: str | bytes) -> BeautifulSoup:
+        """설정된 파서 백엔드로 HTML 문자열을 파싱하여 BeautifulSoup 객체로 반환
+
+        Args:
+            html (str | bytes): HTML 문자열 또는 응답 본문. 응답 본문은 parse_page 에 전달된 인코딩으로 파싱함.
+
+        Returns:
+            BeautifulSoup: 파싱된 문서 객체
+        """
+        if isinstance(html, bytes):
+            return BeautifulSoup(html, self.parser_backend, from_encoding=_encoding_hint.get())
+        return BeautifulSoup(html, self.parser_backend)
+
+    def accepts_bytes(self, encoding: str) -> bool:
+        """응답 본문을 디코딩하지 않고 parse 메소드에 바로 넘길 수 있는지 여부
+
+        파서 백엔드가 바이트 문자열을 받을 수 없거나, 파이썬에서 알 수 없는 인코딩인 경우 False.
+        (알 수 없는 인코딩을 넘기면 파서 백엔드가 인코딩을 추측하므로 디코딩 단계에서 오류로 처리)
+
+        Args:
+            encoding (str): 응답 본문 인코딩
+        """
+        if self.parser_backend not in BYTES_BACKENDS:
+            return False
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return False
+        return True
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for attr in self._unpicklable_attrs:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # 파싱 작업자 프로세스에서 복원된 객체는 parse 메서드 호출 용도로만 사용
+        self.__dict__.update(state)
+        self._page_cache = {}
+
+    async def get(self, known: Mapping[int, BaseArticle] | None = None) -> ArticleCollection:
         """게시글 데이터를 크롤링 및 파싱하여 ArticleCollection 객체로 반환
 
+        url_list의 URL들은 최대 concurrency개씩 동시에 요청하며, 응답이 도착한 페이지부터 파싱한 다음
+        url_list 순서대로 합쳐서 반환.
+
+        Args:
+            known (Mapping[int, BaseArticle] | None, optional): 이미 추적 중인 게시글 목록.
+                지정한 경우 목록에 있는 게시글은 바뀔 수 있는 값(제목, 종료 여부 등)만 파싱하고 나머지는 기존 값을 사용함.
+
         Returns:
             ArticleCollection: 게시글 목록
         """
         with logfire.span(
             f"crawler_get_{self.name}", crawler_name=self.__class__.__name__, url_count=len(self.url_list)
         ):
-            html_list: list[str] = []
-            for url in self.url_list:
-                if html := await self.request(url):
-                    html_list.append(html)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            results = await asyncio.gather(*[self._fetch(url, semaphore, known) for url in self.url_list])
 
             data = ArticleCollection()
-            for html in html_list:
-                data.update(await self.parsing(html))
+            urls_processed = 0
+            urls_not_modified = 0
+            urls_failed = 0
+            for articles, modified in results:
+                if not articles:
+                    urls_failed += 1
+                    continue
+                if modified:
+                    urls_processed += 1
+                else:
+                    urls_not_modified += 1
+                data.update(articles)
+            self.failures = self.failures + 1 if urls_failed == len(self.url_list) else 0
 
             logfire.info(
                 "Crawler completed",
                 crawler_name=self.__class__.__name__,
-                urls_processed=len(html_list),
+                urls_processed=urls_processed,
+                urls_not_modified=urls_not_modified,
+                urls_failed=urls_failed,
                 articles_found=len(data),
             )
 
             return data
 
-    async def _request(self, url: str) -> aiohttp.ClientResponse | None:
+    async def _fetch(
+        self, url: str, semaphore: asyncio.Semaphore, known: Mapping[int, BaseArticle] | None = None
+    ) -> tuple[dict[int, BaseArticle] | None, bool]:
+        """URL 하나를 요청하고 파싱하여 게시글 데이터 목록을 반환
+
+        Args:
+            url (str): 요청할 URL
+            semaphore (asyncio.Semaphore): 동시 요청 수 제한용 세마포어
+            known (Mapping[int, BaseArticle] | None, optional): 이미 추적 중인 게시글 목록
+
+        Returns:
+            tuple[dict[int, BaseArticle] | None, bool]: 게시글 데이터 목록 (실패한 경우 None), 페이지 변경 여부
+        """
+        async with semaphore:
+            try:
+                page = await self.request(url)
+            except PageNotModified:
+                # 변경되지 않은 페이지는 파싱하지 않고 직전 파싱 결과 재사용
+                if (cache := self._page_cache.get(url)) is None:
+                    return None, False
+                return {k: v.copy() for k, v in cache["articles"].items()}, False
+        if not page:
+            return None, True
+        # 직전 파싱 결과 게시글 수 (잘라낸 영역에서 게시글이 빠지지 않았는지 확인용)
+        expected = len(cache["articles"]) if (cache := self._page_cache.get(url)) is not None else 0
+        try:
+            articles = await self.parsing(*page, known=known, expected=expected)
+        except asyncio.CancelledError:
+            # 본문 해시는 이미 갱신됐으므로, 캐시를 지우지 않으면 다음 요청에서 이전 파싱 결과를 재사용하게 됨
+            self._page_cache.pop(url, None)
+            raise
+        if url in self._page_cache:
+            if articles:
+                self._page_cache[url]["articles"] = articles
+            else:
+                # 파싱 실패 시 다음 요청에서 다시 파싱하도록 캐시 제거
+                self._page_cache.pop(url)
+        return articles, True
+
+    async def _request(self, url: str, headers: dict[str, str] | None = None) -> aiohttp.ClientResponse | None:
         """aiohttp를 사용하여 주어진 URL에 HTTP GET 요청을 보내고 응답을 반환
 
         Args:
             url (str): 요청할 URL
-            retry (bool, optional): 재시도 여부
+            headers (dict[str, str] | None, optional): 추가 요청 헤더
 
         Returns:
             aiohttp.ClientResponse | None: 응답 객체 (실패한 경우 None 반환)
         """
         self.logger.debug("Send request to %s", url)
         try:
-            resp = await self.session.get(url, allow_redirects=False)
+            resp = await self.session.get(url, headers=headers, allow_redirects=False)
         except aiohttp.ServerTimeoutError as e:
             self.logger.error("Client connection timeout error: %s (%s)", e, url)
             return
@@ -124,56 +351,278 @@ class BaseCrawler(metaclass=ABCMeta):
             return
         return resp
 
-    async def request(self, url: str) -> str | None:
-        """주어진 URL로부터 HTML 문자열을 반환
+    async def request(self, url: str) -> tuple[bytes, str] | None:
+        """주어진 URL로부터 응답 본문과 인코딩을 반환. 같은 URL을 요청하는 다른 크롤러가 있는 경우 응답을 공유함
+
+        본문은 디코딩하지 않고 그대로 반환하며, 파서 백엔드에 따라 필요한 경우에만 파싱 직전에 디코딩함.
 
         Args:
             url (str): 요청할 URL
 
         Returns:
-            str | None: HTML 문자열 (실패한 경우 None 반환)
+            tuple[bytes, str] | None: 응답 본문, 인코딩 (실패한 경우 None 반환)
+
+        Raises:
+            PageNotModified: 직전 요청 이후 페이지가 변경되지 않은 경우
+        """
+        headers = self._conditional_headers(url)
+        key = (url, tuple(sorted(headers.items())))
+        page = await fetch_cache.fetch(key, id(self), lambda: self._download(url, headers))
+        if page is None:
+            return
+
+        if page["status"] == 304:
+            self._prev_status = 200
+            self.logger.debug("Not modified: %s", url)
+            raise PageNotModified(url)
+        if page["status"] != 200:
+            if page["status"] != self._prev_status:
+                self.logger.error("Client response error: %s (%s)", page["status"], url)
+                await self.dump_http_response(page["body"])
+            else:
+                self.logger.info("Client response error [skip]: %s (%s)", page["status"], url)
+            self._prev_status = page["status"]
+            return
+        self._prev_status = page["status"]
+
+        if self._check_not_modified(url, page):
+            self.logger.debug("Response body not changed: %s", url)
+            raise PageNotModified(url)
+        return page["body"], page["encoding"]
+
+    async def _download(self, url: str, headers: dict[str, str]) -> FetchedPage | None:
+        """차단기, 요청 간격 조절, 재시도를 거쳐 URL을 요청하고 응답 내용을 반환
+
+        Args:
+            url (str): 요청할 URL
+            headers (dict[str, str]): 조건부 요청 헤더
+
+        Returns:
+            FetchedPage | None: 응답 내용 (요청하지 않았거나 실패한 경우 None 반환)
         """
-        retry_count = 2
-        for _ in range(retry_count):
-            resp = await self._request(url)
+        host = urlsplit(url).hostname or ""
+        breaker = circuit_breakers.get(host)
+        if not breaker.allow():
+            self.logger.info("Circuit breaker is open, skip request: %s", url)
+            return
+        for attempt in range(self.retry.attempts):
+            # 같은 호스트로 요청이 몰리지 않도록 간격 조절
+            await host_governor.acquire(host)
+            resp = await self._request(url, headers)
+            retry_after = None
             if resp is not None:
+                if resp.status not in self.retry.retry_statuses:
+                    break
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if not self.retry.should_retry(attempt) or (delay := self.retry.delay(attempt, retry_after)) is None:
                 break
-        else:
+            if resp is not None:
+                resp.release()
+            self.logger.info("Retry request after %.2fs (%s): %s", delay, resp.status if resp else "error", url)
+            record_retry(host)
+            await asyncio.sleep(delay)
+        if resp is None:
+            breaker.record_failure()
             self.logger.error("Client connection failed: %s", url)
             return
 
         async with resp:
-            if resp.status != 200:
-                if resp.status != self._prev_status:
-                    self.logger.error("Client response error: %s (%s)", resp.status, url)
-                    await self.dump_http_response(resp)
-                else:
-                    self.logger.info("Client response error [skip]: %s (%s)", resp.status, url)
-                self._prev_status = resp.status
-                return
+            # 서버 오류, 요청 제한, 차단 응답은 호스트 실패로 기록
+            if resp.status in self.retry.retry_statuses or resp.status == 403:
+                # 서버가 요구한 대기 시간이 너무 길어 재시도하지 않은 경우 그 시간동안 요청하지 않음
+                if retry_after is not None and retry_after <= self.retry.config["max_retry_after"]:
+                    retry_after = None
+                breaker.record_failure(retry_after)
             else:
-                self._prev_status = resp.status
-
+                breaker.record_success()
             try:
-                await resp.read()
-                if (encoding := resp.get_encoding()) in ("euc-kr", "euc_kr"):
-                    encoding = "cp949"
-                html = await resp.text(encoding=encoding)
+                body = await resp.read()
+                encoding = host_charsets.resolve(host, resp, body)
             except aiohttp.ClientConnectionError as e:
-                self.logger.error("Connection error: {}", e)
+                self.logger.error("Connection error: %s", e)
                 return
             except Exception as e:
-                await self.dump_http_response(resp)
-                self.logger.error("Cannot get response html string: {}", e)
+                self.logger.error("Cannot read response body: %s (%s)", e, url)
                 return
-        return html
+        return {
+            "status": resp.status,
+            "body": body,
+            "encoding": encoding,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        """직전 응답의 검증자를 바탕으로 조건부 요청 헤더 생성
+
+        Args:
+            url (str): 요청할 URL
+
+        Returns:
+            dict[str, str]: If-None-Match, If-Modified-Since 헤더 (검증자가 없는 경우 빈 딕셔너리)
+        """
+        headers: dict[str, str] = {}
+        if (cache := self._page_cache.get(url)) is None:
+            return headers
+        if cache["etag"]:
+            headers["If-None-Match"] = cache["etag"]
+        if cache["last_modified"]:
+            headers["If-Modified-Since"] = cache["last_modified"]
+        return headers
+
+    def _check_not_modified(self, url: str, page: FetchedPage) -> bool:
+        """응답 본문 해시값을 직전 응답과 비교하고, 검증자 캐시 갱신
+
+        Args:
+            url (str): 요청한 URL
+            page (FetchedPage): 응답 내용
+
+        Returns:
+            bool: 직전 응답과 본문이 동일한 경우 True
+        """
+        digest = hashlib.blake2b(page["body"], digest_size=16).hexdigest()
+        cache = self._page_cache.get(url)
+        if cache is not None and cache["digest"] == digest:
+            return True
+        self._page_cache[url] = {
+            "etag": page["etag"],
+            "last_modified": page["last_modified"],
+            "digest": digest,
+            "articles": cache["articles"] if cache is not None else {},
+        }
+        return False
+
+    async def parsing(
+        self,
+        html: str | bytes,
+        encoding: str | None = None,
+        known: Mapping[int, BaseArticle] | None = None,
+        expected: int = 0,
+    ) -> dict[int, BaseArticle]:
+        """HTML 문자열을 파싱 실행기에서 파싱하여 게시글 데이터 목록을 반환, 파싱 소요 시간 기록
+
+        Args:
+            html (str | bytes): HTML 문자열 또는 응답 본문
+            encoding (str | None, optional): 응답 본문 인코딩
+            known (Mapping[int, BaseArticle] | None, optional): 이미 추적 중인 게시글 목록
+            expected (int, optional): 같은 페이지의 직전 파싱 결과 게시글 수 (parse_page 참고)
+
+        Returns:
+            dict[int, BaseArticle]: 게시글 데이터 목록
+        """
+        st = time.perf_counter()
+        if known and self.executor.mode == "process":
+            # 추적 중인 게시글 전체를 매번 작업자 프로세스로 보내지 않도록 게시글 번호만 넘기고,
+            # 빠른 경로로 파싱된 게시글은 돌려받은 값을 기존 데이터에 합침
+            data = await self.executor.run(self.parse_page, html, encoding, frozenset(known), expected)
+            for article_id, article in data.items():
+                if "url" not in article and article_id in known:
+                    data[article_id] = _merge_known(known[article_id], article)
+        else:
+            data = await self.executor.run(self.parse_page, html, encoding, known, expected)
+        elapsed = time.perf_counter() - st
+        metrics = self.parse_metrics
+        metrics["count"] += 1
+        metrics["total"] += elapsed
+        metrics["last"] = elapsed
+        metrics["max"] = max(metrics["max"], elapsed)
+        self.logger.debug("Parsing took %.3fs (%s, %d article(s))", elapsed, self.executor.mode, len(data))
+        logfire.info(
+            "Crawler parsed",
+            crawler_name=self.__class__.__name__,
+            parse_time=elapsed,
+            parse_time_avg=metrics["total"] / metrics["count"],
+            executor=self.executor.mode,
+            articles_parsed=len(data),
+            articles_known=len(data.keys() & known.keys()) if known else 0,
+        )
+        return data
+
+    def parse_page(
+        self,
+        html: str | bytes,
+        encoding: str | None = None,
+        known: Mapping[int, BaseArticle] | Set[int] | None = None,
+        expected: int = 0,
+    ) -> dict[int, BaseArticle]:
+        """게시글 목록 영역만 잘라내 파싱하여 게시글 데이터 목록을 반환. 파싱 실행기의 작업자 프로세스에서 실행될 수 있음.
+
+        응답 본문은 파서 백엔드가 바이트 문자열을 받을 수 없는 경우에만 디코딩함.
+        영역을 찾지 못했거나, 잘라낸 영역에서 찾은 게시글이 없거나 직전 파싱 결과보다 적은 경우 전체 HTML을 파싱함.
+        (영역을 잘못 잘라내 빠진 게시글을 삭제된 게시글로 처리하지 않기 위함)
+
+        Args:
+            html (str | bytes): HTML 문자열 또는 응답 본문
+            encoding (str | None, optional): 응답 본문 인코딩 (생략 시 UTF-8)
+            known (Mapping[int, BaseArticle] | Set[int] | None, optional): 이미 추적 중인 게시글 목록
+                (known_article 메소드에서 사용). 게시글 번호만 넘긴 경우 빠른 경로로 파싱된 게시글은
+                새로 파싱한 값만 담아 반환하며, 기존 데이터와 합치는 작업은 호출한 쪽에서 처리함.
+            expected (int, optional): 같은 페이지의 직전 파싱 결과 게시글 수. 잘라낸 영역의 검증에 사용
+
+        Returns:
+            dict[int, BaseArticle]: 게시글 데이터 목록
+        """
+        encoding = encoding or "utf-8"
+        if isinstance(html, bytes) and not self.accepts_bytes(encoding):
+            try:
+                html = html.decode(encoding)
+            except (LookupError, UnicodeDecodeError) as e:
+                self.logger.error("Cannot decode response body (%s): %s", encoding, e)
+                return {}
+        token = _encoding_hint.set(encoding)
+        known_token = _known_articles.set(known)
+        try:
+            return self._parse_regions(html, expected)
+        finally:
+            _known_articles.reset(known_token)
+            _encoding_hint.reset(token)
+
+    def _parse_regions(self, html: str | bytes, expected: int = 0) -> dict[int, BaseArticle]:
+        if self.regions and self.region_slicing:
+            if (fragment := slice_regions(html, self.regions)) is None:
+                self.logger.debug("Can't find article list region, parse full html")
+            elif len(data := self.parse(fragment)) >= max(expected, 1):
+                return data
+            elif data:
+                self.logger.warning(
+                    "Sliced region has fewer articles than last parse (%d < %d), parse full html", len(data), expected
+                )
+            else:
+                self.logger.debug("No article in sliced region, parse full html")
+        return self.parse(html)
+
+    def known_article(self, article_id: int, **fields: Any) -> BaseArticle | None:
+        """이미 추적 중인 게시글이면 기존 데이터에 새로 파싱한 값만 덮어써서 반환
+
+        parse 메소드에서 게시글 번호와 바뀔 수 있는 값(제목, 종료 여부, 가격 등)만 먼저 찾은 다음 호출하여,
+        이미 추적 중인 게시글은 나머지 값을 찾는 작업을 건너뛰는 용도로 사용.
+        빠른 경로에서는 넘겨준 값(보통 제목, 종료 여부, 가격 등의 extra)만 갱신되며, 넘겨주지 않은 값
+        (카테고리, 게시판 이름, 작성자, 추천/조회 수 등)은 처음 파싱했을 때의 값이 유지됨.
+
+        Args:
+            article_id (int): 게시글 번호
+            **fields: 새로 파싱한 값. extra 는 기존 extra 에 합쳐짐.
+
+        Returns:
+            BaseArticle | None: 게시글 데이터, 추적 중이 아닌 게시글인 경우 None
+        """
+        if (known := _known_articles.get()) is None or article_id not in known:
+            return None
+        fields = {**fields, "article_id": article_id, "crawler_name": self.name, "extra": fields.get("extra", {})}
+        if not isinstance(known, Mapping):
+            # 게시글 번호만 전달된 경우 (프로세스 풀) 새로 파싱한 값만 반환하고 parsing 메소드에서 합침
+            return cast(BaseArticle, fields)
+        return _merge_known(known[article_id], fields)
 
     @abstractmethod
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        """HTML 문자열을 파싱하여 게시글 데이터 목록을 반환
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        """HTML 문자열을 파싱하여 게시글 데이터 목록을 반환. 파싱 실행기의 작업자 프로세스에서 실행될 수 있음.
+
+        이미 추적 중인 게시글은 known_article 메소드로 나머지 값의 파싱을 건너뛸 수 있음.
 
         Args:
-            html (str): HTML 문자열
+            html (str | bytes): HTML 문자열. accepts_bytes 가 True인 경우 디코딩하지 않은 응답 본문이 전달될 수 있으며,
+                soup 메소드를 사용하면 응답 본문의 인코딩으로 파싱함.
 
         Returns:
             dict[int, BaseArticle]: 게시글 데이터 목록
@@ -185,11 +634,11 @@ class BaseCrawler(metaclass=ABCMeta):
         if not self.session.closed:
             await self.session.close()
 
-    async def dump_http_response(self, resp: aiohttp.ClientResponse) -> None:
-        """HTTP 응답을 error/ 폴더에 'YYYYMMDD_HHMMSS_{crawler_name}.html' 형식으로 저장
+    async def dump_http_response(self, body: bytes) -> None:
+        """HTTP 응답 본문을 error/ 폴더에 'YYYYMMDD_HHMMSS_{crawler_name}.html' 형식으로 저장
 
         Args:
-            resp (aiohttp.ClientResponse): aiohttp ClientResponse 객체
+            body (bytes): 응답 본문
         """
         current_datetime = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join("error", f"{current_datetime}_{self.name}.html")
@@ -198,5 +647,5 @@ class BaseCrawler(metaclass=ABCMeta):
             os.makedirs("error")
 
         with open(filename, "wb") as f:
-            f.write(await resp.read())
+            f.write(body)
             self.logger.debug("Dumped response binary to %s", filename)
@@ -0,0 +1,54 @@
+from collections.abc import Mapping
+from typing import Any, TypedDict
+
+import logfire
+
+from .article import WATCHED_FIELDS, ArticleRecord, ChangeField, fingerprint
+from .base_crawler import BaseArticle
+
+_change_counter = logfire.metric_counter(
+    "crawler.article.changes", unit="1", description="메시지 수정이 필요한 게시글 변경 수 (변경 항목별)"
+)
+
+
+class ArticleChange(TypedDict):
+    """추적 중인 게시글의 변경 내용
+
+    article: 게시글 캐시에 저장된 게시글
+    fields: 바뀐 항목 목록 (status: 종료 여부, title: 제목, price: 가격)
+    previous: 바뀐 항목의 이전 값
+    """
+
+    article: BaseArticle
+    fields: tuple[ChangeField, ...]
+    previous: dict[ChangeField, Any]
+
+
+def _fingerprint(article: Mapping[str, Any]) -> int:
+    return article.fingerprint if isinstance(article, ArticleRecord) else fingerprint(article)
+
+
+def detect_changes(cached: Mapping[int, BaseArticle], recent: Mapping[int, BaseArticle]) -> list[ArticleChange]:
+    """게시글 캐시와 새로 크롤링한 게시글 목록에 모두 있는 게시글 중 변경 확인 항목이 바뀐 게시글 목록 반환
+
+    게시글 지문을 먼저 비교하고, 지문이 다른 게시글만 항목별로 비교함. 게시글 캐시는 수정하지 않음.
+
+    Args:
+        cached (Mapping[int, BaseArticle]): 게시글 캐시
+        recent (Mapping[int, BaseArticle]): 새로 크롤링한 게시글 목록
+
+    Returns:
+        list[ArticleChange]: 게시글 캐시 순서대로 정렬된 변경 목록
+    """
+    changes: list[ArticleChange] = []
+    for article_id, article in cached.items():
+        if (new_article := recent.get(article_id)) is None or _fingerprint(article) == _fingerprint(new_article):
+            continue
+        previous: dict[ChangeField, Any] = {}
+        for field, get in WATCHED_FIELDS.items():
+            if (value := get(article)) != get(new_article):
+                previous[field] = value
+                _change_counter.add(1, {"field": field})
+        if previous:
+            changes.append({"article": article, "fields": tuple(previous), "previous": previous})
+    return changes
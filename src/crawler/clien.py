@@ -1,12 +1,12 @@
 # 클리앙 알들구매 게시판 https://www.clien.net/service/board/jirum
-from bs4 import BeautifulSoup
-
 from .base_crawler import BaseArticle, BaseCrawler
 
 
 class ClienCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    regions = ('id="boardName"', 'id="boardCd"', 'class="list_content"')
+
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         data: dict[int, BaseArticle] = {}
 
         if (_board_name := soup.select_one("input#boardName")) is None:
@@ -29,6 +29,16 @@ class ClienCrawler(BaseCrawler):
             if "난리난" in _title_tag.attrs["title"]:
                 # 스팸 게시글 무시
                 continue
+            _id_str = row.attrs.get("data-board-sn")
+            if _id_str is None:
+                self.logger.warning("Cannot get article id")
+                continue
+            _id = int(_id_str)
+            is_end = "sold_out" in row["class"]
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(_id, title=_title_tag.attrs["title"], is_end=is_end)) is not None:
+                data[_id] = article
+                continue
             if (_writer_tag := row.select_one(".list_author")) is None:
                 self.logger.warning("Cannot get article writer tag")
                 continue
@@ -38,11 +48,6 @@ class ClienCrawler(BaseCrawler):
             if (_category_tag := row.select_one(".icon_keyword")) is None or not _category_tag.text:
                 self.logger.warning("Cannot get category tag")
                 continue
-            _id_str = row.attrs.get("data-board-sn")
-            if _id_str is None:
-                self.logger.warning("Cannot get article id")
-                continue
-            _id = int(_id_str)
             _recommend_tag = row.select_one(".list_votes")
             _recommend = _recommend_tag.text.strip() if _recommend_tag else "0"
             data[_id] = {
@@ -54,7 +59,7 @@ class ClienCrawler(BaseCrawler):
                 "writer_name": _writer_tag.text.strip(),
                 "crawler_name": self.name,
                 "url": f"https://www.clien.net/service/board/{board_url}/{_id}",
-                "is_end": "sold_out" in row["class"],
+                "is_end": is_end,
                 "extra": {"recommend": _recommend, "view": _view_tag.text},
             }
         return data
@@ -0,0 +1,233 @@
+import codecs
+import importlib.util
+import re
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import TypedDict, cast
+
+import aiohttp
+
+from .governor import PolitenessConfig
+from .retry import BreakerConfig
+
+# brotli 패키지가 설치된 경우에만 br 압축 응답을 풀 수 있음
+HAS_BROTLI = any(importlib.util.find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+
+
+class HttpConfig(TypedDict, total=False):
+    """크롤러 HTTP 세션(커넥션 풀) 설정
+
+    limit: 전체 동시 연결 수 (0인 경우 제한 없음)
+    limit_per_host: 호스트별 동시 연결 수 (0인 경우 제한 없음)
+    ttl_dns_cache: DNS 조회 결과 캐시 유지 시간 (초)
+    keepalive_timeout: 사용하지 않는 연결을 유지할 시간 (초), 크롤링 주기보다 길어야 다음 주기에 연결 재사용 가능
+    compression: 압축 응답(gzip, deflate, br) 요청 여부
+    timeout: 요청 전체 제한 시간 (초)
+    circuit_breaker: 호스트별 차단기 설정
+    politeness: 호스트별 요청 속도 제한 설정
+    coalesce_ttl: 여러 크롤러가 같은 URL을 요청하는 경우 한 번만 요청하고 응답을 공유할 시간 (초), 0인 경우 공유하지 않음
+    """
+
+    limit: int
+    limit_per_host: int
+    ttl_dns_cache: int
+    keepalive_timeout: float
+    compression: bool
+    timeout: float
+    circuit_breaker: BreakerConfig
+    politeness: PolitenessConfig
+    coalesce_ttl: float
+
+
+DEFAULT_HTTP_CONFIG: HttpConfig = {
+    "limit": 100,
+    "limit_per_host": 8,
+    "ttl_dns_cache": 600,
+    "keepalive_timeout": 90,
+    "compression": True,
+    "timeout": 20,
+}
+
+
+class ConnectionStats:
+    """aiohttp TraceConfig를 이용해 요청 수, 연결 생성/재사용 수, DNS 캐시 적중 수 등을 집계"""
+
+    def __init__(self) -> None:
+        self.counter: Counter[str] = Counter()
+        # 호스트별 새 연결 수 (TCP/TLS 연결 비용이 발생한 횟수)
+        self.new_connections: Counter[str] = Counter()
+        self.queued_time = 0.0
+        self.connect_time = 0.0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+        self.trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        self.trace_config.on_connection_queued_end.append(self._on_connection_queued_end)
+        self.trace_config.on_connection_create_start.append(self._on_connection_create_start)
+        self.trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        self.trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        self.trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+
+    async def _on_request_start(self, session, ctx: SimpleNamespace, params: aiohttp.TraceRequestStartParams) -> None:
+        self.counter["requests"] += 1
+        ctx.host = params.url.host
+
+    async def _on_request_exception(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["errors"] += 1
+
+    async def _on_connection_queued_start(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["queued"] += 1
+        ctx.queued_start = time.perf_counter()
+
+    async def _on_connection_queued_end(self, session, ctx: SimpleNamespace, params) -> None:
+        self.queued_time += time.perf_counter() - ctx.queued_start
+
+    async def _on_connection_create_start(self, session, ctx: SimpleNamespace, params) -> None:
+        ctx.connect_start = time.perf_counter()
+
+    async def _on_connection_create_end(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["created"] += 1
+        self.new_connections[getattr(ctx, "host", None) or ""] += 1
+        self.connect_time += time.perf_counter() - ctx.connect_start
+
+    async def _on_connection_reuseconn(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["reused"] += 1
+
+    async def _on_dns_cache_hit(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["dns_hit"] += 1
+
+    async def _on_dns_cache_miss(self, session, ctx: SimpleNamespace, params) -> None:
+        self.counter["dns_miss"] += 1
+
+    def snapshot(self, reset: bool = False) -> dict[str, float | int]:
+        """집계된 통계 반환
+
+        Args:
+            reset (bool, optional): 반환 후 통계 초기화 여부
+
+        Returns:
+            dict[str, float | int]: 요청 수, 연결 생성/재사용 수, 재사용 비율, DNS 캐시 적중 수, 대기/연결 시간 등
+        """
+        connections = self.counter["created"] + self.counter["reused"]
+        stats: dict[str, float | int] = {
+            "requests": self.counter["requests"],
+            "errors": self.counter["errors"],
+            "created": self.counter["created"],
+            "reused": self.counter["reused"],
+            "reuse_ratio": self.counter["reused"] / connections if connections else 0.0,
+            "dns_hit": self.counter["dns_hit"],
+            "dns_miss": self.counter["dns_miss"],
+            "queued": self.counter["queued"],
+            "queued_time": self.queued_time,
+            "connect_time": self.connect_time,
+        }
+        if reset:
+            self.counter.clear()
+            self.new_connections.clear()
+            self.queued_time = 0.0
+            self.connect_time = 0.0
+        return stats
+
+
+# 본문 앞부분의 <meta charset=...>, <meta content="...; charset=...">, <?xml encoding=...?> 선언
+_CHARSET_DECLARATION_RE = re.compile(rb"""(?:charset|encoding)\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+# 선언을 찾을 본문 앞부분 길이
+_CHARSET_SNIFF_BYTES = 2048
+
+
+def normalize_encoding(encoding: str) -> str:
+    """인코딩 이름을 파이썬 코덱 이름으로 변환. EUC-KR 은 확장 문자를 포함하는 CP949 로 취급"""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return encoding.lower()
+    return "cp949" if name == "euc_kr" else name
+
+
+class CharsetCache:
+    """호스트별 응답 본문 인코딩 기억
+
+    Content-Type 헤더에 charset 이 있으면 그 값을 사용하고 기억하며, 없는 경우 기억해둔 값을 사용함.
+    처음 요청하는 호스트인 경우에만 본문 앞부분의 선언을 찾거나 aiohttp 의 인코딩 추정을 사용함.
+    """
+
+    def __init__(self) -> None:
+        self.hosts: dict[str, str] = {}
+
+    def resolve(self, host: str, resp: aiohttp.ClientResponse, body: bytes) -> str:
+        """응답 본문의 인코딩 반환
+
+        Args:
+            host (str): 요청한 호스트
+            resp (aiohttp.ClientResponse): 응답 객체
+            body (bytes): 응답 본문
+        """
+        if resp.charset:
+            encoding = self.hosts[host] = normalize_encoding(resp.charset)
+            return encoding
+        if (encoding := self.hosts.get(host)) is not None:
+            return encoding
+        if (m := _CHARSET_DECLARATION_RE.search(body, 0, _CHARSET_SNIFF_BYTES)) is not None:
+            encoding = normalize_encoding(m.group(1).decode("ascii"))
+        else:
+            encoding = normalize_encoding(resp.get_encoding())
+        self.hosts[host] = encoding
+        return encoding
+
+
+def session_config(config: HttpConfig | None) -> HttpConfig:
+    """HTTP 설정 중 세션(커넥션 풀)을 새로 만들어야 적용되는 값만 모아 반환 (생략한 값은 기본값)
+
+    차단기, 요청 속도 제한, 응답 공유 설정은 세션과 관계없이 바로 적용되므로 포함하지 않음.
+
+    Args:
+        config (HttpConfig | None): HTTP 세션 설정
+
+    Returns:
+        HttpConfig: 세션 설정
+    """
+    config = config or {}
+    return cast(HttpConfig, {key: config.get(key, default) for key, default in DEFAULT_HTTP_CONFIG.items()})
+
+
+def accept_encoding(compression: bool) -> str:
+    """압축 사용 여부에 따른 Accept-Encoding 헤더 값 반환"""
+    if not compression:
+        return "identity"
+    return "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+def create_session(
+    config: HttpConfig | None = None, headers: dict[str, str] | None = None
+) -> tuple[aiohttp.ClientSession, ConnectionStats]:
+    """설정에 맞게 조정한 커넥션 풀을 사용하는 aiohttp 세션 생성
+
+    Args:
+        config (HttpConfig | None, optional): HTTP 세션 설정, 생략한 값은 DEFAULT_HTTP_CONFIG 값 사용
+        headers (dict[str, str] | None, optional): 모든 요청에 사용할 기본 헤더
+
+    Returns:
+        tuple[aiohttp.ClientSession, ConnectionStats]: 세션 객체, 연결 통계 객체
+    """
+    config = {**DEFAULT_HTTP_CONFIG, **(config or {})}
+    stats = ConnectionStats()
+    connector = aiohttp.TCPConnector(
+        limit=config["limit"],
+        limit_per_host=config["limit_per_host"],
+        ttl_dns_cache=config["ttl_dns_cache"],
+        keepalive_timeout=config["keepalive_timeout"],
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        headers={**(headers or {}), "Accept-Encoding": accept_encoding(config["compression"])},
+        timeout=aiohttp.ClientTimeout(total=config["timeout"]),
+        trust_env=True,
+        trace_configs=[stats.trace_config],
+    )
+    return session, stats
+
+
+# 모든 크롤러가 공유하는 호스트별 응답 인코딩
+host_charsets = CharsetCache()
@@ -2,14 +2,12 @@
 # 다모앙 알뜰구매 게시판 (RSS) https://damoang.net/bbs/rss.php?bo_table=economy
 import re
 
-from bs4 import BeautifulSoup
-
 from .base_crawler import BaseArticle, BaseCrawler
 
 
 class DamoangCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         data: dict[int, BaseArticle] = {}
 
         if (_board_name := soup.select_one(".page-title")) is None:
@@ -38,17 +36,6 @@ class DamoangCrawler(BaseCrawler):
             if (_re_url := re.search(r"/([\w\d]+)/(\d+)", _url)) is None:
                 self.logger.warning("Cannot find board id and article id")
                 continue
-            if (_writer_tag := row.select_one(".sv_wrap .sv_name")) is None:
-                self.logger.warning("Cannot get article wrtier tag")
-                continue
-            if (_recommend_tag := row.select_one(".rcmd-box")) is None:
-                # hidden span tag로 "추천" 글자가 들어있음.
-                self.logger.warning("Cannot get article recommend tag")
-                continue
-            if (_view_tag := row.select_one(".wr-num.order-4")) is None:
-                # hidden span tag로 "조회" 글자가 들어있음.
-                self.logger.warning("Cannot get article view count tag")
-                continue
             if (_status_badge_tag := row.select_one(".badge")) is None:
                 self.logger.warning("Cannot get article status badge")
                 continue
@@ -63,6 +50,21 @@ class DamoangCrawler(BaseCrawler):
                 is_end = True
             else:
                 is_end = False
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(_id, title=_title_tag.text.strip(), is_end=is_end)) is not None:
+                data[_id] = article
+                continue
+            if (_writer_tag := row.select_one(".sv_wrap .sv_name")) is None:
+                self.logger.warning("Cannot get article wrtier tag")
+                continue
+            if (_recommend_tag := row.select_one(".rcmd-box")) is None:
+                # hidden span tag로 "추천" 글자가 들어있음.
+                self.logger.warning("Cannot get article recommend tag")
+                continue
+            if (_view_tag := row.select_one(".wr-num.order-4")) is None:
+                # hidden span tag로 "조회" 글자가 들어있음.
+                self.logger.warning("Cannot get article view count tag")
+                continue
             data[_id] = {
                 "article_id": _id,
                 "title": _title_tag.text.strip(),
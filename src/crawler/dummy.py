@@ -1,4 +1,5 @@
 import random
+from collections.abc import Mapping
 
 import aiohttp
 
@@ -6,12 +7,12 @@ from .base_crawler import ArticleCollection, BaseArticle, BaseCrawler
 
 
 class DummyCrawler(BaseCrawler):
-    def __init__(self, name: str, url_list: list[str], session: aiohttp.ClientSession | None = None) -> None:
-        super().__init__(name, url_list, session)
+    def __init__(self, name: str, url_list: list[str], session: aiohttp.ClientSession | None = None, **kwargs) -> None:
+        super().__init__(name, url_list, session, **kwargs)
         self.start = 1
         self.dummy_data = {i: self._generate_article_object(i) for i in range(self.start, self.start + 10)}
 
-    async def get(self) -> ArticleCollection:
+    async def get(self, known: Mapping[int, BaseArticle] | None = None) -> ArticleCollection:
         # 2개 게시글 새로 생성
         new = self._generate_article_object(max(list(self.dummy_data.keys())) + 1)
         new2 = self._generate_article_object(max(list(self.dummy_data.keys())) + 2)
@@ -28,7 +29,7 @@ class DummyCrawler(BaseCrawler):
         # 정렬 후 반환
         return ArticleCollection({k: self.dummy_data[k].copy() for k in sorted(self.dummy_data.keys())})
 
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
         return {}
 
     def _generate_article_object(self, n: int):
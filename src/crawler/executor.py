@@ -0,0 +1,129 @@
+import asyncio
+import functools
+import logging
+import pickle
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Literal, ParamSpec, TypedDict, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+ExecutorMode = Literal["process", "thread", "inline"]
+
+
+class ParserConfig(TypedDict, total=False):
+    """HTML 파싱 실행기 설정
+
+    executor: 파싱 작업 실행 방식 (process: 프로세스 풀, thread: 스레드 풀, inline: 이벤트 루프에서 직접 실행)
+    max_workers: 풀의 최대 작업자 수 (생략 시 CPU 개수)
+    """
+
+    executor: ExecutorMode
+    max_workers: int | None
+
+
+class ParseExecutor:
+    """CPU 작업인 HTML 파싱을 이벤트 루프 밖에서 실행하는 실행기
+
+    프로세스 풀을 만들 수 없거나 풀이 깨진 경우 스레드 풀로, 작업 객체를 다른 프로세스로 보낼 수 없는 경우
+    이벤트 루프에서 직접 실행하는 방식으로 대체함.
+
+    Args:
+        mode (ExecutorMode, optional): 실행 방식, 기본값은 "inline"
+        max_workers (int | None, optional): 풀의 최대 작업자 수
+    """
+
+    def __init__(self, mode: ExecutorMode = "inline", max_workers: int | None = None) -> None:
+        self.logger = logging.getLogger("ParseExecutor")
+        self.max_workers = max_workers
+        self.mode: ExecutorMode = mode
+        self._pool: Executor | None = None
+        # {함수 또는 바운드 메서드의 객체: 프로세스 풀로 보낼 수 있는지 여부}
+        self._picklable: weakref.WeakKeyDictionary[object, bool] = weakref.WeakKeyDictionary()
+        if mode == "process":
+            try:
+                self._pool = ProcessPoolExecutor(max_workers=max_workers)
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning("Cannot create process pool, fallback to thread pool: %s", e)
+                self.mode = "thread"
+        if self.mode == "thread":
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="parser")
+
+    @classmethod
+    def from_config(cls, config: ParserConfig | None) -> "ParseExecutor":
+        """설정으로부터 실행기 생성
+
+        Args:
+            config (ParserConfig | None): 파싱 실행기 설정
+
+        Returns:
+            ParseExecutor: 실행기 객체
+        """
+        config = config or {}
+        return cls(config.get("executor", "inline"), config.get("max_workers"))
+
+    async def run(self, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """주어진 함수를 실행기에서 실행하고 결과를 반환
+
+        Args:
+            func (Callable): 실행할 함수. 프로세스 풀을 사용하는 경우 함수와 인자 모두 pickle 가능해야 함.
+
+        Returns:
+            T: 함수 실행 결과
+        """
+        if self._pool is None:
+            return func(*args, **kwargs)
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        if self.mode == "process" and not self._is_picklable(func):
+            return call()
+        try:
+            return await loop.run_in_executor(self._pool, call)
+        except pickle.PicklingError as e:
+            self.logger.warning("Cannot send task to process pool, run inline: %s", e)
+            return call()
+        except BrokenProcessPool as e:
+            self.logger.error("Process pool is broken, fallback to thread pool: %s", e)
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self.mode = "thread"
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="parser")
+            return await loop.run_in_executor(self._pool, call)
+
+    def _is_picklable(self, func: Callable) -> bool:
+        """함수를 프로세스 풀로 보낼 수 있는지 확인. 바운드 메서드는 객체별로 한 번만 확인함
+
+        pickle 할 수 없는 객체(지역 클래스, 람다 등)는 PicklingError 외에 AttributeError, TypeError 가 발생할 수 있는데,
+        풀에서 실행한 뒤에는 함수 실행 중 발생한 예외와 구분할 수 없으므로 보내기 전에 확인함.
+
+        Args:
+            func (Callable): 실행할 함수
+
+        Returns:
+            bool: 프로세스 풀로 보낼 수 있는 경우 True
+        """
+        owner = getattr(func, "__self__", func)
+        try:
+            return self._picklable[owner]
+        except (KeyError, TypeError):
+            pass
+        try:
+            pickle.dumps(func)
+            picklable = True
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            self.logger.warning("Cannot send task to process pool, run inline: %s", e)
+            picklable = False
+        try:
+            self._picklable[owner] = picklable
+        except TypeError:
+            # 약한 참조를 만들 수 없는 객체는 매번 확인
+            pass
+        return picklable
+
+    def shutdown(self) -> None:
+        """풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
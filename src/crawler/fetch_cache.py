@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypedDict
+
+import logfire
+
+_coalesced_counter = logfire.metric_counter(
+    "crawler.request.coalesced", unit="1", description="다른 크롤러의 응답을 재사용해 생략한 요청 수"
+)
+
+# 기본 응답 재사용 시간 (초). 같은 주기에 실행되는 크롤러끼리만 공유되도록 짧게 유지
+DEFAULT_COALESCE_TTL = 5.0
+
+
+class FetchedPage(TypedDict):
+    """여러 크롤러가 공유하는 HTTP 응답 내용
+
+    status: HTTP 상태 코드
+    body: 응답 본문
+    encoding: 응답 본문 인코딩
+    etag: 응답의 ETag 헤더 값
+    last_modified: 응답의 Last-Modified 헤더 값
+    """
+
+    status: int
+    body: bytes
+    encoding: str
+    etag: str | None
+    last_modified: str | None
+
+
+class _Entry:
+    """요청 하나에 대한 캐시 항목. 응답이 완료된 뒤 expires 시각까지 유지됨"""
+
+    def __init__(self, task: asyncio.Future[FetchedPage | None], consumer: Hashable) -> None:
+        self.task = task
+        self.consumers: set[Hashable] = {consumer}
+        self.expires: float | None = None
+
+
+class FetchCache:
+    """같은 URL에 대한 요청을 하나로 합치는(single-flight) 짧은 수명의 응답 캐시
+
+    같은 게시판을 여러 크롤러가 요청하는 경우 먼저 요청한 크롤러의 응답을 나머지 크롤러가 그대로 받음.
+    같은 크롤러가 다시 요청하는 경우(다음 주기)는 TTL과 관계없이 새로 요청함.
+
+    Args:
+        ttl (float | None, optional): 응답 완료 후 재사용할 시간 (초), 0인 경우 요청을 합치지 않음
+    """
+
+    def __init__(self, ttl: float | None = None) -> None:
+        self.logger = logging.getLogger("FetchCache")
+        self.ttl = DEFAULT_COALESCE_TTL
+        self.entries: dict[Hashable, _Entry] = {}
+        self.counter: Counter[str] = Counter()
+        self.configure(ttl)
+
+    def configure(self, ttl: float | None) -> None:
+        """설정 변경. 재사용 시간이 바뀐 경우 기존 항목은 비움"""
+        ttl = DEFAULT_COALESCE_TTL if ttl is None else ttl
+        if ttl != self.ttl:
+            self.ttl = ttl
+            self.entries.clear()
+
+    def _expire(self, now: float) -> None:
+        for key in [key for key, entry in self.entries.items() if entry.expires is not None and entry.expires <= now]:
+            del self.entries[key]
+
+    def _on_done(self, key: Hashable, entry: _Entry, task: asyncio.Future[FetchedPage | None]) -> None:
+        # 실패한 요청은 재사용하지 않음 (기다리던 크롤러에게만 결과 전달)
+        page = None if task.cancelled() or task.exception() is not None else task.result()
+        if page is None or page["status"] not in (200, 304):
+            if self.entries.get(key) is entry:
+                del self.entries[key]
+            return
+        entry.expires = time.monotonic() + self.ttl
+
+    async def fetch(
+        self, key: Hashable, consumer: Hashable, download: Callable[[], Awaitable[FetchedPage | None]]
+    ) -> FetchedPage | None:
+        """같은 키의 요청이 진행 중이거나 재사용 시간 안에 완료된 경우 그 응답을, 아니면 새로 요청한 응답을 반환
+
+        Args:
+            key (Hashable): 요청 키 (URL, 조건부 요청 헤더)
+            consumer (Hashable): 요청한 크롤러 식별자
+            download (Callable[[], Awaitable[FetchedPage | None]]): 실제 요청 함수
+
+        Returns:
+            FetchedPage | None: 응답 내용 (실패한 경우 None)
+        """
+        if self.ttl <= 0:
+            self.counter["misses"] += 1
+            return await download()
+        self._expire(time.monotonic())
+        entry = self.entries.get(key)
+        if entry is not None and consumer not in entry.consumers:
+            entry.consumers.add(consumer)
+            self.counter["hits" if entry.task.done() else "shared"] += 1
+            _coalesced_counter.add(1)
+            self.logger.debug("Coalesced request: %s", key)
+        else:
+            entry = _Entry(asyncio.ensure_future(download()), consumer)
+            entry.task.add_done_callback(lambda task, key=key, entry=entry: self._on_done(key, entry, task))
+            self.entries[key] = entry
+            self.counter["misses"] += 1
+        # 먼저 요청한 크롤러가 취소되어도 함께 기다리는 크롤러를 위해 요청은 계속 진행
+        return await asyncio.shield(entry.task)
+
+    def snapshot(self, reset: bool = False) -> dict[str, float | int]:
+        """새로 요청한 수, 완료된 응답 재사용 수, 진행 중인 요청 공유 수, 재사용 비율 반환
+
+        Args:
+            reset (bool, optional): 반환 후 통계 초기화 여부
+        """
+        coalesced = self.counter["hits"] + self.counter["shared"]
+        total = coalesced + self.counter["misses"]
+        stats: dict[str, float | int] = {
+            "misses": self.counter["misses"],
+            "hits": self.counter["hits"],
+            "shared": self.counter["shared"],
+            "hit_ratio": coalesced / total if total else 0.0,
+        }
+        if reset:
+            self.counter.clear()
+        return stats
+
+
+# 모든 크롤러가 공유하는 요청 합치기 캐시
+fetch_cache = FetchCache()
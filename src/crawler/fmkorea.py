@@ -5,8 +5,8 @@ from .base_crawler import BaseArticle, BaseCrawler
 
 
 class FmkoreaCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         data: dict[int, BaseArticle] = {}
         if (_board_name_tag := soup.select_one(".bd_tl h1 a")) is None:
             self.logger.error("Can't find board name.")
@@ -19,6 +19,17 @@ class FmkoreaCrawler(BaseCrawler):
             if (_title_tag := row.select_one(".title a")) is None:
                 self.logger.warning("Cannot get article title tag")
                 continue
+            if not (_id_str := _title_tag.attrs["href"].lstrip("/")).isnumeric():
+                self.logger.warning("Cannot get article id")
+                continue
+            _id = int(_id_str)
+            title = _title_tag.find(string=True, recursive=False).text.strip()
+            is_end = row.select_one(".hotdeal_var8Y") is not None
+            _extra = self.info_tag_parser(row.select_one(".hotdeal_info"))
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(_id, title=title, is_end=is_end, extra=_extra)) is not None:
+                data[_id] = article
+                continue
             if (_category_tag := row.select_one(".category a")) is None:
                 self.logger.warning("Cannot get article category tag")
                 continue
@@ -36,17 +47,10 @@ class FmkoreaCrawler(BaseCrawler):
                 _comment = "0"
             else:
                 _comment = _comment_tag.text.strip(" \r\n\t[]")
-            _extra = self.info_tag_parser(row.select_one(".hotdeal_info"))
-
-            if not (_id_str := _title_tag.attrs["href"].lstrip("/")).isnumeric():
-                self.logger.warning("Cannot get article id")
-                continue
-            _id = int(_id_str)
-            is_end = row.select_one(".hotdeal_var8Y") is not None
 
             data[_id] = {
                 "article_id": _id,
-                "title": _title_tag.find(string=True, recursive=False).text.strip(),
+                "title": title,
                 "category": _category_tag.text.strip(),
                 "site_name": "에펨코리아",
                 "board_name": board_name,
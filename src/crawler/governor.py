@@ -0,0 +1,118 @@
+import logging
+from collections import Counter
+from typing import TypedDict
+
+import logfire
+
+from src.util import TokenBucket
+
+_queue_delay_histogram = logfire.metric_histogram(
+    "crawler.request.queue_delay", unit="s", description="호스트별 요청 간격 조절로 대기한 시간"
+)
+
+
+class PolitenessConfig(TypedDict, total=False):
+    """호스트별 요청 속도 제한 설정
+
+    default_rps: 호스트별 초당 최대 요청 수 (0인 경우 제한 없음)
+    burst: 한 번에 몰아서 보낼 수 있는 요청 수
+    hosts: 도메인별 초당 최대 요청 수. 하위 도메인도 같은 제한을 공유함 (예: {"ppomppu.co.kr": 0.5})
+    """
+
+    default_rps: float
+    burst: int
+    hosts: dict[str, float]
+
+
+# 기본값은 기존과 동일하게 제한 없음
+DEFAULT_POLITENESS_CONFIG: PolitenessConfig = {
+    "default_rps": 0.0,
+    "burst": 1,
+    "hosts": {},
+}
+
+
+class HostGovernor:
+    """같은 호스트로 보내는 요청들이 동시에 몰리지 않도록 호스트(도메인)별 토큰 버킷으로 간격을 조절
+
+    Args:
+        config (PolitenessConfig | None, optional): 요청 속도 제한 설정
+    """
+
+    def __init__(self, config: PolitenessConfig | None = None) -> None:
+        self.logger = logging.getLogger("HostGovernor")
+        self.config: PolitenessConfig = {}
+        self.buckets: dict[str, TokenBucket | None] = {}
+        self.requests: Counter[str] = Counter()
+        self.delayed: Counter[str] = Counter()
+        self.delay_total: Counter[str] = Counter()
+        self.delay_max: dict[str, float] = {}
+        self.configure(config)
+
+    def configure(self, config: PolitenessConfig | None) -> None:
+        """설정 변경. 설정이 바뀐 경우 버킷을 새로 만듦"""
+        config = {**DEFAULT_POLITENESS_CONFIG, **(config or {})}
+        if config != self.config:
+            self.config = config
+            self.buckets.clear()
+
+    def key(self, host: str) -> str:
+        """설정된 도메인 중 호스트와 일치하거나 상위 도메인인 것을 찾아 반환, 없는 경우 호스트 그대로 반환"""
+        for domain in self.config["hosts"]:
+            if host == domain or host.endswith(f".{domain}"):
+                return domain
+        return host
+
+    def bucket(self, key: str) -> TokenBucket | None:
+        if key not in self.buckets:
+            rps = self.config["hosts"].get(key, self.config["default_rps"])
+            self.buckets[key] = TokenBucket(rps, self.config["burst"]) if rps > 0 else None
+        return self.buckets[key]
+
+    async def acquire(self, host: str) -> float:
+        """호스트로 요청을 보낼 수 있을 때까지 대기
+
+        Args:
+            host (str): 요청할 호스트
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        key = self.key(host)
+        self.requests[key] += 1
+        if (bucket := self.bucket(key)) is None:
+            return 0.0
+        wait = await bucket.acquire()
+        if wait > 0:
+            self.delayed[key] += 1
+            self.delay_total[key] += wait
+            self.delay_max[key] = max(self.delay_max.get(key, 0.0), wait)
+            self.logger.debug("Request to %s delayed %.2fs", host, wait)
+        _queue_delay_histogram.record(wait, {"host": key})
+        return wait
+
+    def snapshot(self, reset: bool = False) -> dict[str, dict[str, float | int]]:
+        """호스트별 요청 수, 대기한 요청 수, 평균/최대 대기 시간 반환
+
+        Args:
+            reset (bool, optional): 반환 후 통계 초기화 여부
+        """
+        stats: dict[str, dict[str, float | int]] = {
+            key: {
+                "requests": count,
+                "delayed": self.delayed[key],
+                "delay_avg": self.delay_total[key] / count,
+                "delay_max": self.delay_max.get(key, 0.0),
+            }
+            for key, count in self.requests.items()
+        }
+        if reset:
+            self.requests.clear()
+            self.delayed.clear()
+            self.delay_total.clear()
+            self.delay_max.clear()
+        return stats
+
+
+# 모든 크롤러가 공유하는 호스트별 요청 속도 제한
+host_governor = HostGovernor()
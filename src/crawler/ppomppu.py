@@ -1,16 +1,14 @@
 # 뽐뿌 게시판 https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu
 # 해외뽐뿌 게시판 https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu4
-import re
-from xml.etree import ElementTree
-
-from bs4 import BeautifulSoup
+from typing import Any
 
 from .base_crawler import BaseArticle, BaseCrawler
+from .rss import BaseRSSCrawler
 
 
 class PpomppuCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         if (_board_name := soup.select_one(".bbs_title .bname a")) is None:
             self.logger.error("Can't find board name.")
             return {}
@@ -35,6 +33,12 @@ class PpomppuCrawler(BaseCrawler):
             if (_title_tag := row.select_one(".baseList-title")) is None:
                 self.logger.warning("Cannot get article title tag")
                 continue
+            _id = int(_id_tag.text.strip())
+            is_end = row.select_one(".baseList-title.end2") is not None
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(_id, title=_title_tag.text.strip(), is_end=is_end)) is not None:
+                data[_id] = article
+                continue
             if (_writer_tag := row.select_one("a.baseList-name")) is None:
                 self.logger.warning("Cannot get article wrtier tag")
                 continue
@@ -53,7 +57,6 @@ class PpomppuCrawler(BaseCrawler):
                 category_tag = ""
             else:
                 category_tag = _category_tag.text.strip(" []")
-            _id = int(_id_tag.text.strip())
             writer = (
                 _writer_tag_inner.text.strip() if _writer_tag_inner.name == "span" else _writer_tag_inner.attrs["alt"]
             )
@@ -67,7 +70,7 @@ class PpomppuCrawler(BaseCrawler):
                 "writer_name": writer,
                 "crawler_name": self.name,
                 "url": f"https://www.ppomppu.co.kr/zboard/view.php?id={board_url}&no={_id}",
-                "is_end": row.select_one(".baseList-title.end2") is not None,
+                "is_end": is_end,
                 "extra": {
                     "recommend": _recommend_tag.text,
                     "view": _view_tag.text,
@@ -76,47 +79,18 @@ class PpomppuCrawler(BaseCrawler):
         return data
 
 
-class PpomppuRSSCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        tree = ElementTree.fromstring(html)
-        if (_board_title_tag := tree.find("./channel/title")) is None or (
-            _board_title := _board_title_tag.text
-        ) is None:
-            self.logger.error("Can't find board name.")
-            return {}
-        board_name = _board_title.split("-")[-1].strip()
-        rows = tree.findall("./channel/item")
+class PpomppuRSSCrawler(BaseRSSCrawler):
+    feed = {
+        "site_name": "뽐뿌",
+        "fields": {"title": "title", "link": "link", "writer_name": "author", "hits": "hits"},
+        "link_pattern": r"id=(?P<board>[\w\d]+)&no=(?P<id>\d+)",
+        "url": "https://www.ppomppu.co.kr/zboard/view.php?id={board}&no={id}",
+        "board_name_separator": "-",
+    }
 
-        data: dict[int, BaseArticle] = {}
-        for row in rows:
-            if (_url_tag := row.find("link")) is None or _url_tag.text is None:
-                self.logger.warning("Cannot get article url")
-                continue
-            if (_re_url := re.search(r"id=([\w\d]+)&no=(\d+)", _url_tag.text)) is None:
-                self.logger.warning("Cannot get board id and article id")
-                continue
-            if (_title_tag := row.find("title")) is None or _title_tag.text is None:
-                self.logger.warning("Cannot get article title")
-                continue
-            if (_writer_tag := row.find("author")) is None or _writer_tag.text is None:
-                self.logger.warning("Cannot get article author")
-                continue
-            if (_hits_tag := row.find("hits")) is None or _hits_tag.text is None:
-                self.logger.warning("Cannot get hits info")
-                continue
-            board_url: str = _re_url.group(1)
-            _id: int = int(_re_url.group(2))
-            comments, view, recommend, not_recommend = _hits_tag.text.strip("[]").split("|", 3)
-            data[_id] = {
-                "article_id": _id,
-                "title": _title_tag.text,
-                "category": "",  # 카테고리 정보 없음
-                "site_name": "뽐뿌",
-                "board_name": board_name,
-                "writer_name": _writer_tag.text,
-                "crawler_name": self.name,
-                "url": f"https://www.ppomppu.co.kr/zboard/view.php?id={board_url}&no={_id}",
-                "is_end": False,
-                "extra": {"comments": comments, "view": view, "recommend": recommend, "not_recommend": not_recommend},
-            }
-        return data
+    def extra(self, item: dict[str, str]) -> dict[str, Any] | None:
+        if not (hits := item.get("hits")):
+            self.logger.warning("Cannot get hits info")
+            return None
+        comments, view, recommend, not_recommend = hits.strip("[]").split("|", 3)
+        return {"comments": comments, "view": view, "recommend": recommend, "not_recommend": not_recommend}
@@ -1,15 +1,17 @@
 # 핫딜 게시판 https://quasarzone.com/bbs/qb_saleinfo
 import re
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from .base_crawler import BaseArticle, BaseCrawler
 
 
 class QuasarzoneMobileCrawler(BaseCrawler):
     # deprecated
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    regions = ('class="page-name"', 'class="market-info-type-list"')
+
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         # 게시판 이름
         if (_board_name := soup.select_one(".page-name")) is None:
             self.logger.error("Can't find board name, skip parsing")
@@ -36,6 +38,23 @@ class QuasarzoneMobileCrawler(BaseCrawler):
             if (_title_tag := row.select_one(".ellipsis-with-reply-cnt")) is None or not _title_tag.text:
                 self.logger.warning("Cannot find article title tag")
                 continue
+            if (_price_tag := row.select_one(".market-info-sub .text-orange")) is None:
+                self.logger.warning("Cannot get price tag")
+                continue
+            if (_is_end_tag := row.select_one(".label")) and _is_end_tag.text.strip() == "종료":
+                is_end = True
+            else:
+                is_end = False
+            _board_id = _re_url.group(1)
+            _id = int(_re_url.group(2))
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (
+                article := self.known_article(
+                    _id, title=_title_tag.text.strip(), is_end=is_end, extra={"price": _price_tag.text.strip()}
+                )
+            ) is not None:
+                data[_id] = article
+                continue
             if (_nick_tag := row.select_one(".nick")) is None or not _nick_tag.attrs.get("data-nick"):
                 self.logger.warning("Cannot find article writer tag")
                 continue
@@ -48,20 +67,11 @@ class QuasarzoneMobileCrawler(BaseCrawler):
             if (_category_tag := row.select_one(".category")) is None or not _category_tag.text:
                 self.logger.warning("Cannot get category tag")
                 continue
-            if (_price_tag := row.select_one(".market-info-sub .text-orange")) is None:
-                self.logger.warning("Cannot get price tag")
-                continue
             if not (_delivery_tag := row.select(".market-info-sub > p:nth-child(2) > span:not(.brand)")):
                 self.logger.warning("Cannot get delivery info tags")
                 continue
             else:
                 delivery = " / ".join(n.text.strip() for n in _delivery_tag if n.text.strip())
-            if (_is_end_tag := row.select_one(".label")) and _is_end_tag.text.strip() == "종료":
-                is_end = True
-            else:
-                is_end = False
-            _board_id = _re_url.group(1)
-            _id = int(_re_url.group(2))
             data[_id] = {
                 "article_id": _id,
                 "title": _title_tag.text.strip(),
@@ -83,8 +93,10 @@ class QuasarzoneMobileCrawler(BaseCrawler):
 
 
 class QuasarzoneCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    regions = ('class="l-title"', 'class="market-info-type-list')
+
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         # 게시판 이름
         if (_board_name := soup.select_one(".l-title h2")) is None:
             self.logger.error("Can't find board name, skip parsing")
@@ -111,15 +123,6 @@ class QuasarzoneCrawler(BaseCrawler):
             if (_title_tag := row.select_one(".ellipsis-with-reply-cnt")) is None or not _title_tag.text:
                 self.logger.warning("Cannot find article title tag")
                 continue
-            if (_nick_tag := row.select_one(".nick")) is None or not _nick_tag.attrs.get("data-nick"):
-                self.logger.warning("Cannot find article writer tag")
-                continue
-            if (_recommend_tag := row.select_one("td .num")) is None or not _recommend_tag.text:
-                self.logger.warning("Cannot get recommend value tag")
-                continue
-            if (_view_tag := row.select_one(".count")) is None or not _view_tag.text:
-                self.logger.warning("Cannot get view count tag")
-                continue
             if (_info_tag := row.select_one(".market-info-sub p:first-child")) is None:
                 self.logger.warning("Cannot get sub info tag")
                 continue
@@ -131,6 +134,21 @@ class QuasarzoneCrawler(BaseCrawler):
             _id = int(_re_url.group(2))
             _info = self.info_tag_parser(_info_tag)
             _category = _info.pop("category", "")
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (
+                article := self.known_article(_id, title=_title_tag.text.strip(), is_end=is_end, extra=_info)
+            ) is not None:
+                data[_id] = article
+                continue
+            if (_nick_tag := row.select_one(".nick")) is None or not _nick_tag.attrs.get("data-nick"):
+                self.logger.warning("Cannot find article writer tag")
+                continue
+            if (_recommend_tag := row.select_one("td .num")) is None or not _recommend_tag.text:
+                self.logger.warning("Cannot get recommend value tag")
+                continue
+            if (_view_tag := row.select_one(".count")) is None or not _view_tag.text:
+                self.logger.warning("Cannot get view count tag")
+                continue
             if not _category:
                 self.logger.warning("Cannot get category")
             data[_id] = {
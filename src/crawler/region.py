@@ -0,0 +1,87 @@
+import re
+from typing import AnyStr
+
+# 닫는 태그가 없는 태그 (시작 태그만 잘라냄)
+VOID_TAGS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"))
+
+# 시작/닫는 태그 하나 (따옴표 안의 속성 값은 건너뜀)
+_TAG = r"""<(/?)([a-zA-Z][\w-]*)(?:[^>"']|"[^"]*"|'[^']*')*>"""
+# 주석, 스크립트/스타일 본문, 태그 순서로 찾음. 주석과 스크립트 안의 태그는 중첩 수에 포함하지 않기 위함
+_TOKEN = rf"<!--.*?-->|<(script|style)\b(?:[^>\"']|\"[^\"]*\"|'[^']*')*>.*?</\1\s*>|{_TAG}"
+_TAG_RE = re.compile(_TAG)
+_TAG_BYTES_RE = re.compile(_TAG.encode("ascii"))
+_TOKEN_RE = re.compile(_TOKEN, re.DOTALL | re.IGNORECASE)
+_TOKEN_BYTES_RE = re.compile(_TOKEN.encode("ascii"), re.DOTALL | re.IGNORECASE)
+
+
+def _same_type(html: AnyStr, value: str) -> AnyStr:
+    """value 를 html 과 같은 타입(str, bytes)으로 변환. 영역 표시 문자열과 태그 이름은 ASCII 문자만 사용"""
+    return value.encode("ascii") if isinstance(html, bytes) else value  # type: ignore
+
+
+def find_region(html: AnyStr, marker: str) -> tuple[int, int] | None:
+    """marker 문자열이 포함된 시작 태그부터 짝이 맞는 닫는 태그까지의 위치를 찾아 반환
+
+    트리를 만들지 않고 태그만 훑어서 같은 이름의 태그 중첩 수를 셈. 주석, 스크립트/스타일 본문과 속성 값 안의 태그는
+    세지 않으며, 짝이 맞는 닫는 태그를 찾지 못한 경우 None 을 반환함.
+    디코딩하지 않은 응답 본문(bytes)에서도 찾을 수 있음.
+
+    Args:
+        html (AnyStr): HTML 문자열 또는 응답 본문
+        marker (str): 영역 시작 태그 안에 있는 문자열 (예: 'class="board_list_table"')
+
+    Returns:
+        tuple[int, int] | None: (시작 위치, 끝 위치), 찾지 못한 경우 None
+    """
+    is_bytes = isinstance(html, bytes)
+    if (idx := html.find(_same_type(html, marker))) < 0:
+        return None
+    start = html.rfind(_same_type(html, "<"), 0, idx)
+    tag_re = _TAG_BYTES_RE if is_bytes else _TAG_RE
+    # marker 가 시작 태그 안에 있는지 확인
+    if start < 0 or (m := tag_re.match(html, start)) is None or m.group(1) or m.end() <= idx:  # type: ignore
+        return None
+    tag = _tag_name(m.group(2))
+    if tag in VOID_TAGS or html[m.end() - 2 : m.end() - 1] == _same_type(html, "/"):
+        return start, m.end()
+    depth = 1
+    token_re = _TOKEN_BYTES_RE if is_bytes else _TOKEN_RE
+    for tm in token_re.finditer(html, m.end()):  # type: ignore
+        # 주석, 스크립트/스타일 본문이거나 다른 이름의 태그
+        if tm.group(3) is None or _tag_name(tm.group(3)) != tag:
+            continue
+        depth += -1 if tm.group(2) else 1
+        if depth == 0:
+            return start, tm.end()
+    return None
+
+
+def _tag_name(name: str | bytes) -> str:
+    return (name.decode("ascii") if isinstance(name, bytes) else name).lower()
+
+
+def slice_regions(html: AnyStr, markers: tuple[str, ...]) -> AnyStr | None:
+    """marker 들로 찾은 영역만 문서 순서대로 이어붙인 HTML 조각 반환
+
+    Args:
+        html (AnyStr): HTML 문자열 또는 응답 본문
+        markers (tuple[str, ...]): 영역 시작 태그 안에 있는 문자열 목록
+
+    Returns:
+        AnyStr | None: 잘라낸 HTML 조각, 하나라도 찾지 못한 경우 None
+    """
+    spans: list[tuple[int, int]] = []
+    for marker in markers:
+        if (span := find_region(html, marker)) is None:
+            return None
+        spans.append(span)
+    spans.sort()
+    fragments: list[AnyStr] = []
+    last = 0
+    for start, end in spans:
+        # 다른 영역 안에 포함된 영역은 건너뜀
+        if start < last:
+            continue
+        fragments.append(html[start:end])
+        last = end
+    return _same_type(html, "\n").join(fragments)
@@ -0,0 +1,221 @@
+import email.utils
+import logging
+import random
+import time
+from typing import Literal, TypedDict
+
+import logfire
+
+BreakerState = Literal["closed", "open", "half_open"]
+
+# 메트릭으로 내보낼 차단기 상태 값
+_STATE_VALUES: dict[BreakerState, int] = {"closed": 0, "half_open": 1, "open": 2}
+_breaker_state_gauge = logfire.metric_gauge(
+    "crawler.circuit_breaker.state", unit="1", description="호스트별 차단기 상태 (0: closed, 1: half_open, 2: open)"
+)
+_breaker_open_counter = logfire.metric_counter(
+    "crawler.circuit_breaker.opened", unit="1", description="호스트별 차단기가 열린 횟수"
+)
+_retry_counter = logfire.metric_counter("crawler.request.retries", unit="1", description="호스트별 요청 재시도 횟수")
+
+
+class RetryConfig(TypedDict, total=False):
+    """요청 재시도 설정
+
+    attempts: 최대 요청 횟수 (첫 요청 포함)
+    base_delay: 재시도 대기 시간의 기준값 (초), 재시도마다 두 배씩 늘어남
+    max_delay: 재시도 대기 시간의 최댓값 (초)
+    retry_statuses: 재시도할 HTTP 상태 코드 목록
+    max_retry_after: Retry-After 헤더 값을 따를 최대 시간 (초). 이보다 긴 경우 재시도하지 않고 차단기를 해당 시간동안 열어둠.
+    """
+
+    attempts: int
+    base_delay: float
+    max_delay: float
+    retry_statuses: list[int]
+    max_retry_after: float
+
+
+DEFAULT_RETRY_CONFIG: RetryConfig = {
+    "attempts": 3,
+    "base_delay": 0.5,
+    "max_delay": 8.0,
+    "retry_statuses": [429, 500, 502, 503, 504],
+    "max_retry_after": 10.0,
+}
+
+
+class BreakerConfig(TypedDict, total=False):
+    """호스트별 차단기 설정
+
+    failure_threshold: 차단기를 열 연속 실패 횟수
+    recovery_timeout: 차단기가 열린 뒤 시험 요청을 보내기까지 기다릴 시간 (초)
+    half_open_max: 시험 요청(half-open) 상태에서 동시에 허용할 요청 수
+    """
+
+    failure_threshold: int
+    recovery_timeout: float
+    half_open_max: int
+
+
+DEFAULT_BREAKER_CONFIG: BreakerConfig = {
+    "failure_threshold": 5,
+    "recovery_timeout": 120.0,
+    "half_open_max": 1,
+}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환
+
+    Args:
+        value (str | None): Retry-After 헤더 값
+
+    Returns:
+        float | None: 대기 시간 (초), 헤더가 없거나 해석할 수 없는 경우 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """지수 백오프와 지터를 사용하는 요청 재시도 정책
+
+    Args:
+        config (RetryConfig | None, optional): 재시도 설정, 생략한 값은 DEFAULT_RETRY_CONFIG 값 사용
+    """
+
+    def __init__(self, config: RetryConfig | None = None) -> None:
+        self.config: RetryConfig = {**DEFAULT_RETRY_CONFIG, **(config or {})}
+        self.attempts = max(1, self.config["attempts"])
+        self.retry_statuses = frozenset(self.config["retry_statuses"])
+
+    def should_retry(self, attempt: int) -> bool:
+        """attempt번째(0부터 시작) 요청이 실패한 뒤 재시도할 수 있는지 여부"""
+        return attempt + 1 < self.attempts
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """attempt번째(0부터 시작) 요청이 실패한 뒤 재시도하기 전 대기할 시간
+
+        Args:
+            attempt (int): 실패한 요청 순번
+            retry_after (float | None, optional): 서버가 알려준 대기 시간 (Retry-After)
+
+        Returns:
+            float | None: 대기 시간 (초), Retry-After 값이 max_retry_after 보다 길어 재시도하지 않아야 하는 경우 None
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= self.config["max_retry_after"] else None
+        # full jitter: 0 ~ min(max_delay, base_delay * 2^attempt) 사이의 무작위 값
+        return random.uniform(0, min(self.config["max_delay"], self.config["base_delay"] * 2**attempt))
+
+
+class CircuitBreaker:
+    """호스트 하나에 대한 차단기
+
+    연속 실패가 failure_threshold 번 이상이면 열림(open) 상태가 되어 요청을 막고, recovery_timeout 이 지나면
+    반열림(half_open) 상태에서 시험 요청을 허용함. 시험 요청이 성공하면 닫힘(closed), 실패하면 다시 열림 상태가 됨.
+
+    Args:
+        host (str): 호스트 이름
+        config (BreakerConfig): 차단기 설정
+    """
+
+    def __init__(self, host: str, config: BreakerConfig) -> None:
+        self.host = host
+        self.config = config
+        self.logger = logging.getLogger("CircuitBreaker")
+        self.state: BreakerState = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.open_until = 0.0
+        self.probes = 0
+        self.last_probe = 0.0
+
+    def _set_state(self, state: BreakerState) -> None:
+        if state == self.state:
+            return
+        self.logger.info("Circuit breaker %s: %s -> %s", self.host, self.state, state)
+        logfire.info("Circuit breaker state changed", host=self.host, state=state, previous=self.state)
+        self.state = state
+        _breaker_state_gauge.set(_STATE_VALUES[state], {"host": self.host})
+        if state == "open":
+            _breaker_open_counter.add(1, {"host": self.host})
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 확인. 반열림 상태에서는 시험 요청 수를 셈"""
+        now = time.monotonic()
+        if self.state == "open":
+            if now < self.open_until:
+                return False
+            self._set_state("half_open")
+            self.probes = 0
+        if self.state == "half_open":
+            # 시험 요청이 결과 없이 끝난 경우(취소 등)를 대비해 recovery_timeout 이 지나면 다시 허용
+            if self.probes >= self.config["half_open_max"] and now - self.last_probe < self.config["recovery_timeout"]:
+                return False
+            self.probes += 1
+            self.last_probe = now
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._set_state("closed")
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """요청 실패 기록
+
+        Args:
+            retry_after (float | None, optional): 서버가 알려준 대기 시간. 있는 경우 바로 해당 시간동안 차단기를 엶.
+        """
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.config["failure_threshold"] or retry_after:
+            now = time.monotonic()
+            self.opened_at = now
+            self.open_until = now + max(self.config["recovery_timeout"], retry_after or 0.0)
+            self._set_state("open")
+
+    def snapshot(self) -> dict[str, str | int | float]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "open_remaining": max(self.open_until - time.monotonic(), 0.0) if self.state == "open" else 0.0,
+        }
+
+
+class BreakerRegistry:
+    """호스트별 차단기 목록. 같은 호스트를 요청하는 모든 크롤러가 차단기를 공유함"""
+
+    def __init__(self, config: BreakerConfig | None = None) -> None:
+        self.config: BreakerConfig = {**DEFAULT_BREAKER_CONFIG, **(config or {})}
+        self.breakers: dict[str, CircuitBreaker] = {}
+
+    def configure(self, config: BreakerConfig | None) -> None:
+        """설정 변경. 기존 차단기의 상태는 유지함"""
+        self.config.clear()
+        self.config.update({**DEFAULT_BREAKER_CONFIG, **(config or {})})
+
+    def get(self, host: str) -> CircuitBreaker:
+        if (breaker := self.breakers.get(host)) is None:
+            breaker = self.breakers[host] = CircuitBreaker(host, self.config)
+        return breaker
+
+    def snapshot(self) -> dict[str, dict[str, str | int | float]]:
+        """호스트별 차단기 상태 반환"""
+        return {host: breaker.snapshot() for host, breaker in self.breakers.items()}
+
+
+def record_retry(host: str) -> None:
+    _retry_counter.add(1, {"host": host})
+
+
+# 모든 크롤러가 공유하는 호스트별 차단기 목록
+circuit_breakers = BreakerRegistry()
@@ -0,0 +1,135 @@
+import re
+from html import unescape
+from typing import Any, NotRequired, TypedDict
+from xml.etree import ElementTree
+
+from .base_crawler import BaseArticle, BaseCrawler
+
+# XMLPullParser 에 한 번에 넣을 문자열(응답 본문) 길이
+CHUNK_SIZE = 16 * 1024
+
+
+class FeedConfig(TypedDict):
+    """RSS/Atom 피드의 게시글 항목을 게시글 데이터로 옮기는 방법
+
+    site_name: 커뮤니티 사이트 이름
+    fields: {항목 이름: 게시글 항목 안의 태그 경로}. title, link, writer_name 은 필수이며, 하나라도 없는 게시글은 건너뜀.
+        태그 이름에는 namespaces 에 등록한 접두사 사용 가능 (예: "dc:creator", "atom:author/atom:name")
+    link_pattern: 게시글 링크에서 게시판 ID(board)와 게시글 번호(id)를 찾는 정규식
+    url: 게시글 URL 형식 (link_pattern 의 그룹 이름 사용 가능)
+    board_name_separator: 피드 제목을 이 문자열로 나눈 마지막 부분을 게시판 이름으로 사용
+    item: 게시글 항목 태그 이름 (기본값 "item", Atom 피드는 "atom:entry")
+    namespaces: {접두사: 네임스페이스 URI}
+    skip_titles: 건너뛸 게시글 제목 목록 (삭제된 글 등)
+    """
+
+    site_name: str
+    fields: dict[str, str]
+    link_pattern: str
+    url: str
+    board_name_separator: str
+    item: NotRequired[str]
+    namespaces: NotRequired[dict[str, str]]
+    skip_titles: NotRequired[list[str]]
+
+
+class BaseRSSCrawler(BaseCrawler):
+    """RSS/Atom 피드 크롤러
+
+    XMLPullParser 로 피드를 조금씩 읽으면서 게시글 항목이 끝날 때마다 게시글 데이터로 옮기고 해당 항목을 비우므로,
+    전체 트리를 메모리에 만들지 않음. 사이트별 차이는 feed 설정으로 지정하고, 설정으로 옮길 수 없는 값만 extra 메소드에서 처리.
+    """
+
+    feed: FeedConfig
+    _required_fields = ("title", "link", "writer_name")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        namespaces = self.feed.get("namespaces", {})
+        self._item_tag = self._qualify(self.feed.get("item", "item"), namespaces)
+        self._title_tags = {"title", self._qualify("atom:title", namespaces)}
+        self._field_paths = {
+            name: "/".join(self._qualify(part, namespaces) for part in path.split("/"))
+            for name, path in self.feed["fields"].items()
+        }
+        self._link_re = re.compile(self.feed["link_pattern"])
+
+    @staticmethod
+    def _qualify(tag: str, namespaces: dict[str, str]) -> str:
+        """접두사가 붙은 태그 이름을 ElementTree 형식({URI}이름)으로 변환"""
+        namespaces = {"atom": "http://www.w3.org/2005/Atom", **namespaces}
+        prefix, sep, name = tag.partition(":")
+        if not sep or prefix not in namespaces:
+            return tag
+        return f"{{{namespaces[prefix]}}}{name}"
+
+    def accepts_bytes(self, encoding: str) -> bool:
+        # XML 파서(expat)는 UTF-8 외의 멀티바이트 인코딩을 직접 읽지 못하므로 디코딩해서 넘김
+        return encoding in ("utf-8", "ascii")
+
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        parser = ElementTree.XMLPullParser(events=("end",))
+        board_name: str | None = None
+        data: dict[int, BaseArticle] = {}
+        try:
+            for offset in range(0, len(html), CHUNK_SIZE):
+                parser.feed(html[offset : offset + CHUNK_SIZE])
+                for _, elem in parser.read_events():
+                    if elem.tag == self._item_tag:
+                        if (article := self._make_article(elem)) is not None:
+                            data[article["article_id"]] = article
+                        # 다 읽은 게시글 항목은 비워서 트리가 커지지 않도록 함
+                        elem.clear()
+                    elif board_name is None and elem.tag in self._title_tags and elem.text:
+                        # 피드 제목은 게시글 항목보다 먼저 나옴
+                        board_name = unescape(elem.text).split(self.feed["board_name_separator"])[-1].strip()
+            parser.close()
+        except ElementTree.ParseError as e:
+            self.logger.error("Failed to parse XML: %s", e)
+            return {}
+        if board_name is None:
+            self.logger.error("Can't find board name.")
+            return {}
+        for article in data.values():
+            article["board_name"] = board_name
+        return data
+
+    def _make_article(self, elem: ElementTree.Element) -> BaseArticle | None:
+        """게시글 항목 하나를 게시글 데이터로 변환. 필요한 값이 없는 경우 None 반환"""
+        item: dict[str, str] = {}
+        for name, path in self._field_paths.items():
+            if (child := elem.find(path)) is not None:
+                # Atom 피드의 link 는 href 속성에 URL이 있음
+                item[name] = child.text if child.text is not None else child.get("href", "")
+        for name in self._required_fields:
+            if not item.get(name):
+                self.logger.warning("Cannot get article %s", name)
+                return None
+        if item["title"] in self.feed.get("skip_titles", []):
+            return None
+        if (_re_url := self._link_re.search(unescape(item["link"]))) is None:
+            self.logger.warning("Cannot get board id and article id")
+            return None
+        if (extra := self.extra(item)) is None:
+            return None
+        _id = int(_re_url.group("id"))
+        return {
+            "article_id": _id,
+            "title": item["title"],
+            "category": "",  # 카테고리 정보 없음
+            "site_name": self.feed["site_name"],
+            "board_name": "",
+            "writer_name": item["writer_name"],
+            "crawler_name": self.name,
+            "url": self.feed["url"].format(**_re_url.groupdict()),
+            "is_end": False,
+            "extra": extra,
+        }
+
+    def extra(self, item: dict[str, str]) -> dict[str, Any] | None:
+        """게시글 항목에서 추가 데이터(extra)를 만들어 반환. 필요한 값이 없어 건너뛰어야 하는 경우 None 반환
+
+        Args:
+            item (dict[str, str]): {항목 이름: 값}
+        """
+        return {}
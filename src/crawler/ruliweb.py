@@ -1,14 +1,19 @@
 # 유저 예판 핫딜 뽐뿌 게시판 https://bbs.ruliweb.com/market/board/1020
 # 유저 예판 핫딜 뽐뿌 게시판 (RSS) https://bbs.ruliweb.com/market/board/1020/rss
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import NavigableString, Tag
 
 from .base_crawler import BaseArticle, BaseCrawler
 
+# 제목에 포함된 경우 핫딜이 종료된 것으로 판단하는 단어
+END_KEYWORDS = ("품절", "종료", "매진", "마감")
+
 
 class RuliwebCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    regions = ('id="board_name"', 'class="board_list_table"')
+
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         # 게시판 이름
         if (_board_name := soup.select_one("#board_name")) is None:
             self.logger.error("Can't find board name, skip parsing")
@@ -41,6 +46,13 @@ class RuliwebCrawler(BaseCrawler):
                 self.logger.warning("Cannot get title text tag")
                 continue
             title = _title_text_tag.text.strip()
+            _id = int(_id_tag.attrs["value"])
+            # 제목에 ["품절", "종료", "매진", "마감"] 네 단어가 들어간 경우 핫딜이 종료된 것으로 판단
+            is_end = any(kw in title for kw in END_KEYWORDS)
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(_id, title=title, is_end=is_end)) is not None:
+                data[_id] = article
+                continue
             if (_writer_tag := row.select_one(".nick a")) is None:
                 self.logger.warning("Cannot get writer tag")
                 continue
@@ -51,7 +63,6 @@ class RuliwebCrawler(BaseCrawler):
                 self.logger.warning("Cannot get view count tag")
                 continue
             # 섬네일 모드 보기 기준 (제목 길이 제한 떄문에;;)
-            _id = int(_id_tag.attrs["value"])
             data[_id] = {
                 "article_id": _id,
                 "title": title,
@@ -61,17 +72,10 @@ class RuliwebCrawler(BaseCrawler):
                 "writer_name": _writer_tag.text.strip(),
                 "crawler_name": self.name,
                 "url": f"https://bbs.ruliweb.com/market/board/1020/read/{_id}",
-                "is_end": False,
+                "is_end": is_end,
                 "extra": {
                     "recommend": _recommend_tag.text,
                     "view": _view_tag.text,
                 },
             }
-            # 제목에 ["품절", "종료", "매진", "마감"] 네 단어가 들어간 경우 핫딜이 종료된 것으로 판단
-            for kw in ["품절", "종료", "매진", "마감"]:
-                if kw in data[_id]["title"]:
-                    data[_id]["is_end"] = True
-                    break
-            else:
-                data[_id]["is_end"] = False
         return data
@@ -1,13 +1,11 @@
 # zod 특가 게시판
 # https://zod.kr/deal
-from bs4 import BeautifulSoup
-
 from .base_crawler import BaseArticle, BaseCrawler
 
 
 class ZodCrawler(BaseCrawler):
-    async def parsing(self, html: str) -> dict[int, BaseArticle]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse(self, html: str | bytes) -> dict[int, BaseArticle]:
+        soup = self.soup(html)
         data: dict[int, BaseArticle] = {}
 
         if (_board_name_tag := soup.select_one(".app-board-title a")) is None:
@@ -42,11 +40,7 @@ class ZodCrawler(BaseCrawler):
             title_tag = article_link.select_one(".app-list-title-item")
             title = title_tag.text.strip() if title_tag else ""
 
-            category_tag = article_link.select_one(".zod-board--deal-meta-category")
-            category = category_tag.text.strip() if category_tag else ""
-
-            writer_tag = article_link.select_one(".app-list-member .tw-inline-flex")
-            writer_name = writer_tag.text.strip() if writer_tag else ""
+            is_end = "종료" in title or "품절" in title or "zod-board-list--deal-ended" in row.get("class", [])
 
             meta_tags = article_link.select(".app-list-meta.zod-board--deal-meta span")
             extra = {}
@@ -69,7 +63,16 @@ class ZodCrawler(BaseCrawler):
             if comment_tag and comment_tag.text.strip().isdigit():
                 extra["comment"] = int(comment_tag.text.strip())
 
-            is_end = "종료" in title or "품절" in title or "zod-board-list--deal-ended" in row.get("class", [])
+            # 이미 추적 중인 게시글은 나머지 값 파싱 생략
+            if (article := self.known_article(article_id, title=title, is_end=is_end, extra=extra)) is not None:
+                data[article_id] = article
+                continue
+
+            category_tag = article_link.select_one(".zod-board--deal-meta-category")
+            category = category_tag.text.strip() if category_tag else ""
+
+            writer_tag = article_link.select_one(".app-list-member .tw-inline-flex")
+            writer_name = writer_tag.text.strip() if writer_tag else ""
 
             base_url = "https://zod.kr"
             full_url = f"{base_url}{article_url}"
@@ -6,9 +6,8 @@ import os
 import signal
 import sys
 import time
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict
 
-import aiohttp
 import logfire
 import yaml
 
@@ -17,6 +16,7 @@ from src import (
     crawler,
     util,  # noqa: F401
 )
+from src.scheduler import ScheduleConfig, Scheduler
 
 __version__ = "2.2.0"
 
@@ -68,6 +68,8 @@ class CrawlerConfig(TypedDict):
     url_list: list[str]
     crawler_name: str
     description: str
+    kwargs: NotRequired[dict[str, Any]]
+    schedule: NotRequired[ScheduleConfig]
     enabled: bool
 
 
@@ -88,6 +90,9 @@ class LogfireConfig(TypedDict, total=False):
 class Config(TypedDict):
     crawlers: dict[str, CrawlerConfig]
     bots: dict[str, BotConfig]
+    parser: NotRequired[crawler.ParserConfig]
+    http: NotRequired[crawler.HttpConfig]
+    schedule: NotRequired[ScheduleConfig]
     logging: dict[str, Any]
     logfire: LogfireConfig
 
@@ -105,11 +110,13 @@ class CrawlingResult(TypedDict):
         new: 새로 추가된 게시글 목록
         update: 업데이트된 게시글 목록
         remove: 삭제된 게시글 목록
+        changes: 업데이트된 게시글별 변경 내용 (바뀐 항목과 이전 값)
     """
 
     new: list[crawler.BaseArticle]
     update: list[crawler.BaseArticle]
     remove: list[crawler.BaseArticle]
+    changes: NotRequired[list[crawler.ArticleChange]]
 
 
 class PersistenceManager:
@@ -120,7 +127,7 @@ class PersistenceManager:
 
     async def deserialize_articles(
         self, crawler_data: dict[str, crawler.ArticleCollection], crawlers: dict[str, crawler.BaseCrawler]
-    ) -> dict[str, crawler.ArticleCollection]:
+    ) -> dict[str, crawler.ArticleCache]:
         """dump 파일로부터 게시글 정보 역직렬화
 
         Args:
@@ -128,25 +135,25 @@ class PersistenceManager:
             crawlers: 현재 로딩된 크롤러 목록
 
         Returns:
-            dict[str, crawler.ArticleCollection]: 역직렬화된 게시글 캐시
+            dict[str, crawler.ArticleCache]: 역직렬화된 게시글 캐시
         """
         self.logger.info("Article dump data deserialize start")
-        article_cache: dict[str, crawler.ArticleCollection] = {}
+        article_cache: dict[str, crawler.ArticleCache] = {}
 
         for crawler_name, crawler_obj in crawler_data.items():
             if crawler_name not in crawlers.keys():
                 self.logger.warning("Unknown crawler name in dump file: %s", crawler_name)
 
-            article_cache[crawler_name] = crawler.ArticleCollection(crawler_obj)
+            article_cache[crawler_name] = crawler.ArticleCache(crawler_obj)
             self.logger.info("%s: %d article(s) loaded", crawler_name, len(article_cache[crawler_name]))
             self.logger.debug(
-                f"{crawler_name}: article_id range: [{min(article_cache[crawler_name], default=0)}, {max(article_cache[crawler_name], default=0)}]"
+                f"{crawler_name}: article_id range: [{article_cache[crawler_name].min_key(0)}, {article_cache[crawler_name].max_key(0)}]"
             )
 
         # 크롤러는 등록되어 있으나, 게시글 데이터가 없어 초기화가 필요한 경우
         for crawler_name in crawlers.keys():
             if crawler_name not in article_cache.keys():
-                article_cache[crawler_name] = crawler.ArticleCollection()
+                article_cache[crawler_name] = crawler.ArticleCache()
 
         self.logger.info("Article dump data deserialize complete")
         return article_cache
@@ -173,7 +180,7 @@ class PersistenceManager:
 
     async def load_data(
         self, dump_file_path: str, crawlers: dict[str, crawler.BaseCrawler], bots: dict[str, bot.BaseBot]
-    ) -> dict[str, crawler.ArticleCollection]:
+    ) -> dict[str, crawler.ArticleCache]:
         """주어진 경로의 json 파일로부터 데이터 로드
 
         Args:
@@ -182,19 +189,19 @@ class PersistenceManager:
             bots: 현재 로딩된 봇 목록
 
         Returns:
-            dict[str, crawler.ArticleCollection]: 로드된 게시글 캐시
+            dict[str, crawler.ArticleCache]: 로드된 게시글 캐시
         """
         if not os.path.isfile(dump_file_path):
             self.logger.warning("Dump file doesn't exists")
             # 빈 article_cache 초기화
-            return {crawler_name: crawler.ArticleCollection() for crawler_name in crawlers.keys()}
+            return {crawler_name: crawler.ArticleCache() for crawler_name in crawlers.keys()}
 
         try:
             with open(dump_file_path, "r", encoding="utf-8") as f:
                 data: DumpedData = json.load(f)
         except json.JSONDecodeError:
             self.logger.error("Dump JSON file decode error occured")
-            return {crawler_name: crawler.ArticleCollection() for crawler_name in crawlers.keys()}
+            return {crawler_name: crawler.ArticleCache() for crawler_name in crawlers.keys()}
 
         self.logger.info("App version %s, dump file version %s", __version__, data["version"])
 
@@ -207,7 +214,7 @@ class PersistenceManager:
 
     async def dump_data(
         self,
-        article_cache: dict[str, crawler.ArticleCollection],
+        article_cache: dict[str, crawler.ArticleCache],
         bots: dict[str, bot.BaseBot],
         dump_file_path: str = "dump.json",
     ):
@@ -232,22 +239,64 @@ class BotManager:
         self.logger = logging.getLogger("BotManager")
         self.closed = False
         self.persistence = PersistenceManager()
+        self.scheduler = Scheduler()
+        # 크롤러별 크롤링 중복 실행 방지용 락
+        self._crawl_locks: dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task] = set()
 
     async def init_session(self):
         """세션 초기화"""
         self.logger.info("Initializing start")
-        timeout = aiohttp.ClientTimeout(total=20)
-        self.session = aiohttp.ClientSession(headers=HEADERS, trust_env=True, timeout=timeout)
+        self.http_config: crawler.HttpConfig = {}
+        self.session, self.connection_stats = crawler.create_session(self.http_config, HEADERS)
 
         # Logfire HTTP 인스트루멘테이션
         logfire.instrument_aiohttp_client()
 
+        self.executor: crawler.ParseExecutor = crawler.ParseExecutor()
+        self.parser_config: crawler.ParserConfig = {}
         self.crawlers: dict[str, crawler.BaseCrawler] = {}
         self.bots: dict[str, bot.BaseBot] = {}
-        self.article_cache: dict[str, crawler.ArticleCollection] = {}
+        self.article_cache: dict[str, crawler.ArticleCache] = {}
         # self.article_cache: dict[str, crawler.ArticleCollection] = {k: crawler.ArticleCollection() for k in self.crawlers.keys()}
         await self.load()
 
+    async def init_http(self, http_config: crawler.HttpConfig):
+        """크롤러 HTTP 세션 생성. 세션 설정이 동일한 경우 기존 세션 재사용
+
+        차단기, 요청 속도 제한, 응답 공유 설정은 세션을 다시 만들지 않고 바로 적용함.
+        (진행 중인 크롤링이 사용하는 세션을 닫지 않기 위함)
+
+        Args:
+            http_config (crawler.HttpConfig): HTTP 세션 설정
+        """
+        crawler.circuit_breakers.configure(http_config.get("circuit_breaker"))
+        crawler.host_governor.configure(http_config.get("politeness"))
+        crawler.fetch_cache.configure(http_config.get("coalesce_ttl"))
+        if crawler.session_config(http_config) == crawler.session_config(self.http_config):
+            self.http_config = http_config
+            return
+        old_session = self.session
+        self.session, self.connection_stats = crawler.create_session(http_config, HEADERS)
+        self.http_config = http_config
+        for cwr in self.crawlers.values():
+            cwr.session = self.session
+        await old_session.close()
+        self.logger.info("HTTP session initialized: %s", http_config)
+
+    async def init_executor(self, parser_config: crawler.ParserConfig):
+        """HTML 파싱 실행기 생성. 설정이 동일한 경우 기존 실행기 재사용
+
+        Args:
+            parser_config (crawler.ParserConfig): 파싱 실행기 설정
+        """
+        if parser_config == self.parser_config:
+            return
+        self.executor.shutdown()
+        self.executor = crawler.ParseExecutor.from_config(parser_config)
+        self.parser_config = parser_config
+        self.logger.info("Parse executor initialized: %s", self.executor.mode)
+
     async def init_crawlers(self, crawlers: dict[str, CrawlerConfig]):
         """크롤러 객체 생성/재사용/초기화 등 수행
 
@@ -265,7 +314,13 @@ class BotManager:
             if crawler_name in _crawlers_old:
                 _cwr = _crawlers_old.pop(crawler_name)
                 # 설정이 동일한 경우 재사용
-                if _cwr.url_list == crawler_config["url_list"] and _cwr.cls_name == crawler_config["crawler_name"]:
+                if (
+                    _cwr.url_list == crawler_config["url_list"]
+                    and _cwr.cls_name == crawler_config["crawler_name"]
+                    and _cwr.config == crawler_config.get("kwargs", {})
+                ):
+                    _cwr.session = self.session
+                    _cwr.executor = self.executor
                     self.crawlers[crawler_name] = _cwr
                     self.logger.info("Crawler reused: %s (%s)", crawler_name, crawler_config["crawler_name"])
                     continue
@@ -281,7 +336,13 @@ class BotManager:
                 self.logger.warning("Invalid crawler class: %s", crawler_cls_name)
                 continue
             # 크롤러 객체 생성
-            self.crawlers[crawler_name] = crawler_cls(crawler_name, crawler_config["url_list"], self.session)
+            self.crawlers[crawler_name] = crawler_cls(
+                crawler_name,
+                crawler_config["url_list"],
+                self.session,
+                executor=self.executor,
+                **crawler_config.get("kwargs", {}),
+            )
             self.logger.info("Crawler initialized: %s (%s)", crawler_name, crawler_cls_name)
         # 남은 크롤러 객체 목록 출력 (삭제될 크롤러)
         for k, v in _crawlers_old.items():
@@ -289,6 +350,15 @@ class BotManager:
             self.logger.info("Crawler removed or disabled: %s (%s)", k, v.cls_name)
         self.logger.info("%d crawler(s) initialized", len(self.crawlers))
 
+    def init_scheduler(self, crawlers: dict[str, CrawlerConfig], default: ScheduleConfig):
+        """활성화된 크롤러들의 실행 주기 설정을 스케줄러에 반영
+
+        Args:
+            crawlers (dict[str, CrawlerConfig]): 크롤러 설정 정보 목록
+            default (ScheduleConfig): 모든 크롤러에 적용할 기본 실행 주기 설정
+        """
+        self.scheduler.sync({name: {**default, **crawlers[name].get("schedule", {})} for name in self.crawlers.keys()})
+
     async def init_bots(self, bots: dict[str, BotConfig]):
         """봇 객체 생성/재사용/초기화 등 수행
 
@@ -356,8 +426,14 @@ class BotManager:
         except (yaml.YAMLError, json.JSONDecodeError) as e:
             self.logger.error("Config file decode error occurred: %s", e)
             return
+        # HTTP 세션 초기화
+        await self.init_http(config.get("http", {}))
+        # 파싱 실행기 초기화
+        await self.init_executor(config.get("parser", {}))
         # 크롤러 초기화
         await self.init_crawlers(config["crawlers"])
+        # 크롤러별 실행 주기 설정
+        self.init_scheduler(config["crawlers"], config.get("schedule", {}))
         # 메신저 봇 초기화
         await self.init_bots(config["bots"])
 
@@ -372,6 +448,8 @@ class BotManager:
     async def _crawling(self, name: str, cwr: crawler.BaseCrawler) -> CrawlingResult:
         """크롤러 객체를 받아 크롤링 수행, 이후 새로운 게시글, 업데이트된 게시글, 삭제된 게시글을 각각 반환
 
+        같은 크롤러의 크롤링이 아직 진행 중인 경우 건너뛰며, 크롤러별 제한 시간(deadline)을 넘기면 실패로 처리.
+
         Args:
             name (str): 크롤러 이름
             cwr (crawler.BaseCrawler): 크롤러 객체
@@ -379,21 +457,49 @@ class BotManager:
         Returns:
             CrawlingResult: 크롤링 결과 (각각 새 글, 업데이트된 글, 삭제된 글 목록)
         """
-        result: CrawlingResult = {"new": [], "update": [], "remove": []}
-        # 크롤러로부터 글 목록 불러오기
-        recent_data: crawler.ArticleCollection = await cwr.get()
+        lock = self._crawl_locks.setdefault(name, asyncio.Lock())
+        if lock.locked():
+            self.logger.warning("%s: Previous crawling is still running, skip", name)
+            return {"new": [], "update": [], "remove": []}
+        async with lock:
+            deadline = self.scheduler.deadline(name)
+            try:
+                async with asyncio.timeout(deadline):
+                    # 크롤러로부터 글 목록 불러오기 (이미 추적 중인 게시글은 크롤러에서 일부 값만 파싱)
+                    recent_data: crawler.ArticleCollection = await cwr.get(known=self.article_cache.get(name))
+            except TimeoutError:
+                cwr.failures += 1
+                self.logger.warning("%s: Crawling deadline exceeded (%.1fs)", name, deadline)
+                logfire.warn("Crawling deadline exceeded", crawler_name=name, deadline=deadline)
+                return {"new": [], "update": [], "remove": []}
+            return await self._compare(name, cwr, recent_data)
+
+    async def _compare(
+        self, name: str, cwr: crawler.BaseCrawler, recent_data: crawler.ArticleCollection
+    ) -> CrawlingResult:
+        """새로 크롤링한 글 목록을 게시글 캐시와 비교하여 새 글, 업데이트된 글, 삭제된 글을 각각 반환하고 캐시 갱신
+
+        Args:
+            name (str): 크롤러 이름
+            cwr (crawler.BaseCrawler): 크롤러 객체
+            recent_data (crawler.ArticleCollection): 크롤링한 글 목록
+
+        Returns:
+            CrawlingResult: 비교 결과 (각각 새 글, 업데이트된 글, 삭제된 글 목록)
+        """
+        result: CrawlingResult = {"new": [], "update": [], "remove": [], "changes": []}
         if not recent_data:
             # 글 목록이 비어있는 경우 (파싱에 실패한 경우) 상태 변경 없이 빈 값 반환.
             # self.logger.warning(f"{cwr.__class__.__name__}: Crawling result is empty!!")
             return result
         # 글 번호 최소
-        id_min: int = min(recent_data.keys())
+        id_min: int = recent_data.min_key(0)
         self.logger.debug("%s: %d article(s) crawled", cwr.__class__.__name__, len(recent_data))
-        self.logger.debug("%s: article_id range: [%d, %d]", cwr.__class__.__name__, id_min, max(recent_data.keys()))
+        self.logger.debug("%s: article_id range: [%d, %d]", cwr.__class__.__name__, id_min, recent_data.max_key(0))
 
         # 초기화
         if name not in self.article_cache:
-            self.article_cache[name] = crawler.ArticleCollection()
+            self.article_cache[name] = crawler.ArticleCache()
         if not self.article_cache[name]:
             self.article_cache[name].update(recent_data)
             self.logger.info("%s: Article cache initialized, skip crawling", cwr.__class__.__name__)
@@ -405,81 +511,68 @@ class BotManager:
         for bot_name, bot_instance in self.bots.items():
             await bot_instance.remove_expired_msg_obj(name, id_min)
         # 새로 추가된 글을 result["new"]에 저장 후 메모리 업데이트
-        id_cache_max: int = max(self.article_cache[name].keys(), default=0)
+        id_cache_max: int = self.article_cache[name].max_key(0)
         _new_articles = recent_data.get_new(id_cache_max)
-        result["new"].extend(_new_articles.values())
         self.article_cache[name].update(_new_articles)
+        result["new"].extend(self.article_cache[name][article_id] for article_id in _new_articles)
+        # 메시지 업데이트가 필요한 경우 (품절, 제목 변경, 가격 변경 등). 게시글 지문이 다른 게시글만 항목별로 비교
+        result["changes"] = crawler.detect_changes(self.article_cache[name], recent_data)
+        result["update"].extend(change["article"] for change in result["changes"])
         # 기존 게시글 기준으로 탐색
         for article_id, article in self.article_cache[name].items():
             # 삭제된 글(기존 게시글의 ID가 새 크롤링 결과의 key에 없음)이라면 result["remove"]에 저장
             if article_id not in recent_data:
                 result["remove"].append(article)
                 continue
-
-            new_article = recent_data[article_id]
-            # 메시지 업데이트가 필요한 경우 (품절, 제목 변경, 가격 변경 등)
-            if article["is_end"] != new_article["is_end"]:
-                # self.logger.debug("Status update detected: {title} ({url}) -> {status}".format(status=new_article["is_end"], **article))
-                result["update"].append(article)
-            elif article["title"] != new_article["title"]:
-                # crawling 메서드의 로깅과 중복돼서 주석 처리
-                # self.logger.debug("Title update detect: {title} ({url}) -> {new_title}".format(new_title=new_article["title"], **article))
-                result["update"].append(article)
-            elif article.get("extra") and article["extra"].get("price") != new_article.get("extra", {}).get("price"):
-                result["update"].append(article)
-            article.update(new_article)
+            # 변경 확인 항목 외의 값(추천/조회 수, 카테고리 등)도 최신 값으로 유지
+            article.update(recent_data[article_id])
 
         # 삭제 확인된 글 객체와 메시지 객체를 메모리에서 제거
         for article in result["remove"]:
             self.article_cache[name].pop(article["article_id"], None)
         return result
 
-    async def crawling(self) -> CrawlingResult:
-        """크롤러 객체들을 이용해 크롤링을 병렬 수행하고 결과를 반환
-
-        Returns:
-            CrawlingResult: 크롤링 결과 (새로운 글, 업데이트된 글, 삭제된 글 목록)
-        """
-        # 메시지 새로 보내기, 기존 메시지 업데이트, 기존 메시지 삭제
-        result: CrawlingResult = {"new": [], "update": [], "remove": []}
-        # 크롤러별로 웹페이지 크롤링 후 합쳐서 어떤 메시지를 새로 보내거나 정리할지 결정
-        st = time.time()
-        results: list[CrawlingResult] = await asyncio.gather(
-            *[self._crawling(name, cwr) for name, cwr in self.crawlers.items()]
+    def log_connection_stats(self):
+        """직전 기록 이후의 연결 재사용 통계 기록"""
+        conn_stats = self.connection_stats.snapshot(reset=True)
+        self.logger.debug(
+            "Connection: %d request(s), %d created, %d reused, DNS cache %d hit / %d miss, %.2fs queued",
+            conn_stats["requests"],
+            conn_stats["created"],
+            conn_stats["reused"],
+            conn_stats["dns_hit"],
+            conn_stats["dns_miss"],
+            conn_stats["queued_time"],
         )
-        for d in results:
-            result["new"].extend(d["new"])
-            result["update"].extend(d["update"])
-            result["remove"].extend(d["remove"])
-        # logging
-        if self.logger.isEnabledFor(logging.DEBUG):
-            for article in result["new"]:
-                self.logger.debug("New: %s (%s)", article["title"], article["url"])
-            for article in result["update"]:
-                self.logger.debug("Update: %s (%s)", article["title"], article["url"])
-            for article in result["remove"]:
-                self.logger.debug("Remove: %s (%s)", article["title"], article["url"])
-        crawling_time = time.time() - st
-        self.logger.info(
-            "Result: %.2fs, %d/%d/%d", crawling_time, len(result["new"]), len(result["update"]), len(result["remove"])
-        )
-        if crawling_time > 30:
-            self.logger.warning("Crawling time took so long: %s", crawling_time)
-
-        # Logfire 메트릭 로깅
-        logfire.info(
-            "Crawling completed",
-            duration=crawling_time,
-            new_count=len(result["new"]),
-            update_count=len(result["update"]),
-            remove_count=len(result["remove"]),
-            total_articles=len(result["new"]) + len(result["update"]) + len(result["remove"]),
-        )
-
-        if crawling_time > 30:
-            logfire.warn("Slow crawling detected", duration=crawling_time, threshold=30)
-
-        return result
+        logfire.info("Connection stats", **conn_stats)
+        # 열려있는 호스트별 차단기
+        for host, breaker_stats in crawler.circuit_breakers.snapshot().items():
+            if breaker_stats["state"] != "closed":
+                self.logger.info("Circuit breaker %s: %s", host, breaker_stats)
+        logfire.info("Circuit breaker stats", breakers=crawler.circuit_breakers.snapshot())
+        # 호스트별 요청 간격 조절로 대기한 시간
+        governor_stats = crawler.host_governor.snapshot(reset=True)
+        for host, host_stats in governor_stats.items():
+            if host_stats["delayed"]:
+                self.logger.debug(
+                    "Politeness %s: %d/%d request(s) delayed, avg %.2fs, max %.2fs",
+                    host,
+                    host_stats["delayed"],
+                    host_stats["requests"],
+                    host_stats["delay_avg"],
+                    host_stats["delay_max"],
+                )
+        logfire.info("Politeness stats", hosts=governor_stats)
+        # 여러 크롤러가 같은 URL을 요청해 응답을 공유한 수
+        fetch_stats = crawler.fetch_cache.snapshot(reset=True)
+        if fetch_stats["hits"] or fetch_stats["shared"]:
+            self.logger.debug(
+                "Fetch cache: %d download(s), %d hit(s), %d shared in flight",
+                fetch_stats["misses"],
+                fetch_stats["hits"],
+                fetch_stats["shared"],
+            )
+        logfire.info("Fetch cache stats", **fetch_stats)
 
     async def send(self, d: CrawlingResult):
         """크롤링 결과를 바탕으로 메시지 전송, 수정, 삭제
@@ -497,29 +590,83 @@ class BotManager:
         for bot_name, bot_instance in self.bots.items():
             await bot_instance.delete_iter(d["remove"])
 
-    async def _run(self):
-        """실제 크롤링 및 메시지 전송을 1회 수행, 예외 처리 포함"""
-        with logfire.span("crawling_cycle"):
+    async def _run_crawler(self, name: str) -> CrawlingResult:
+        """크롤러 하나의 크롤링 및 메시지 전송을 수행하고, 결과에 따라 다음 실행 예약
+
+        크롤러마다 따로 실행되므로 먼저 끝난 크롤러의 결과는 느린 크롤러를 기다리지 않고 바로 봇에 넘김.
+
+        Args:
+            name (str): 크롤러 이름
+
+        Returns:
+            CrawlingResult: 크롤링 결과 (실패한 경우 빈 결과)
+        """
+        started = time.monotonic()
+        new_count = 0
+        failed = True
+        result: CrawlingResult = {"new": [], "update": [], "remove": []}
+        with logfire.span("crawling_cycle {crawler_name}", crawler_name=name):
             try:
-                # 크롤링
-                with logfire.span("crawling"):
-                    data = await self.crawling()
-                # 메시지 보내기
+                if (cwr := self.crawlers.get(name)) is None:
+                    return result
+                result = await self._crawling(name, cwr)
+                failed = cwr.failures > 0
+                new_count = len(result["new"])
+                elapsed = time.monotonic() - started
+                self.logger.log(
+                    logging.INFO if any(result.values()) else logging.DEBUG,
+                    "Result: %s %.2fs, %d/%d/%d",
+                    name,
+                    elapsed,
+                    len(result["new"]),
+                    len(result["update"]),
+                    len(result["remove"]),
+                )
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self._log_articles(result)
                 with logfire.span("send_messages"):
-                    await self.send(data)
+                    await self.send(result)
             except Exception as e:
                 self.logger.exception(e)
-                logfire.error("Crawling cycle failed", error=str(e))
+                logfire.error("Crawling cycle failed", crawler_name=name, error=str(e))
+            finally:
+                delay = self.scheduler.report(name, new_count, failed, started)
+                logfire.info(
+                    "Crawler scheduled",
+                    crawler_name=name,
+                    new_count=new_count,
+                    failed=failed,
+                    next_delay=delay,
+                )
+        return result
+
+    def _log_articles(self, result: CrawlingResult):
+        """크롤링 결과의 새 글, 업데이트된 글 (바뀐 항목), 삭제된 글을 디버그 로그로 기록"""
+        for article in result["new"]:
+            self.logger.debug("New: %s (%s)", article["title"], article["url"])
+        for change in result.get("changes", []):
+            article = change["article"]
+            self.logger.debug("Update: %s (%s) [%s]", article["title"], article["url"], ", ".join(change["fields"]))
+        for article in result["remove"]:
+            self.logger.debug("Remove: %s (%s)", article["title"], article["url"])
 
     async def run(self):
-        """크롤링 및 메시지 전송 작업을 주어진 시간(60초)마다 한번씩 영원히 반복"""
+        """크롤러별 실행 주기에 맞춰 크롤링 및 메시지 전송 작업을 영원히 반복"""
         with logfire.span("init_application"):
             await self.init_session()
         self.logger.info("Loop start")
         loop = asyncio.get_running_loop()
+        stats_logged = time.monotonic()
         while not self.closed:
-            loop.create_task(self._run())
-            await asyncio.sleep(60)
+            for name in self.scheduler.pop_due():
+                task = loop.create_task(self._run_crawler(name))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            # 연결 재사용 통계는 60초마다 기록
+            if time.monotonic() - stats_logged >= 60:
+                self.log_connection_stats()
+                stats_logged = time.monotonic()
+            await self.scheduler.wait(timeout=60)
         self.logger.debug("Loop stop (bot closed)")
 
     @logfire.instrument("close_application")
@@ -535,6 +682,10 @@ class BotManager:
             self.logger.debug("cralwer close: %s", k)
             if not cwr.session.closed:
                 await cwr.close()
+        if not self.session.closed:
+            await self.session.close()
+        # 파싱 실행기 종료
+        self.executor.shutdown()
         # 봇 세션 닫기
         for bot_name, bot_instance in self.bots.items():
             self.logger.debug("bot close: %s", bot_name)
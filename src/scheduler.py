@@ -0,0 +1,233 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import TypedDict
+
+# 새 글 비율 지수이동평균 가중치
+RATE_ALPHA = 0.3
+# 새 글이 없을 때 한 번에 늘어날 수 있는 주기 배수
+GROWTH_LIMIT = 1.5
+
+
+class ScheduleConfig(TypedDict, total=False):
+    """크롤러 실행 주기 설정
+
+    interval: 처음 실행 주기 (초)
+    min_interval: 최소 실행 주기 (초)
+    max_interval: 최대 실행 주기 (초)
+    jitter: 실행 주기에 더할 무작위 편차 비율 (0.1인 경우 ±10%)
+    backoff: 크롤링 실패 시 실행 주기에 곱할 배수 (연속 실패 횟수만큼 거듭제곱)
+    max_backoff: 크롤링 실패 시 최대 실행 주기 (초)
+    target_new: 크롤링 1회당 목표로 하는 새 글 수. 새 글이 올라오는 속도에 맞춰 주기를 조절하는 기준.
+    deadline: 크롤링 1회의 제한 시간 (초). 넘기는 경우 취소하고 실패로 처리.
+    """
+
+    interval: float
+    min_interval: float
+    max_interval: float
+    jitter: float
+    backoff: float
+    max_backoff: float
+    target_new: float
+    deadline: float
+
+
+# 기본값은 기존과 동일하게 60초 고정 주기
+DEFAULT_SCHEDULE_CONFIG: ScheduleConfig = {
+    "interval": 60,
+    "min_interval": 60,
+    "max_interval": 60,
+    "jitter": 0.0,
+    "backoff": 2.0,
+    "max_backoff": 600,
+    "target_new": 1.0,
+    "deadline": 50,
+}
+
+
+class CrawlerSchedule:
+    """크롤러 하나의 실행 주기 상태
+
+    Args:
+        name (str): 크롤러 이름
+        config (ScheduleConfig): 실행 주기 설정
+    """
+
+    def __init__(self, name: str, config: ScheduleConfig) -> None:
+        self.name = name
+        self.config: ScheduleConfig = {}
+        self.interval = 0.0
+        # 초당 새 글 수 (지수이동평균)
+        self.rate = 0.0
+        self.samples = 0
+        self.failures = 0
+        self.last_run: float | None = None
+        self.next_run = 0.0
+        self.configure(config)
+
+    def configure(self, config: ScheduleConfig) -> None:
+        """설정 변경. 현재 주기는 새 최소/최대 범위 안으로 조정됨"""
+        config = {**DEFAULT_SCHEDULE_CONFIG, **config}
+        if config["min_interval"] > config["max_interval"]:
+            config["min_interval"], config["max_interval"] = config["max_interval"], config["min_interval"]
+        if config == self.config:
+            return
+        interval = self.interval if self.config else config["interval"]
+        self.config = config
+        self.interval = self._clamp(interval)
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.config["min_interval"]), self.config["max_interval"])
+
+    def next_delay(self, new_count: int, failed: bool, started: float) -> float:
+        """크롤링 결과를 반영해 다음 실행까지 기다릴 시간 계산
+
+        Args:
+            new_count (int): 이번 크롤링에서 찾은 새 글 수
+            failed (bool): 크롤링 실패 여부
+            started (float): 이번 크롤링 시작 시각 (time.monotonic)
+
+        Returns:
+            float: 다음 실행까지 기다릴 시간 (초)
+        """
+        if failed:
+            self.failures += 1
+            delay = min(
+                self.interval * self.config["backoff"] ** self.failures,
+                max(self.config["max_backoff"], self.interval),
+            )
+        else:
+            self.failures = 0
+            if self.last_run is not None:
+                elapsed = max(started - self.last_run, 1e-3)
+                if self.samples == 0:
+                    self.rate = new_count / elapsed
+                else:
+                    self.rate = RATE_ALPHA * (new_count / elapsed) + (1 - RATE_ALPHA) * self.rate
+                self.samples += 1
+                target = self.config["target_new"] / self.rate if self.rate > 0 else self.config["max_interval"]
+                # 조용한 게시판도 한 번에 최대 주기로 늘리지 않고 조금씩 늘림
+                self.interval = self._clamp(min(target, self.interval * GROWTH_LIMIT))
+            self.last_run = started
+            delay = self.interval
+        if self.config["jitter"]:
+            delay *= 1 + random.uniform(-self.config["jitter"], self.config["jitter"])
+        return max(delay, 0.0)
+
+
+class Scheduler:
+    """크롤러별 실행 주기를 관리하는 힙 기반 스케줄러
+
+    각 크롤러는 실행이 끝날 때마다 결과(새 글 수, 실패 여부)에 따라 다음 실행 시각이 정해지며,
+    실행 중인 크롤러는 힙에 들어있지 않으므로 같은 크롤러가 동시에 실행되지 않음.
+    """
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger("Scheduler")
+        self.schedules: dict[str, CrawlerSchedule] = {}
+        self.running: set[str] = set()
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+
+    def _push(self, name: str, when: float) -> None:
+        self.schedules[name].next_run = when
+        heapq.heappush(self._heap, (when, next(self._seq), name))
+        self._changed.set()
+
+    def sync(self, configs: dict[str, ScheduleConfig]) -> None:
+        """크롤러 목록과 설정을 반영. 새로 추가된 크롤러는 바로 실행되도록 예약
+
+        Args:
+            configs (dict[str, ScheduleConfig]): {크롤러 이름: 실행 주기 설정}
+        """
+        for name in list(self.schedules):
+            if name not in configs:
+                # 힙에 남아있는 항목은 pop_due 에서 건너뜀
+                del self.schedules[name]
+        now = time.monotonic()
+        for name, config in configs.items():
+            if name in self.schedules:
+                self.schedules[name].configure(config)
+                continue
+            self.schedules[name] = CrawlerSchedule(name, config)
+            if name not in self.running:
+                self._push(name, now)
+
+    def pop_due(self, now: float | None = None) -> list[str]:
+        """실행 시각이 된 크롤러 이름 목록을 반환하고 실행 중으로 표시
+
+        Args:
+            now (float | None, optional): 현재 시각 (time.monotonic), 생략 시 현재 시각 사용
+
+        Returns:
+            list[str]: 실행할 크롤러 이름 목록
+        """
+        now = time.monotonic() if now is None else now
+        due: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, name = heapq.heappop(self._heap)
+            schedule = self.schedules.get(name)
+            # 삭제됐거나 다시 예약되어 유효하지 않은 항목
+            if schedule is None or schedule.next_run != when or name in self.running:
+                continue
+            self.running.add(name)
+            due.append(name)
+        return due
+
+    def report(self, name: str, new_count: int, failed: bool, started: float) -> float:
+        """크롤링 결과를 반영해 다음 실행 예약
+
+        Args:
+            name (str): 크롤러 이름
+            new_count (int): 새 글 수
+            failed (bool): 크롤링 실패 여부
+            started (float): 크롤링 시작 시각 (time.monotonic)
+
+        Returns:
+            float: 다음 실행까지 기다릴 시간 (초), 삭제된 크롤러인 경우 0
+        """
+        self.running.discard(name)
+        if (schedule := self.schedules.get(name)) is None:
+            return 0.0
+        delay = schedule.next_delay(new_count, failed, started)
+        if failed:
+            self.logger.warning("%s: crawling failed %d time(s), retry after %.1fs", name, schedule.failures, delay)
+        self._push(name, time.monotonic() + delay)
+        return delay
+
+    def deadline(self, name: str) -> float:
+        """크롤러의 크롤링 1회 제한 시간 (초)"""
+        if (schedule := self.schedules.get(name)) is None:
+            return DEFAULT_SCHEDULE_CONFIG["deadline"]
+        return schedule.config["deadline"]
+
+    def next_wakeup(self, now: float | None = None) -> float | None:
+        """다음 실행 시각까지 남은 시간 (초). 예약된 크롤러가 없는 경우 None"""
+        now = time.monotonic() if now is None else now
+        while self._heap:
+            when, _, name = self._heap[0]
+            schedule = self.schedules.get(name)
+            if schedule is None or schedule.next_run != when or name in self.running:
+                heapq.heappop(self._heap)
+                continue
+            return max(when - now, 0.0)
+        return None
+
+    async def wait(self, timeout: float | None = None) -> None:
+        """다음 크롤러 실행 시각이 되거나 예약이 바뀔 때까지 대기
+
+        Args:
+            timeout (float | None, optional): 최대 대기 시간 (초)
+        """
+        delay = self.next_wakeup()
+        if timeout is not None:
+            delay = timeout if delay is None else min(delay, timeout)
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
@@ -0,0 +1,204 @@
+"""저장된 게시판 페이지(tests/fixtures)를 이용한 오프라인 파서 벤치마크 도구.
+
+크롤러별, 파서 백엔드별로 파싱 소요 시간, 페이지당 게시글 수, 메모리 사용량을 측정하여 출력하고 JSON 파일로 저장.
+사용법: python -m src.tools.benchmark --iterations 50 --output benchmark.json
+"""
+
+import asyncio
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import TypedDict
+
+import aiohttp
+import typer
+from bs4.builder import builder_registry
+
+from src import crawler
+from src.crawler.region import slice_regions
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures")
+
+
+class BenchmarkResult(TypedDict):
+    fixture: str
+    crawler: str
+    backend: str
+    iterations: int
+    page_bytes: int
+    region_bytes: int
+    articles: int
+    time_mean: float
+    time_median: float
+    time_min: float
+    time_max: float
+    peak_memory: int
+    retained_memory: int
+    retained_blocks: int
+    speedup: float
+
+
+def load_fixtures(fixture_dir: str = FIXTURE_DIR) -> dict[str, dict[str, str]]:
+    """fixtures.json 파일로부터 저장된 페이지 목록을 읽어서 반환"""
+    with open(os.path.join(fixture_dir, "fixtures.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def measure(
+    cwr: crawler.BaseCrawler, raw: bytes, encoding: str, iterations: int
+) -> tuple[list[float], int, int, int, int]:
+    """주어진 크롤러로 응답 본문을 반복 파싱하여 소요 시간 및 메모리 사용량 측정 (디코딩 포함)
+
+    Args:
+        cwr (crawler.BaseCrawler): 크롤러 객체
+        raw (bytes): 응답 본문
+        encoding (str): 응답 본문 인코딩
+        iterations (int): 반복 횟수
+
+    Returns:
+        tuple: 회차별 소요 시간 목록, 파싱된 게시글 수, 최대 메모리 사용량, 결과 객체 메모리 크기, 결과 객체 블록 수
+    """
+    # 워밍업 (soupsieve 선택자 컴파일 캐시 등)
+    articles = len(cwr.parse_page(raw, encoding))
+
+    timings: list[float] = []
+    for _ in range(iterations):
+        st = time.perf_counter()
+        cwr.parse_page(raw, encoding)
+        timings.append(time.perf_counter() - st)
+
+    # 메모리 측정은 tracemalloc 오버헤드 때문에 시간 측정과 분리
+    gc.collect()
+    tracemalloc.start()
+    peak = 0
+    for _ in range(max(1, min(iterations, 5))):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        cwr.parse_page(raw, encoding)
+        _, _peak = tracemalloc.get_traced_memory()
+        peak = max(peak, _peak - base)
+    gc.collect()
+    before = tracemalloc.take_snapshot()
+    result = cwr.parse_page(raw, encoding)
+    # 파싱 트리는 순환 참조가 있으므로 수거한 다음 결과 객체가 차지하는 메모리만 측정
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    retained_memory = sum(s.size_diff for s in stats)
+    retained_blocks = sum(s.count_diff for s in stats)
+    del result
+    return timings, articles, peak, retained_memory, retained_blocks
+
+
+def region_size(cwr: crawler.BaseCrawler, raw: bytes) -> int:
+    """실제로 파싱하는 HTML 크기 (영역을 잘라내는 경우 잘라낸 조각의 크기)"""
+    if not (cwr.regions and cwr.region_slicing) or (fragment := slice_regions(raw, cwr.regions)) is None:
+        return len(raw)
+    return len(fragment)
+
+
+async def run_benchmark(
+    iterations: int, backends: list[str], fixtures: list[str], region_slicing: bool = True
+) -> list[BenchmarkResult]:
+    """저장된 페이지들에 대해 벤치마크 수행
+
+    Args:
+        iterations (int): 반복 횟수
+        backends (list[str]): 비교할 파서 백엔드 목록
+        fixtures (list[str]): 측정할 페이지 이름 목록 (비어있는 경우 전체)
+        region_slicing (bool, optional): 게시글 목록 영역만 잘라내 파싱할지 여부
+
+    Returns:
+        list[BenchmarkResult]: 측정 결과 목록
+    """
+    results: list[BenchmarkResult] = []
+    # 파싱만 수행하므로 실제 요청은 하지 않음
+    session = aiohttp.ClientSession()
+    try:
+        for name, fixture in load_fixtures().items():
+            if fixtures and name not in fixtures:
+                continue
+            with open(os.path.join(FIXTURE_DIR, fixture["file"]), "rb") as f:
+                raw = f.read()
+            crawler_cls: type[crawler.BaseCrawler] = getattr(crawler, fixture["crawler"])
+            baseline: float | None = None
+            # RSS 크롤러는 파서 백엔드를 사용하지 않음
+            for backend in backends if fixture["type"] == "html" else [crawler.DEFAULT_PARSER_BACKEND]:
+                if builder_registry.lookup(backend) is None:
+                    typer.echo(typer.style(f"{backend} is not installed, skip", fg="yellow"))
+                    continue
+                cwr = crawler_cls(
+                    name, [fixture["url"]], session=session, parser=backend, region_slicing=region_slicing
+                )
+                timings, articles, peak, retained_memory, retained_blocks = measure(
+                    cwr, raw, fixture["encoding"], iterations
+                )
+                mean = statistics.fmean(timings)
+                if baseline is None:
+                    baseline = mean
+                results.append(
+                    {
+                        "fixture": name,
+                        "crawler": fixture["crawler"],
+                        "backend": backend,
+                        "iterations": iterations,
+                        "page_bytes": len(raw),
+                        "region_bytes": region_size(cwr, raw),
+                        "articles": articles,
+                        "time_mean": mean,
+                        "time_median": statistics.median(timings),
+                        "time_min": min(timings),
+                        "time_max": max(timings),
+                        "peak_memory": peak,
+                        "retained_memory": retained_memory,
+                        "retained_blocks": retained_blocks,
+                        "speedup": baseline / mean if mean else 0.0,
+                    }
+                )
+    finally:
+        await session.close()
+    return results
+
+
+def run(
+    iterations: int = typer.Option(20, help="크롤러/백엔드별 반복 횟수"),
+    backend: list[str] = typer.Option(list(crawler.PARSER_BACKENDS), help="비교할 파서 백엔드"),
+    fixture: list[str] = typer.Option([], help="측정할 페이지 이름 (생략 시 전체)"),
+    output: str = typer.Option("benchmark.json", help="결과를 저장할 JSON 파일 경로"),
+    region_slicing: bool = typer.Option(True, help="게시글 목록 영역만 잘라내 파싱 (--no-region-slicing: 전체 파싱)"),
+):
+    results = asyncio.run(run_benchmark(iterations, backend, fixture, region_slicing))
+    typer.echo(
+        f"{'fixture':<18} {'backend':<12} {'articles':>8} {'parsed(KiB)':>11} {'mean(ms)':>9} {'p50(ms)':>8} "
+        f"{'peak(KiB)':>10} {'retained(KiB)':>13} {'speedup':>8}"
+    )
+    for r in results:
+        typer.echo(
+            f"{r['fixture']:<18} {r['backend']:<12} {r['articles']:>8} {r['region_bytes'] / 1024:>11.1f} "
+            f"{r['time_mean'] * 1000:>9.2f} "
+            f"{r['time_median'] * 1000:>8.2f} {r['peak_memory'] / 1024:>10.1f} {r['retained_memory'] / 1024:>13.1f} "
+            f"{r['speedup']:>7.2f}x"
+        )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    typer.echo(f"Saved benchmark result to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(run)
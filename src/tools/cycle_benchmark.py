@@ -0,0 +1,202 @@
+"""재생 서버를 이용한 크롤링 주기 전체(요청 → 비교 → 큐 → 봇 처리) 성능 측정 도구.
+
+로컬 재생 서버(src.tools.replay_server)에 가상 게시판 여러 개를 띄우고, 각 게시판을 크롤링하는 크롤러와
+DummyBot 을 설정한 임시 작업 폴더에서 BotManager 를 실행하여 주기별 소요 시간을 측정함.
+
+사용법: python -m src.tools.cycle_benchmark --boards 300 --cycles 10 --latency 0.05 --output cycle_benchmark.json
+"""
+
+import asyncio
+import datetime
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from typing import Any, TypedDict
+
+import typer
+import yaml
+
+from src.tools.replay_server import ReplayConfig, ReplayServer
+
+
+class CycleResult(TypedDict):
+    cycle: int
+    crawl_time: float
+    dispatch_time: float
+    total_time: float
+    jobs: int
+    requests: int
+    errors: int
+    mutations: dict[str, int]
+
+
+def make_config(server: ReplayServer, fixtures: bool) -> dict[str, Any]:
+    """재생 서버를 크롤링하는 크롤러와 DummyBot 으로 구성된 설정 생성
+
+    Args:
+        server (ReplayServer): 실행중인 재생 서버
+        fixtures (bool): 저장된 게시판 페이지별 크롤러 추가 여부
+
+    Returns:
+        dict[str, Any]: config.yaml 내용
+    """
+    crawlers: dict[str, Any] = {
+        f"replay_board_{board_id}": {
+            "url_list": [server.board_url(board_id)],
+            "crawler_name": "RuliwebCrawler",
+            "description": f"가상 게시판 {board_id}",
+            "enabled": True,
+        }
+        for board_id in server.boards
+    }
+    if fixtures:
+        for name, fixture in server.fixtures.items():
+            crawlers[f"replay_fixture_{name}"] = {
+                "url_list": [server.fixture_url(name)],
+                "crawler_name": fixture["crawler"],
+                "description": f"저장된 페이지 {name}",
+                "enabled": True,
+            }
+    return {
+        "crawlers": crawlers,
+        "bots": {"dummy": {"bot_name": "DummyBot", "description": "", "kwargs": {}, "enabled": True}},
+        "logfire": {"enabled": False},
+        # 모든 가상 게시판이 같은 호스트이므로 호스트별 요청 속도 제한은 사용하지 않음
+        "http": {"politeness": {"default_rps": 0}},
+    }
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def run_cycles(server: ReplayServer, cycles: int) -> list[CycleResult]:
+    """현재 작업 폴더의 config.yaml 로 BotManager 를 만들어 주어진 횟수만큼 크롤링 주기 실행
+
+    Args:
+        server (ReplayServer): 실행중인 재생 서버
+        cycles (int): 측정할 주기 횟수
+
+    Returns:
+        list[CycleResult]: 주기별 측정 결과
+    """
+    # src.main 모듈은 임포트 시 현재 폴더의 config.yaml 을 읽음
+    from src.main import BotManager
+
+    manager = BotManager()
+    await manager.init_session()
+    results: list[CycleResult] = []
+    try:
+        # 첫 주기는 게시글 캐시 초기화만 수행하므로 측정에서 제외
+        await asyncio.gather(*(manager._run_crawler(name) for name in manager.crawlers))
+        for cycle in range(1, cycles + 1):
+            server.reset_stats()
+            mutations = server.advance()
+            st = time.perf_counter()
+            # BotManager.run 과 같이 크롤러마다 따로 실행 (크롤러별 결과가 나오는 대로 봇 큐에 메시지 작업 추가)
+            data = await asyncio.gather(*(manager._run_crawler(name) for name in manager.crawlers))
+            crawl_end = time.perf_counter()
+            jobs = sum(len(d["new"]) + len(d["update"]) + len(d["remove"]) for d in data) * len(manager.bots)
+            # 봇이 큐에 들어간 메시지 작업을 모두 처리할 때까지 대기
+            await asyncio.gather(*(bot_obj.queue.join() for bot_obj in manager.bots.values()))
+            end = time.perf_counter()
+            stats = server.get_stats()
+            results.append(
+                {
+                    "cycle": cycle,
+                    "crawl_time": crawl_end - st,
+                    "dispatch_time": end - crawl_end,
+                    "total_time": end - st,
+                    "jobs": jobs,
+                    "requests": stats["requests"].get("requests", 0),
+                    "errors": sum(v for k, v in stats["status"].items() if k != "200"),
+                    "mutations": dict(mutations),
+                }
+            )
+    finally:
+        await manager.close()
+    return results
+
+
+def run(
+    boards: int = typer.Option(100, help="가상 게시판(크롤러) 개수"),
+    cycles: int = typer.Option(5, help="측정할 크롤링 주기 횟수"),
+    fixtures: bool = typer.Option(False, help="저장된 게시판 페이지별 크롤러도 추가"),
+    latency: float = typer.Option(0.0, help="평균 응답 지연 시간 (초)"),
+    jitter: float = typer.Option(0.0, help="응답 지연 시간의 표준편차 (초)"),
+    error_rate: float = typer.Option(0.0, help="오류 응답 확률"),
+    new_posts: float = typer.Option(1.0, help="주기마다 게시판별로 추가되는 평균 게시글 수"),
+    seed: int = typer.Option(0),
+    output: str = typer.Option("cycle_benchmark.json", help="결과를 저장할 JSON 파일 경로"),
+):
+    config: ReplayConfig = {
+        "latency": latency,
+        "jitter": jitter,
+        "error_rate": error_rate,
+        "new_posts": new_posts,
+        "seed": seed,
+    }
+    output = os.path.abspath(output)
+
+    async def main() -> list[CycleResult]:
+        server = ReplayServer(boards, config)
+        await server.start()
+        cwd = os.getcwd()
+        try:
+            with tempfile.TemporaryDirectory(prefix="cycle_benchmark_") as workdir:
+                os.makedirs(os.path.join(workdir, "log"))
+                with open(os.path.join(workdir, "config.yaml"), "w", encoding="utf-8") as f:
+                    yaml.safe_dump(make_config(server, fixtures), f, allow_unicode=True)
+                os.chdir(workdir)
+                try:
+                    return await run_cycles(server, cycles)
+                finally:
+                    os.chdir(cwd)
+        finally:
+            await server.close()
+
+    results = asyncio.run(main())
+    typer.echo(
+        f"{'cycle':>5} {'crawl(s)':>9} {'dispatch(s)':>11} {'total(s)':>9} {'jobs':>6} {'requests':>8} {'errors':>6}"
+    )
+    for r in results:
+        typer.echo(
+            f"{r['cycle']:>5} {r['crawl_time']:>9.3f} {r['dispatch_time']:>11.3f} {r['total_time']:>9.3f} "
+            f"{r['jobs']:>6} {r['requests']:>8} {r['errors']:>6}"
+        )
+    total_times = [r["total_time"] for r in results]
+    summary = {
+        "cycle_mean": statistics.fmean(total_times),
+        "cycle_p50": percentile(total_times, 0.5),
+        "cycle_p95": percentile(total_times, 0.95),
+        "requests_per_sec": sum(r["requests"] for r in results) / sum(r["crawl_time"] for r in results),
+        "jobs": sum(r["jobs"] for r in results),
+    }
+    typer.echo(
+        f"mean {summary['cycle_mean']:.3f}s, p50 {summary['cycle_p50']:.3f}s, p95 {summary['cycle_p95']:.3f}s, "
+        f"{summary['requests_per_sec']:.1f} req/s"
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "boards": boards,
+                "replay": config,
+                "summary": summary,
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    typer.echo(f"Saved benchmark result to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(run)
@@ -0,0 +1,134 @@
+"""저장된 게시판 페이지(tests/fixtures)를 이용한 게시글 캐시 메모리 벤치마크 도구.
+
+페이지별 파싱 결과를 게시글 번호만 바꿔 복제한 다음, 일반 딕셔너리로 저장할 때와 ArticleCache(ArticleRecord)로
+저장할 때의 게시글당 메모리 사용량을 측정하여 출력하고 JSON 파일로 저장.
+사용법: python -m src.tools.memory_benchmark --articles 2000 --output memory_benchmark.json
+"""
+
+import datetime
+import gc
+import json
+import os
+import pickle
+import platform
+import tracemalloc
+from collections.abc import Callable, MutableMapping
+from typing import Any, TypedDict
+
+import typer
+
+from src import crawler
+from src.tools.benchmark import FIXTURE_DIR, load_fixtures
+
+
+class _ClosedSession:
+    """파싱만 수행하므로 요청하지 않는 세션 대용 객체"""
+
+    closed = True
+
+
+class MemoryBenchmarkResult(TypedDict):
+    fixture: str
+    crawler: str
+    articles: int
+    dict_bytes: int
+    record_bytes: int
+    dict_per_article: float
+    record_per_article: float
+    reduction: float
+
+
+def make_pages(articles: dict[int, crawler.BaseArticle], count: int) -> list[bytes]:
+    """파싱 결과를 게시글 번호만 바꿔 count개 이상이 되도록 복제하고, 페이지(파싱 결과) 단위로 직렬화해서 반환
+
+    페이지마다 따로 역직렬화하므로 실제 크롤링처럼 페이지마다 새 문자열 객체가 만들어짐.
+    """
+    pages: list[bytes] = []
+    step = max(articles) - min(articles) + 1
+    for n in range(-(-count // len(articles))):
+        pages.append(pickle.dumps({i + n * step: {**a, "article_id": i + n * step} for i, a in articles.items()}))
+    return pages
+
+
+def measure_cache(pages: list[bytes], factory: Callable[[], MutableMapping[int, Any]]) -> tuple[int, int]:
+    """페이지들을 역직렬화해서 캐시 객체에 저장했을 때 남아있는 메모리 크기와 게시글 수 반환"""
+    gc.collect()
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    cache = factory()
+    for page in pages:
+        cache.update(pickle.loads(page))
+    gc.collect()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used - base, len(cache)
+
+
+def run_benchmark(articles: int, fixtures: list[str]) -> list[MemoryBenchmarkResult]:
+    """저장된 페이지들에 대해 게시글 캐시 메모리 사용량 측정
+
+    Args:
+        articles (int): 페이지별로 캐시에 저장할 게시글 수
+        fixtures (list[str]): 측정할 페이지 이름 목록 (비어있는 경우 전체)
+
+    Returns:
+        list[MemoryBenchmarkResult]: 측정 결과 목록
+    """
+    results: list[MemoryBenchmarkResult] = []
+    for name, fixture in load_fixtures().items():
+        if fixtures and name not in fixtures:
+            continue
+        with open(os.path.join(FIXTURE_DIR, fixture["file"]), "rb") as f:
+            raw = f.read()
+        crawler_cls: type[crawler.BaseCrawler] = getattr(crawler, fixture["crawler"])
+        cwr = crawler_cls(name, [fixture["url"]], session=_ClosedSession())  # type: ignore
+        if not (parsed := cwr.parse_page(raw, fixture["encoding"])):
+            typer.echo(typer.style(f"{name}: no article parsed, skip", fg="yellow"))
+            continue
+        pages = make_pages(parsed, articles)
+        dict_bytes, count = measure_cache(pages, dict)
+        record_bytes, _ = measure_cache(pages, crawler.ArticleCache)
+        results.append(
+            {
+                "fixture": name,
+                "crawler": fixture["crawler"],
+                "articles": count,
+                "dict_bytes": dict_bytes,
+                "record_bytes": record_bytes,
+                "dict_per_article": dict_bytes / count,
+                "record_per_article": record_bytes / count,
+                "reduction": 1 - record_bytes / dict_bytes if dict_bytes else 0.0,
+            }
+        )
+    return results
+
+
+def run(
+    articles: int = typer.Option(2000, help="페이지별로 캐시에 저장할 게시글 수"),
+    fixture: list[str] = typer.Option([], help="측정할 페이지 이름 (생략 시 전체)"),
+    output: str = typer.Option("memory_benchmark.json", help="결과를 저장할 JSON 파일 경로"),
+):
+    results = run_benchmark(articles, fixture)
+    typer.echo(f"{'fixture':<18} {'articles':>8} {'dict(B/article)':>16} {'record(B/article)':>18} {'reduction':>10}")
+    for r in results:
+        typer.echo(
+            f"{r['fixture']:<18} {r['articles']:>8} {r['dict_per_article']:>16.1f} {r['record_per_article']:>18.1f} "
+            f"{r['reduction']:>9.1%}"
+        )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    typer.echo(f"Saved benchmark result to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(run)
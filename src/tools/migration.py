@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 
 
 def v1_to_v2(dump_file_path: str):
@@ -28,7 +29,28 @@ def v1_to_v2(dump_file_path: str):
     return new
 
 
+def compact_messages(dump_file_path: str):
+    """봇 메시지 캐시에 저장된 telegram.Message 딕셔너리를 [chat_id, message_id] 핸들로 변환
+
+    봇은 이전 형식도 불러올 때 변환하므로 필수는 아니며, 덤프 파일 크기를 바로 줄이고 싶은 경우 사용.
+    """
+    with open(dump_file_path, "r", encoding="utf-8") as f:
+        dump: dict = json.load(f)
+    for bot_data in dump.get("bot", {}).values():
+        for c_msgs in bot_data.get("cache", {}).values():
+            for msg_id, msg in c_msgs.items():
+                if isinstance(msg, dict) and "message_id" in msg and "chat" in msg:
+                    c_msgs[msg_id] = [msg["chat"]["id"], msg["message_id"]]
+
+    with open(dump_file_path, "w", encoding="utf-8") as f:
+        json.dump(dump, f, ensure_ascii=False, indent=2)
+    return dump
+
+
 if __name__ == "__main__":
     # copy
     os.system("cp dump.json dump.json")
-    v1_to_v2("dump.json")
+    if "--compact-messages" in sys.argv[1:]:
+        compact_messages("dump.json")
+    else:
+        v1_to_v2("dump.json")
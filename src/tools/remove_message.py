@@ -29,12 +29,13 @@ async def remove_all_messages(file_path: str):
 
     # Remove all messages
     for crawler_name, chats in bot_tg.cache.items():
-        for article_id, msg in chats.items():
-            try:
-                await msg.delete()
-                print(f"Removed message: {msg.id} ({crawler_name}, {article_id})")
-            except telegram.error.BadRequest as e:
-                print(f"Error: {e}")
+        for article_id, handles in chats.items():
+            for msg in handles.values():
+                try:
+                    await bot_tg.bot.delete_message(chat_id=msg.chat_id, message_id=msg.message_id)
+                    print(f"Removed message: {msg.message_id} ({crawler_name}, {article_id})")
+                except telegram.error.BadRequest as e:
+                    print(f"Error: {e}")
 
 
 def main():
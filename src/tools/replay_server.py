@@ -0,0 +1,392 @@
+"""크롤러 성능 측정용 로컬 재생 서버.
+
+실제 게시판에 요청하지 않고, 저장된 게시판 페이지(tests/fixtures)와 시간에 따라 게시글이 바뀌는 가상 게시판을 제공.
+응답 지연, 오류 응답, 게시글 변경(새 글, 제목 수정, 품절, 삭제)을 설정으로 조절할 수 있음.
+
+- `/fixture/{name}`: 저장된 게시판 페이지 (fixtures.json 의 이름)
+- `/board/{board_id}`: 가상 게시판 (루리웹 게시판 형식)
+- `POST /_advance`: 모든 가상 게시판의 게시글을 한 단계 변경
+- `GET /_stats`: 요청/오류/변경 통계
+
+사용법:
+    python -m src.tools.replay_server serve --boards 100 --port 8080 --latency 0.05 --error-rate 0.01
+    python -m src.tools.replay_server record ruliweb RuliwebCrawler "https://bbs.ruliweb.com/market/board/1020?view=thumbnail&page=1"
+"""
+
+import asyncio
+import html
+import json
+import os
+import random
+from collections import Counter
+from typing import TypedDict
+
+import aiohttp
+import typer
+from aiohttp import web
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "fixtures")
+# src.main 모듈은 임포트 시 config.yaml 파일을 읽으므로 같은 User-Agent를 따로 정의
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36"
+}
+
+TITLES = [
+    "삼성 오디세이 G5 27인치 게이밍 모니터",
+    "로지텍 G502 X 플러스 무선 마우스",
+    "[쿠팡] 농심 신라면 멀티팩 40봉",
+    "LG 그램 16 노트북",
+    "WD Black SN850X 2TB NVMe SSD",
+    "애플 에어팟 프로 2세대 USB-C",
+    "[G마켓] 햇반 210g x 36개",
+    "AMD 라이젠 7 9800X3D 정품 멀티팩",
+    "코카콜라 제로 355ml x 24캔",
+    "소니 WH-1000XM5 노이즈캔슬링 헤드폰",
+]
+CATEGORIES = ["PC/하드웨어", "먹거리", "가전/가구", "게임/SW", "기타"]
+
+
+class ReplayConfig(TypedDict, total=False):
+    """재생 서버 설정
+
+    latency: 평균 응답 지연 시간 (초)
+    jitter: 응답 지연 시간의 표준편차 (초)
+    error_rate: 오류 응답을 보낼 확률
+    error_codes: 오류 응답 시 사용할 HTTP 상태 코드 목록
+    tick: 가상 게시판이 자동으로 변경되는 주기 (초), 0인 경우 `/_advance` 요청 시에만 변경
+    page_size: 가상 게시판 한 페이지의 게시글 수
+    new_posts: 한 단계마다 가상 게시판에 추가되는 평균 게시글 수
+    edit_rate: 한 단계마다 게시글 하나의 제목이 수정될 확률
+    end_rate: 한 단계마다 게시글 하나가 품절 처리될 확률
+    delete_rate: 한 단계마다 게시글 하나가 삭제될 확률
+    seed: 난수 시드
+    """
+
+    latency: float
+    jitter: float
+    error_rate: float
+    error_codes: list[int]
+    tick: float
+    page_size: int
+    new_posts: float
+    edit_rate: float
+    end_rate: float
+    delete_rate: float
+    seed: int
+
+
+DEFAULT_CONFIG: ReplayConfig = {
+    "latency": 0.0,
+    "jitter": 0.0,
+    "error_rate": 0.0,
+    "error_codes": [500, 502, 503, 429],
+    "tick": 0.0,
+    "page_size": 28,
+    "new_posts": 1.0,
+    "edit_rate": 0.2,
+    "end_rate": 0.2,
+    "delete_rate": 0.05,
+    "seed": 0,
+}
+
+
+class BoardPost(TypedDict):
+    id: int
+    title: str
+    category: str
+    writer: str
+    recommend: int
+    view: int
+
+
+class Board:
+    """시간에 따라 게시글이 바뀌는 가상 게시판
+
+    Args:
+        board_id (int): 게시판 번호
+        config (ReplayConfig): 재생 서버 설정
+    """
+
+    def __init__(self, board_id: int, config: ReplayConfig) -> None:
+        self.board_id = board_id
+        self.config = config
+        self.rng = random.Random(config["seed"] * 100003 + board_id)
+        self.next_id = 100000
+        self.posts: dict[int, BoardPost] = {}
+        for _ in range(config["page_size"]):
+            self._new_post()
+
+    def _new_post(self) -> BoardPost:
+        self.next_id += self.rng.randint(1, 3)
+        post: BoardPost = {
+            "id": self.next_id,
+            "title": self.rng.choice(TITLES),
+            "category": self.rng.choice(CATEGORIES),
+            "writer": f"user{self.rng.randint(1, 999)}",
+            "recommend": 0,
+            "view": self.rng.randint(10, 100),
+        }
+        self.posts[post["id"]] = post
+        return post
+
+    def advance(self) -> Counter[str]:
+        """게시글 변경을 한 단계 진행
+
+        Returns:
+            Counter[str]: 변경 종류별 횟수 (new, edit, end, delete)
+        """
+        stats: Counter[str] = Counter()
+        # 새 글: 평균 new_posts 개
+        new_posts = self.config["new_posts"]
+        count = int(new_posts) + (1 if self.rng.random() < new_posts - int(new_posts) else 0)
+        for _ in range(count):
+            self._new_post()
+            stats["new"] += 1
+        # 페이지 밖으로 밀려난 글은 더이상 보이지 않음
+        for article_id in sorted(self.posts)[: -self.config["page_size"]]:
+            del self.posts[article_id]
+        for post in self.posts.values():
+            post["view"] += self.rng.randint(0, 30)
+        if self.posts and self.rng.random() < self.config["edit_rate"]:
+            post = self.posts[self.rng.choice(list(self.posts))]
+            post["title"] = f"{post['title']} (가격 수정)"
+            stats["edit"] += 1
+        if self.posts and self.rng.random() < self.config["end_rate"]:
+            post = self.posts[self.rng.choice(list(self.posts))]
+            if "품절" not in post["title"]:
+                post["title"] = f"{post['title']} 품절"
+                stats["end"] += 1
+        if len(self.posts) > 1 and self.rng.random() < self.config["delete_rate"]:
+            # 가장 오래된 글을 지우면 만료와 구분할 수 없으므로 제외
+            del self.posts[self.rng.choice(sorted(self.posts)[1:])]
+            stats["delete"] += 1
+        return stats
+
+    def render(self) -> str:
+        """루리웹 게시판 형식의 HTML 문자열 반환"""
+        rows = []
+        for post in sorted(self.posts.values(), key=lambda p: p["id"], reverse=True):
+            url = f"https://bbs.ruliweb.com/market/board/1020/read/{post['id']}"
+            rows.append(
+                '<tr class="table_body blocktarget normal"><td class="subject">'
+                f'<input type="hidden" class="info_article_id" value="{post["id"]}">'
+                f'<div class="title row"><div class="title_wrapper">[{html.escape(post["category"])}] '
+                f'<a class="subject_link deco" href="{url}">{html.escape(post["title"])}</a></div></div>'
+                f'<div class="info row"><span class="nick"><a href="#">{html.escape(post["writer"])}</a></span>'
+                f'<span class="recomd">추천 <strong>{post["recommend"]}</strong></span>'
+                f'<span class="hit">조회 <strong>{post["view"]}</strong></span></div></td></tr>'
+            )
+        return (
+            '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>Replay board</title></head><body>'
+            f'<span id="board_name">가상 게시판 {self.board_id}</span>'
+            f'<table class="board_list_table"><tbody>{"".join(rows)}</tbody></table></body></html>'
+        )
+
+
+class ReplayServer:
+    """저장된 게시판 페이지와 가상 게시판을 제공하는 로컬 HTTP 서버
+
+    Args:
+        boards (int, optional): 가상 게시판 개수
+        config (ReplayConfig | None, optional): 재생 서버 설정
+        fixture_dir (str, optional): 저장된 게시판 페이지 폴더 경로
+    """
+
+    def __init__(self, boards: int = 0, config: ReplayConfig | None = None, fixture_dir: str = FIXTURE_DIR) -> None:
+        self.config: ReplayConfig = {**DEFAULT_CONFIG, **(config or {})}
+        self.rng = random.Random(self.config["seed"])
+        self.boards = {i: Board(i, self.config) for i in range(boards)}
+        self.fixture_dir = fixture_dir
+        with open(os.path.join(fixture_dir, "fixtures.json"), "r", encoding="utf-8") as f:
+            self.fixtures: dict[str, dict[str, str]] = json.load(f)
+        self.stats: Counter[str] = Counter()
+        self.status_codes: Counter[int] = Counter()
+        self.mutations: Counter[str] = Counter()
+        self.runner: web.AppRunner | None = None
+        self._tick_task: asyncio.Task | None = None
+        self.url = ""
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self.app.router.add_get("/fixture/{name}", self.fixture_page)
+        self.app.router.add_get("/board/{board_id}", self.board_page)
+        self.app.router.add_post("/_advance", self.advance_handler)
+        self.app.router.add_get("/_stats", self.stats_handler)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith("/_"):
+            return await handler(request)
+        self.stats["requests"] += 1
+        if self.config["latency"] or self.config["jitter"]:
+            await asyncio.sleep(max(0.0, self.rng.gauss(self.config["latency"], self.config["jitter"])))
+        if self.config["error_rate"] and self.rng.random() < self.config["error_rate"]:
+            status = self.rng.choice(self.config["error_codes"])
+            self.status_codes[status] += 1
+            headers = {"Retry-After": "1"} if status in (429, 503) else None
+            return web.Response(status=status, text=f"Replay error {status}", headers=headers)
+        resp = await handler(request)
+        self.status_codes[resp.status] += 1
+        if isinstance(resp, web.Response) and resp.body is not None:
+            self.stats["bytes"] += len(resp.body)  # type: ignore
+        return resp
+
+    async def fixture_page(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        if (fixture := self.fixtures.get(name)) is None:
+            raise web.HTTPNotFound()
+        with open(os.path.join(self.fixture_dir, fixture["file"]), "rb") as f:
+            body = f.read()
+        content_type = "application/rss+xml" if fixture["type"] == "rss" else "text/html"
+        charset = "euc-kr" if fixture["encoding"] == "cp949" else fixture["encoding"]
+        return web.Response(body=body, content_type=content_type, charset=charset)
+
+    async def board_page(self, request: web.Request) -> web.Response:
+        board_id = int(request.match_info["board_id"])
+        if (board := self.boards.get(board_id)) is None:
+            raise web.HTTPNotFound()
+        return web.Response(text=board.render(), content_type="text/html")
+
+    async def advance_handler(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.advance()))
+
+    async def stats_handler(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_stats())
+
+    def advance(self) -> Counter[str]:
+        """모든 가상 게시판의 게시글 변경을 한 단계 진행
+
+        Returns:
+            Counter[str]: 변경 종류별 횟수
+        """
+        stats: Counter[str] = Counter()
+        for board in self.boards.values():
+            stats.update(board.advance())
+        self.mutations.update(stats)
+        return stats
+
+    def get_stats(self) -> dict[str, dict]:
+        """요청 수, 상태 코드별 응답 수, 변경 종류별 횟수 반환"""
+        return {
+            "requests": dict(self.stats),
+            "status": {str(k): v for k, v in self.status_codes.items()},
+            "mutations": dict(self.mutations),
+        }
+
+    def reset_stats(self) -> None:
+        self.stats.clear()
+        self.status_codes.clear()
+        self.mutations.clear()
+
+    def board_url(self, board_id: int) -> str:
+        return f"{self.url}/board/{board_id}"
+
+    def fixture_url(self, name: str) -> str:
+        return f"{self.url}/fixture/{name}"
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(self.config["tick"])
+            self.advance()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버 시작
+
+        Args:
+            host (str, optional): 바인딩할 주소
+            port (int, optional): 바인딩할 포트, 0인 경우 임의의 포트 사용
+
+        Returns:
+            str: 서버 주소 (예: http://127.0.0.1:8080)
+        """
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        _host, _port = self.runner.addresses[0][:2]
+        self.url = f"http://{_host}:{_port}"
+        if self.config["tick"] > 0:
+            self._tick_task = asyncio.create_task(self._tick())
+        return self.url
+
+    async def close(self) -> None:
+        """서버 종료"""
+        if self._tick_task is not None:
+            self._tick_task.cancel()
+            self._tick_task = None
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+app = typer.Typer()
+
+
+@app.command()
+def serve(
+    boards: int = typer.Option(10, help="가상 게시판 개수"),
+    host: str = typer.Option("127.0.0.1"),
+    port: int = typer.Option(8080),
+    latency: float = typer.Option(0.0, help="평균 응답 지연 시간 (초)"),
+    jitter: float = typer.Option(0.0, help="응답 지연 시간의 표준편차 (초)"),
+    error_rate: float = typer.Option(0.0, help="오류 응답 확률"),
+    tick: float = typer.Option(60.0, help="가상 게시판 변경 주기 (초), 0인 경우 POST /_advance 요청 시에만 변경"),
+    seed: int = typer.Option(0),
+):
+    """재생 서버 실행"""
+
+    async def main():
+        server = ReplayServer(
+            boards, {"latency": latency, "jitter": jitter, "error_rate": error_rate, "tick": tick, "seed": seed}
+        )
+        url = await server.start(host, port)
+        typer.echo(f"Replay server started: {url} ({boards} board(s), {len(server.fixtures)} fixture(s))")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def record(
+    name: str = typer.Argument(..., help="저장할 페이지 이름"),
+    crawler_name: str = typer.Argument(..., help="페이지를 파싱할 크롤러 클래스 이름"),
+    url: str = typer.Argument(..., help="저장할 게시판 URL"),
+    rss: bool = typer.Option(False, help="RSS 페이지 여부"),
+):
+    """실제 게시판 페이지를 받아서 tests/fixtures 에 저장하고 fixtures.json 에 등록"""
+
+    async def fetch() -> tuple[bytes, str]:
+        async with aiohttp.ClientSession(headers=HEADERS) as session:
+            async with session.get(url) as resp:
+                resp.raise_for_status()
+                return await resp.read(), resp.get_encoding()
+
+    body, encoding = asyncio.run(fetch())
+    if encoding in ("euc-kr", "euc_kr"):
+        encoding = "cp949"
+    file_name = f"{name}.xml" if rss else f"{name}.html"
+    with open(os.path.join(FIXTURE_DIR, file_name), "wb") as f:
+        f.write(body)
+    manifest_path = os.path.join(FIXTURE_DIR, "fixtures.json")
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        fixtures = json.load(f)
+    fixtures[name] = {
+        "crawler": crawler_name,
+        "file": file_name,
+        "encoding": encoding,
+        "type": "rss" if rss else "html",
+        "url": url,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(fixtures, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    typer.echo(f"Recorded {url} -> {file_name} ({len(body)} bytes, {encoding})")
+
+
+if __name__ == "__main__":
+    app()
@@ -1,11 +1,192 @@
+import asyncio
+import bisect
 import logging
 import logging.handlers
 import re
-from typing import Any
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from typing import Any, Self, TypeVar, overload
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+# 텔레그램 MarkdownV2 에서 이스케이프해야 하는 문자
+_MARKDOWN_SPECIAL_RE = re.compile(r"([_*\[\]()~`>#+\-=|{}.!])")
 
 
 def escape_markdown(s: str) -> str:
-    return re.sub(r"([_*\[\]()~`>#+\-=|{}.!])", "\\\\\\1", s)
+    return _MARKDOWN_SPECIAL_RE.sub(r"\\\1", s)
+
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지는 토큰 버킷. 토큰이 없으면 채워질 때까지 대기.
+
+    토큰을 미리 예약하는 방식이라 여러 작업이 동시에 요청해도 요청 순서대로 간격을 두고 실행됨.
+
+    Args:
+        rate (float): 초당 채워지는 토큰 수
+        capacity (float, optional): 최대로 쌓아둘 수 있는 토큰 수 (한 번에 몰아서 보낼 수 있는 요청 수)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1) -> None:
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        # 버킷을 만들기 전에 읽은 시각이 주어진 경우 등 마지막 갱신 시각보다 이전이면 채우지 않음
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def reserve(self, now: float | None = None) -> float:
+        """토큰 하나를 예약하고, 사용할 수 있을 때까지 기다려야 하는 시간(초)을 반환"""
+        self._refill(time.monotonic() if now is None else now)
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def penalize(self, seconds: float, now: float | None = None) -> None:
+        """seconds초 동안 토큰이 채워지지 않도록 함 (서버가 요청 제한을 알려준 경우)"""
+        self._refill(time.monotonic() if now is None else now)
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+    async def acquire(self) -> float:
+        """토큰 하나를 사용할 수 있을 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class TimedQueue(asyncio.Queue[T]):
+    """아이템을 넣은 시각(time.monotonic)을 함께 저장하는 큐. get_timed 로 아이템과 넣은 시각을 함께 꺼낼 수 있음"""
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[tuple[float, T]] = deque()
+        self._last_enqueued = 0.0
+
+    def _put(self, item: T) -> None:
+        self._queue.append((time.monotonic(), item))
+
+    def _get(self) -> T:
+        self._last_enqueued, item = self._queue.popleft()
+        return item
+
+    async def get_timed(self) -> tuple[T, float]:
+        """아이템이 들어올 때까지 대기한 다음 아이템과 넣은 시각을 반환"""
+        item = await self.get()
+        # _get 이 호출된 뒤 다른 작업으로 전환되기 전에 읽으므로 같은 아이템의 시각임
+        return item, self._last_enqueued
+
+
+class SortedIdDict(dict[int, V]):
+    """게시글 번호 순서로 정렬된 키 목록을 함께 유지하는 딕셔너리
+
+    정렬된 키 목록을 이분 탐색해서 최솟값/최댓값은 O(1), 특정 번호보다 작거나 큰 항목 찾기는 O(log n)으로 처리함.
+    항목 순서(반복 순서)는 일반 딕셔너리와 같이 추가된 순서를 유지함.
+    단, 새 키 추가(bisect.insort)와 키 삭제는 키 목록의 원소를 옮겨야 하므로 O(n).
+    (새 글은 대부분 가장 큰 번호라 목록 끝에 붙으므로 실제 이동은 거의 없음. 기존 키의 값 변경은 O(1))
+
+    Args:
+        data (Mapping[int, V] | Iterable[tuple[int, V]], optional): 초기 데이터
+    """
+
+    def __init__(self, data: Mapping[int, V] | Iterable[tuple[int, V]] = (), /) -> None:
+        super().__init__()
+        self._keys: list[int] = []
+        self.update(data)
+
+    def __reduce__(self):
+        # 기본 방식은 _keys 속성을 만들기 전에 항목을 추가하므로 생성자로 다시 만들도록 함
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, key: int, value: V) -> None:
+        if key not in self:
+            bisect.insort(self._keys, key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: int) -> None:
+        super().__delitem__(key)
+        del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def __ior__(self, other: Any) -> Self:
+        self.update(other)
+        return self
+
+    def update(self, data: Any = (), /, **kwargs: V) -> None:
+        items = data.items() if isinstance(data, Mapping) else data
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value  # type: ignore
+
+    def setdefault(self, key: int, default: V = None) -> V:  # type: ignore
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: int, *default: Any) -> Any:
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> tuple[int, V]:
+        key, value = super().popitem()
+        del self._keys[bisect.bisect_left(self._keys, key)]
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+
+    def copy(self) -> Self:
+        return self.__class__(self)
+
+    @overload
+    def min_key(self) -> int | None: ...
+    @overload
+    def min_key(self, default: int) -> int: ...
+    def min_key(self, default: int | None = None) -> int | None:
+        """가장 작은 키 반환, 비어있는 경우 default 반환"""
+        return self._keys[0] if self._keys else default
+
+    @overload
+    def max_key(self) -> int | None: ...
+    @overload
+    def max_key(self, default: int) -> int: ...
+    def max_key(self, default: int | None = None) -> int | None:
+        """가장 큰 키 반환, 비어있는 경우 default 반환"""
+        return self._keys[-1] if self._keys else default
+
+    def sorted_keys(self, start: int | None = None, stop: int | None = None) -> list[int]:
+        """start 이상 stop 미만인 키 목록을 정렬된 순서로 반환 (생략한 경우 범위 제한 없음)"""
+        lo = 0 if start is None else bisect.bisect_left(self._keys, start)
+        hi = len(self._keys) if stop is None else bisect.bisect_left(self._keys, stop)
+        return self._keys[lo:hi]
+
+    def range(self, start: int | None = None, stop: int | None = None) -> Self:
+        """start 이상 stop 미만인 항목들을 모아 새 객체로 반환 (생략한 경우 범위 제한 없음)"""
+        return self.__class__((key, dict.__getitem__(self, key)) for key in self.sorted_keys(start, stop))
+
+    def remove_below(self, i: int) -> list[int]:
+        """키가 i보다 작은 항목들을 삭제하고 삭제한 키 목록 반환"""
+        idx = bisect.bisect_left(self._keys, i)
+        removed = self._keys[:idx]
+        del self._keys[:idx]
+        for key in removed:
+            super().__delitem__(key)
+        return removed
 
 
 class TelegramHandler(logging.handlers.HTTPHandler):
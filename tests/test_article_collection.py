@@ -1,4 +1,8 @@
+import json
+import pickle
+
 from src import crawler
+from src.bot import message_serializer
 
 
 def generate_dummy_article(id_: int) -> crawler.BaseArticle:
@@ -38,6 +42,11 @@ def test_article_collection_get_new():
     ac = crawler.ArticleCollection({i: generate_dummy_article(i) for i in range(1, 11)})
     new_ac = ac.get_new(5)
     assert len(new_ac) == 5
+    # 추가된 순서(게시판 페이지 순서) 유지
+    ac = crawler.ArticleCollection({i: generate_dummy_article(i) for i in (9, 7, 8, 3, 1)})
+    assert list(ac.get_new(5)) == [9, 7, 8]
+    assert list(ac.get_new(0)) == [9, 7, 8, 3, 1]
+    assert not ac.get_new(9)
 
 
 def test_article_collection_sub():
@@ -50,3 +59,53 @@ def test_article_collection_sub():
     sub_ac = ac2 - ac1  # 1,2,3,4,5 삭제
     assert len(sub_ac) == 5
     assert 5 not in sub_ac
+
+
+def test_article_collection_sorted_index():
+    """순서 없이 추가/삭제해도 정렬된 키 목록과 최솟값/최댓값이 유지되어야 함"""
+    ac = crawler.ArticleCollection({i: generate_dummy_article(i) for i in (5, 3, 9)})
+    ac.update({1: generate_dummy_article(1), "7": generate_dummy_article(7)})
+    ac.setdefault(4, generate_dummy_article(4))
+    ac[5] = generate_dummy_article(5)
+    assert ac.sorted_keys() == [1, 3, 4, 5, 7, 9]
+    del ac[1]
+    ac.pop(9)
+    assert ac.pop(100, None) is None
+    assert (ac.min_key(), ac.max_key()) == (3, 7)
+    assert ac.sorted_keys(4, 7) == [4, 5]
+    assert list(ac.range(4)) == [4, 5, 7]
+    assert isinstance(ac.get_new(4), crawler.ArticleCollection)
+    ac.clear()
+    assert ac.min_key() is None and ac.max_key(0) == 0
+
+
+def test_article_collection_serialize():
+    """직렬화(JSON, pickle) 후에도 같은 내용과 키 목록을 유지해야 함"""
+    ac = crawler.ArticleCollection({i: generate_dummy_article(i) for i in (3, 1, 2)})
+    restored = pickle.loads(pickle.dumps(ac))
+    assert restored == ac and restored.sorted_keys() == [1, 2, 3]
+    loaded = crawler.ArticleCollection(json.loads(json.dumps(ac, default=message_serializer)))
+    assert loaded == ac and loaded.max_key() == 3
+
+
+def test_article_record():
+    """ArticleRecord 는 딕셔너리와 같은 방식으로 사용할 수 있어야 함"""
+    article = generate_dummy_article(1)
+    article["extra"] = {"price": "1,000원", "delivery": "무료", "comment": "3"}
+    # 크롤링 결과는 일반 딕셔너리를 그대로 저장하고, 게시글 캐시에 추가할 때만 변환
+    assert type(crawler.ArticleCollection({1: article})[1]) is dict
+    ac = crawler.ArticleCache({1: article})
+    record = ac[1]
+    assert isinstance(record, crawler.ArticleRecord)
+    assert isinstance(ac.get_new(0), crawler.ArticleCache)
+    assert record == article and dict(record)["title"] == article["title"]
+    assert record["extra"]["price"] == "1,000원" and record["extra"]["comment"] == "3"
+    assert record.get("extra", {}).get("view") is None
+    assert {**record["extra"], "price": "2,000원"} == {**article["extra"], "price": "2,000원"}
+    record.update({**article, "title": "changed", "is_end": True})
+    assert record["title"] == "changed" and record["is_end"] is True
+    # 반복되는 문자열은 하나의 객체를 공유
+    other = crawler.ArticleRecord({**generate_dummy_article(2), "site_name": "".join(["Dummy", " Site"])})
+    assert other["site_name"] is record["site_name"]
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record.to_dict() == {**article, "title": "changed", "is_end": True}
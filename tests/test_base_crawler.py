@@ -0,0 +1,277 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src import crawler
+
+
+class CountingCrawler(crawler.BaseCrawler):
+    """본문의 각 단어를 게시글 번호로 취급하는 테스트용 크롤러. 파싱 횟수는 parse_metrics로 확인."""
+
+    @property
+    def parse_count(self) -> int:
+        return self.parse_metrics["count"]
+
+    def parse(self, html: str) -> dict[int, crawler.BaseArticle]:
+        return {
+            int(n): crawler.BaseArticle(
+                article_id=int(n),
+                title=f"Article {n}",
+                category="",
+                site_name="Test",
+                board_name="Test",
+                writer_name="Test",
+                crawler_name=self.name,
+                url=f"https://example.com/{n}",
+                is_end=False,
+                extra={},
+            )
+            for n in html.split()
+        }
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = {"body": "1 2 3", "etag": '"v1"'}
+
+    async def etag_page(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == state["etag"]:
+            return web.Response(status=304)
+        return web.Response(text=state["body"], headers={"ETag": state["etag"]})
+
+    async def plain_page(request: web.Request) -> web.Response:
+        state["plain_count"] = state.get("plain_count", 0) + 1
+        await asyncio.sleep(state.get("delay", 0))
+        return web.Response(text=state["body"])
+
+    async def numbered_page(request: web.Request) -> web.Response:
+        # 앞 페이지일수록 늦게 응답
+        n = int(request.match_info["n"])
+        state["active"] = state.get("active", 0) + 1
+        state["max_active"] = max(state.get("max_active", 0), state["active"])
+        await asyncio.sleep(0.05 * (5 - n))
+        state["active"] -= 1
+        return web.Response(text=f"{n * 10} {n * 10 + 1}")
+
+    async def flaky_page(request: web.Request) -> web.Response:
+        # fail 횟수만큼 503 응답 후 정상 응답
+        state["flaky_count"] = state.get("flaky_count", 0) + 1
+        if state["flaky_count"] <= state.get("fail", 0):
+            return web.Response(status=503, headers={"Retry-After": state.get("retry_after", "0")})
+        return web.Response(text=state["body"])
+
+    app = web.Application()
+    app.router.add_get("/etag", etag_page)
+    app.router.add_get("/flaky", flaky_page)
+    app.router.add_get("/plain", plain_page)
+    app.router.add_get("/page/{n}", numbered_page)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_not_modified(server):
+    """ETag가 같으면 304 응답을 받아 파싱 없이 직전 결과를 재사용해야 함"""
+    async with aiohttp.ClientSession() as session:
+        cwr = CountingCrawler("test", [str(server.make_url("/etag"))], session=session)
+        first = await cwr.get()
+        second = await cwr.get()
+    assert cwr.parse_count == 1
+    assert first == second
+    assert list(second.keys()) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_body_digest_not_modified(server):
+    """검증자가 없는 사이트도 본문이 같으면 파싱을 건너뛰고, 본문이 바뀌면 다시 파싱해야 함"""
+    async with aiohttp.ClientSession() as session:
+        cwr = CountingCrawler("test", [str(server.make_url("/plain"))], session=session)
+        await cwr.get()
+        await cwr.get()
+        assert cwr.parse_count == 1
+        server.state["body"] = "2 3 4"
+        data = await cwr.get()
+    assert cwr.parse_count == 2
+    assert list(data.keys()) == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_keeps_page_order(server):
+    """여러 URL을 동시 요청 수 제한 내에서 요청하고, 결과는 url_list 순서대로 합쳐야 함"""
+    async with aiohttp.ClientSession() as session:
+        url_list = [str(server.make_url(f"/page/{n}")) for n in range(1, 5)]
+        cwr = CountingCrawler("test", url_list, session=session, concurrency=2)
+        data = await cwr.get()
+    assert list(data.keys()) == [10, 11, 20, 21, 30, 31, 40, 41]
+    assert server.state["max_active"] == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["process", "thread", "inline"])
+async def test_parse_executor(server, mode):
+    """파싱 실행 방식과 관계없이 같은 결과를 반환하고 파싱 소요 시간을 기록해야 함"""
+    executor = crawler.ParseExecutor(mode, max_workers=1)
+    try:
+        async with aiohttp.ClientSession() as session:
+            cwr = CountingCrawler("test", [str(server.make_url("/plain"))], session=session, executor=executor)
+            data = await cwr.get()
+    finally:
+        executor.shutdown()
+    assert list(data.keys()) == [1, 2, 3]
+    assert data[1]["crawler_name"] == "test"
+    assert cwr.parse_metrics["count"] == 1
+    assert cwr.parse_metrics["total"] > 0
+
+
+def _raise_type_error() -> None:
+    raise TypeError("error in parser")
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_unpicklable():
+    """프로세스 풀로 보낼 수 없는 함수는 직접 실행하고, 풀에서 실행한 함수의 예외는 그대로 전달해야 함"""
+
+    class LocalParser:
+        def parse(self, n: int) -> int:
+            return n * 2
+
+    executor = crawler.ParseExecutor("process", max_workers=1)
+    try:
+        assert await executor.run(LocalParser().parse, 2) == 4
+        assert await executor.run(lambda: 3) == 3
+        with pytest.raises(TypeError, match="error in parser"):
+            await executor.run(_raise_type_error)
+        assert executor.mode == "process"
+    finally:
+        executor.shutdown()
+
+
+class SlowParseCrawler(CountingCrawler):
+    def parse(self, html: str) -> dict[int, crawler.BaseArticle]:
+        time.sleep(0.2)
+        return super().parse(html)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_parse_not_cached(server):
+    """파싱 도중 취소된 경우 다음 요청에서 페이지를 다시 파싱해야 함"""
+    executor = crawler.ParseExecutor("thread", max_workers=1)
+    try:
+        async with aiohttp.ClientSession() as session:
+            cwr = SlowParseCrawler("test", [str(server.make_url("/plain"))], session=session, executor=executor)
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.05):
+                    await cwr.get()
+            data = await cwr.get()
+    finally:
+        executor.shutdown()
+    assert list(data.keys()) == [1, 2, 3]
+
+
+@pytest.fixture
+def breakers(monkeypatch, tmp_path):
+    # 오류 응답은 error/ 폴더에 저장되므로 임시 폴더에서 실행
+    monkeypatch.chdir(tmp_path)
+    crawler.circuit_breakers.breakers.clear()
+    yield crawler.circuit_breakers
+    crawler.circuit_breakers.breakers.clear()
+    crawler.circuit_breakers.configure(None)
+
+
+@pytest.mark.asyncio
+async def test_retry_on_server_error(server, breakers):
+    """503 응답은 Retry-After 만큼 기다린 뒤 재시도해야 함"""
+    server.state["fail"] = 2
+    async with aiohttp.ClientSession() as session:
+        cwr = CountingCrawler("test", [str(server.make_url("/flaky"))], session=session, retry={"attempts": 3})
+        data = await cwr.get()
+    assert list(data.keys()) == [1, 2, 3]
+    assert server.state["flaky_count"] == 3
+    assert breakers.get(server.host).state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_host(server, breakers):
+    """연속 실패로 차단기가 열리면 해당 호스트로 요청하지 않아야 함"""
+    breakers.configure({"failure_threshold": 2, "recovery_timeout": 60})
+    server.state["fail"] = 100
+    async with aiohttp.ClientSession() as session:
+        cwr = CountingCrawler("test", [str(server.make_url("/flaky"))], session=session, retry={"attempts": 1})
+        for _ in range(4):
+            assert await cwr.get() == {}
+    assert server.state["flaky_count"] == 2
+    assert breakers.get(server.host).state == "open"
+    assert cwr.failures == 4
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_opens_breaker(server, breakers):
+    """Retry-After 가 너무 긴 경우 재시도하지 않고 차단기를 열어야 함"""
+    server.state.update(fail=100, retry_after="3600")
+    async with aiohttp.ClientSession() as session:
+        cwr = CountingCrawler("test", [str(server.make_url("/flaky"))], session=session)
+        assert await cwr.get() == {}
+    assert server.state["flaky_count"] == 1
+    assert breakers.get(server.host).snapshot()["open_remaining"] > 3000
+
+
+@pytest.fixture
+def coalescer():
+    crawler.fetch_cache.entries.clear()
+    crawler.fetch_cache.snapshot(reset=True)
+    yield crawler.fetch_cache
+    crawler.fetch_cache.configure(None)
+    crawler.fetch_cache.entries.clear()
+
+
+@pytest.mark.asyncio
+async def test_coalesce_identical_urls(server, coalescer):
+    """같은 URL을 요청하는 크롤러들은 한 번만 요청하고 응답을 공유해야 함"""
+    server.state["delay"] = 0.05
+    url = str(server.make_url("/plain"))
+    async with aiohttp.ClientSession() as session:
+        crawlers = [CountingCrawler(f"test{i}", [url], session=session) for i in range(3)]
+        results = await asyncio.gather(*(cwr.get() for cwr in crawlers))
+        # 완료된 응답도 재사용 시간 안에는 공유
+        late = CountingCrawler("late", [url], session=session)
+        results.append(await late.get())
+        assert server.state["plain_count"] == 1
+        assert all(list(data.keys()) == [1, 2, 3] for data in results)
+        assert coalescer.snapshot() == {"misses": 1, "hits": 1, "shared": 2, "hit_ratio": 0.75}
+
+        # 같은 크롤러의 다음 요청은 새로 요청
+        server.state["body"] = "1 2 3 4"
+        data = await crawlers[0].get()
+    assert server.state["plain_count"] == 2
+    assert list(data.keys()) == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_disabled(server, coalescer):
+    coalescer.configure(0)
+    url = str(server.make_url("/plain"))
+    async with aiohttp.ClientSession() as session:
+        crawlers = [CountingCrawler(f"test{i}", [url], session=session) for i in range(2)]
+        await asyncio.gather(*(cwr.get() for cwr in crawlers))
+    assert server.state["plain_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_skips_failed_response(server, breakers, coalescer):
+    """실패한 응답은 재사용하지 않아야 함"""
+    server.state["fail"] = 1
+    url = str(server.make_url("/flaky"))
+    async with aiohttp.ClientSession() as session:
+        first = CountingCrawler("first", [url], session=session, retry={"attempts": 1})
+        second = CountingCrawler("second", [url], session=session, retry={"attempts": 1})
+        assert await first.get() == {}
+        assert list((await second.get()).keys()) == [1, 2, 3]
+    assert server.state["flaky_count"] == 2
@@ -0,0 +1,412 @@
+import asyncio
+import datetime
+import json
+import time
+
+import pytest
+import telegram
+
+from src import bot
+
+from .test_article_collection import generate_dummy_article
+
+
+class SlowDummyBot(bot.DummyBot):
+    """메시지 전송에 delay초가 걸리는 더미 봇"""
+
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name)
+        self.delay = delay
+        self.sent: list[tuple[int, float]] = []
+
+    async def _send(self, data) -> None:
+        await asyncio.sleep(self.delay)
+        self.sent.append((data["article_id"], time.monotonic()))
+
+
+@pytest.mark.asyncio
+async def test_consumer_dispatch_latency():
+    """큐에 넣은 작업은 폴링 간격 없이 바로 처리해야 함"""
+    b = SlowDummyBot("dummy", 0)
+    await asyncio.sleep(0.05)
+    st = time.monotonic()
+    await b.send(generate_dummy_article(1))
+    await asyncio.wait_for(b.queue.join(), 1)
+    assert b.sent[0][0] == 1
+    assert b.sent[0][1] - st < 0.1
+    await b.close()
+
+
+@pytest.mark.asyncio
+async def test_consumer_stop_idle():
+    """작업이 없을 때 정지하면 바로 종료하고, 정지 후 넣은 작업은 큐에 남아있어야 함"""
+    b = SlowDummyBot("dummy", 0)
+    await asyncio.sleep(0)
+    st = time.monotonic()
+    await b.stop_consumer()
+    assert time.monotonic() - st < 0.1
+    assert b.consumer_task is not None and b.consumer_task.done()
+    await b.queue.put(("send", generate_dummy_article(1)))
+    data = await b.to_dict()
+    assert [job[1]["article_id"] for job in data["queue"]] == [1]
+
+
+@pytest.mark.asyncio
+async def test_consumer_cancel_requeue():
+    """처리 중에 consumer task 가 취소되면 처리 중이던 작업을 큐에 다시 넣어야 함"""
+    b = SlowDummyBot("dummy", 1)
+    await b.send_iter([generate_dummy_article(1), generate_dummy_article(2)])
+    await asyncio.sleep(0.05)
+    assert b.dispatching
+    assert b.consumer_task is not None
+    b.consumer_task.cancel()
+    await asyncio.wait([b.consumer_task])
+    assert not b.sent
+    assert [job[1]["article_id"] for job in (await b.to_dict())["queue"]] == [2, 1]
+
+
+class RecordingBot(bot.DummyBot):
+    """처리한 작업을 순서대로 기록하고, 지정한 게시글의 첫 전송은 RetryLater 로 미루는 더미 봇"""
+
+    def __init__(self, name: str, delay: float = 0, retry: dict[int, float] | None = None, **kwargs) -> None:
+        super().__init__(name, **kwargs)
+        self.delay = delay
+        self.retry = retry or {}
+        self.done: list[tuple[str, int, float]] = []
+
+    async def _send(self, data) -> None:
+        if (delay := self.retry.pop(data["article_id"], None)) is not None:
+            raise bot.RetryLater(delay)
+        await asyncio.sleep(self.delay)
+        self.done.append(("send", data["article_id"], time.monotonic()))
+
+    async def _edit(self, data) -> None:
+        self.done.append(("edit", data["article_id"], time.monotonic()))
+
+
+@pytest.mark.asyncio
+async def test_parallel_workers():
+    """작업자 수만큼 동시에 처리하고, 같은 게시글의 작업은 들어온 순서대로 처리해야 함"""
+    b = RecordingBot("dummy", delay=0.1, workers=4)
+    st = time.monotonic()
+    await b.send_iter(generate_dummy_article(i) for i in range(1, 9))
+    await asyncio.sleep(0.01)
+    await b.edit(generate_dummy_article(1))
+    await asyncio.wait_for(b.queue.join(), 2)
+    assert time.monotonic() - st < 0.5
+    assert [(action, i) for action, i, _ in b.done if i == 1] == [("send", 1), ("edit", 1)]
+    await b.close()
+
+
+@pytest.mark.asyncio
+async def test_retry_later_delay_heap():
+    """RetryLater 로 미룬 작업은 다른 작업을 막지 않고, 같은 게시글의 이후 작업은 미룬 작업 뒤에 처리해야 함"""
+    b = RecordingBot("dummy", retry={1: 0.2})
+    await b.send_iter([generate_dummy_article(1), generate_dummy_article(2)])
+    await asyncio.sleep(0.05)
+    await b.edit(generate_dummy_article(1))
+    await asyncio.wait_for(b.queue.join(), 2)
+    assert [(action, i) for action, i, _ in b.done] == [("send", 2), ("send", 1), ("edit", 1)]
+    assert b.done[1][2] - b.done[0][2] >= 0.15
+    await b.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_requeues_delayed():
+    """정지할 때 대기 힙에 남은 작업과 같은 게시글의 대기 작업은 하나로 합쳐서 큐에 다시 넣어야 함"""
+    b = RecordingBot("dummy", retry={1: 10})
+    await b.send(generate_dummy_article(1))
+    await asyncio.sleep(0.05)
+    edited = generate_dummy_article(1)
+    edited["title"] = "edited"
+    await b.edit(edited)
+    await asyncio.sleep(0.05)
+    data = await b.to_dict()
+    assert [(job[0], job[1]["title"]) for job in data["queue"]] == [("send", "edited")]
+    assert not b._held
+
+
+@pytest.mark.asyncio
+async def test_telegram_rate_limits():
+    """텔레그램 봇은 채팅방/그룹별 토큰 버킷으로 작업을 예약하고, RetryAfter 를 받으면 채팅방 버킷을 멈춰야 함"""
+    tg = bot.TelegramBot("telegram", "123456:TEST", "@channel", rate_limits={"group_per_minute": 60})
+    a = [generate_dummy_article(i) for i in range(5)]
+    assert len(tg._chat_buckets("@channel")) == 2 and len(tg._chat_buckets("12345")) == 1
+    assert tg._reserve("send", a[1]) == 0
+    assert tg._reserve("send", a[2]) == pytest.approx(1, abs=0.05)
+    # 이미 예약한 전송 대상은 다시 예약하지 않음
+    assert tg._reserve("send", a[2]) == pytest.approx(1, abs=0.05)
+    # 삭제는 봇 전체 제한만 적용
+    await tg.set_msg_obj(a[3], {"@channel": bot.MessageHandle(-100123, 3)})
+    assert tg._reserve("delete", a[3]) == 0
+    retry = tg._retry_later(telegram.error.RetryAfter(5), "@channel")
+    assert retry.delay == 5
+    assert tg._reserve("send", a[4]) > 5
+    await tg.stop_consumer()
+
+
+def test_job_queue_priority_coalesce():
+    """작업 큐는 전송 > 수정 > 삭제 순서로 꺼내고, 같은 게시글의 작업은 합치거나 상쇄해야 함"""
+    queue = bot.JobQueue()
+    a = [generate_dummy_article(i) for i in range(6)]
+    queue.put_nowait(("delete", a[0]))
+    queue.put_nowait(("edit", a[1]))
+    queue.put_nowait(("send", a[2]))
+    # 전송 전 수정은 전송으로 합침
+    queue.put_nowait(("send", a[3]))
+    queue.put_nowait(("edit", {**a[3], "title": "edited"}))
+    # 전송 후 삭제는 둘 다 취소
+    queue.put_nowait(("send", a[4]))
+    queue.put_nowait(("delete", a[4]))
+    # 수정 후 삭제는 삭제만 남기고 삭제 우선순위로 이동
+    queue.put_nowait(("edit", a[5]))
+    queue.put_nowait(("edit", a[5]))
+    queue.put_nowait(("delete", a[5]))
+    # 돌려놓는 작업은 큐에 남은 같은 게시글의 작업보다 먼저 들어온 것으로 보고 합침
+    queue.put_nowait(("delete", a[2] | {"article_id": 10}))
+    queue.requeue(("send", a[2] | {"article_id": 10}))
+    jobs = []
+    while not queue.empty():
+        jobs.append(queue.get_nowait())
+        queue.task_done()
+    assert [(action, data["article_id"]) for action, data in jobs] == [
+        ("send", 2),
+        ("send", 3),
+        ("edit", 1),
+        ("delete", 0),
+        ("delete", 5),
+    ]
+    assert jobs[1][1]["title"] == "edited"
+    # 합쳐지거나 취소된 작업은 처리 완료로 계산
+    assert queue._unfinished_tasks == 0
+
+
+@pytest.mark.asyncio
+async def test_job_queue_roundtrip():
+    """직렬화한 작업 큐를 다시 불러오면 같은 작업을 같은 순서로 처리해야 함"""
+    b = RecordingBot("dummy")
+    await b.stop_consumer()
+    await b.edit(generate_dummy_article(1))
+    await b.send(generate_dummy_article(2))
+    await b.delete(generate_dummy_article(3))
+    data = await b.to_dict()
+    assert [(job[0], job[1]["article_id"]) for job in data["queue"]] == [("send", 2), ("edit", 1), ("delete", 3)]
+    b2 = RecordingBot("dummy")
+    await b2.from_dict(data)
+    await asyncio.wait_for(b2.queue.join(), 1)
+    assert [(action, i) for action, i, _ in b2.done] == [("send", 2), ("edit", 1)]
+    await b2.close()
+
+
+@pytest.mark.asyncio
+async def test_render_cache_unchanged_edit():
+    """보이는 내용이 같은 게시글은 렌더링 결과를 공유하고, 마지막으로 보낸 내용과 같은 수정은 건너뛰어야 함"""
+    bot.render_cache.clear()
+    tg1 = bot.TelegramBot("telegram", "123456:TEST", "@channel")
+    tg2 = bot.TelegramBot("telegram2", "123456:TEST", "@other")
+    article = generate_dummy_article(1)
+    rendered = tg1._render(article)
+    assert tg2._render(dict(article)) is rendered
+    assert not tg1._is_unchanged(article)
+    await tg1.set_msg_obj(article, {"@channel": bot.MessageHandle(-100123, 1)})
+    assert not tg1._is_unchanged(article)
+    tg1._remember(article, "@channel", rendered)
+    # 메시지에 보이지 않는 항목만 바뀐 경우
+    assert tg1._is_unchanged({**article, "writer_name": "other", "extra": {**article["extra"], "view": 10}})
+    assert not tg1._is_unchanged({**article, "title": "changed"})
+    assert not tg1._is_unchanged({**article, "is_end": True})
+    await tg1.remove_expired_msg_obj(article["crawler_name"], 2)
+    assert not tg1._is_unchanged(article)
+    await tg1.stop_consumer()
+    await tg2.stop_consumer()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_skips_unchanged_edit():
+    """보이는 내용이 바뀌지 않은 수정 작업은 요청 제한 토큰을 쓰지 않고 완료 처리해야 함"""
+
+    class UnchangedBot(RecordingBot):
+        reserved = 0
+
+        def _is_unchanged(self, data) -> bool:
+            return data["title"] == "same"
+
+        def _reserve(self, action, data) -> float:
+            self.reserved += 1
+            return 0.0
+
+    b = UnchangedBot("dummy")
+    await b.edit({**generate_dummy_article(1), "title": "same"})
+    await b.edit(generate_dummy_article(2))
+    await asyncio.wait_for(b.queue.join(), 1)
+    assert [(action, i) for action, i, _ in b.done] == [("edit", 2)]
+    assert b.reserved == 1
+    await b.close()
+
+
+class FakeTelegramApi:
+    """요청 대신 호출 인자를 기록하는 텔레그램 봇 API 대용 객체"""
+
+    def __init__(self, retry_after: dict[str, float] | None = None, fail: set[str] | None = None) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        # {chat_id: 첫 요청에 RetryAfter 로 응답할 시간}
+        self.retry_after = retry_after or {}
+        # 항상 BadRequest 로 응답할 chat_id
+        self.fail = fail or set()
+
+    async def send_message(self, **kwargs):
+        self.calls.append(("send_message", kwargs))
+        if (delay := self.retry_after.pop(kwargs["chat_id"], None)) is not None:
+            raise telegram.error.RetryAfter(datetime.timedelta(seconds=delay))
+        if kwargs["chat_id"] in self.fail:
+            raise telegram.error.BadRequest("Chat not found")
+        chat_id = kwargs["chat_id"]
+        return telegram.Message(
+            message_id=100 + len(self.calls),
+            date=datetime.datetime.now(datetime.timezone.utc),
+            chat=telegram.Chat(id=-100123 if chat_id == "@channel" else int(chat_id), type="channel"),
+        )
+
+    async def edit_message_text(self, **kwargs):
+        self.calls.append(("edit_message_text", kwargs))
+
+    async def delete_message(self, **kwargs):
+        self.calls.append(("delete_message", kwargs))
+
+
+@pytest.mark.asyncio
+async def test_telegram_message_handle():
+    """텔레그램 봇은 메시지 핸들만 저장하고 ID로 수정/삭제하며, 이전 덤프의 메시지 딕셔너리도 불러와야 함"""
+    # 작업 큐를 거치지 않고 바로 요청하므로 요청 제한 없이 실행
+    no_limits = {"global_rps": 0, "chat_rps": 0, "group_per_minute": 0}
+    tg = bot.TelegramBot("telegram", "123456:TEST", "@channel", rate_limits=no_limits)
+    api = FakeTelegramApi()
+    tg.bot = api  # type: ignore
+    article = generate_dummy_article(1)
+    handles = await tg._send(article)
+    assert handles == {"@channel": bot.MessageHandle(-100123, 101)}
+    assert await tg.get_msg_obj(article) == handles
+    await tg._edit({**article, "title": "edited"})
+
+    old_message = telegram.Message(
+        message_id=7,
+        date=datetime.datetime.now(datetime.timezone.utc),
+        chat=telegram.Chat(id=-100123, type="channel"),
+        text="old",
+    ).to_dict()
+    data = json.loads(json.dumps(await tg.to_dict(), default=bot.message_serializer))
+    assert data["cache"]["Dummy Crawler"] == {"1": {"@channel": [-100123, 101]}}
+    # 이전 버전 덤프 파일의 메시지 딕셔너리와 단일 핸들
+    data["cache"]["Dummy Crawler"]["2"] = old_message
+    data["cache"]["Dummy Crawler"]["3"] = [-100123, 8]
+    tg2 = bot.TelegramBot("telegram", "123456:TEST", "@channel")
+    await tg2.from_dict(data)
+    assert dict(tg2.cache["Dummy Crawler"]) == {
+        1: {"@channel": (-100123, 101)},
+        2: {"@channel": (-100123, 7)},
+        3: {"@channel": (-100123, 8)},
+    }
+    await tg2.stop_consumer()
+
+    await tg._delete(article)
+    assert [(name, kwargs["chat_id"], kwargs["message_id"]) for name, kwargs in api.calls[1:]] == [
+        ("edit_message_text", -100123, 101),
+        ("delete_message", -100123, 101),
+    ]
+    assert await tg.get_msg_obj(article) is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_multi_target():
+    """여러 전송 대상에 한 번만 렌더링해서 보내고, RetryAfter 를 받은 전송 대상만 다시 시도해야 함"""
+    tg = bot.TelegramBot(
+        "telegram", "123456:TEST", ["-1001", -1002], rate_limits={"chat_rps": 10, "group_per_minute": 0}
+    )
+    api = FakeTelegramApi(retry_after={"-1002": 0.1})
+    tg.bot = api  # type: ignore
+    rendered = []
+
+    def template(article):
+        rendered.append(article["article_id"])
+        return bot.make_telegram_message(article)
+
+    tg.template = template
+    article = generate_dummy_article(1)
+    await tg.send(article)
+    await asyncio.wait_for(tg.queue.join(), 2)
+    assert [kwargs["chat_id"] for _, kwargs in api.calls] == ["-1001", "-1002", "-1002"]
+    assert rendered == [1]
+    assert await tg.get_msg_obj(article) == {
+        "-1001": bot.MessageHandle(-1001, 101),
+        "-1002": bot.MessageHandle(-1002, 103),
+    }
+
+    api.calls.clear()
+    edited = {**article, "title": "edited"}
+    await tg.edit(edited)
+    await asyncio.wait_for(tg.queue.join(), 2)
+    # 같은 내용으로 다시 수정하는 작업은 요청하지 않음
+    await tg.edit(edited)
+    await asyncio.wait_for(tg.queue.join(), 2)
+    await tg.delete(article)
+    await asyncio.wait_for(tg.queue.join(), 2)
+    assert sorted((name, kwargs["message_id"]) for name, kwargs in api.calls) == [
+        ("delete_message", 101),
+        ("delete_message", 103),
+        ("edit_message_text", 101),
+        ("edit_message_text", 103),
+    ]
+    assert await tg.get_msg_obj(article) is None
+    await tg.close()
+
+
+@pytest.mark.asyncio
+async def test_telegram_stale_booking():
+    """예약한 뒤 이미 처리된 전송 대상의 예약은 같은 게시글의 다음 작업에서 재사용하지 않아야 함"""
+    tg = bot.TelegramBot(
+        "telegram", "123456:TEST", "12345", rate_limits={"global_rps": 0, "chat_rps": 1, "group_per_minute": 0}
+    )
+    tg.bot = FakeTelegramApi()  # type: ignore
+    article = generate_dummy_article(1)
+    assert tg._reserve("send", article) == 0
+    # 요청하기 전에 다른 경로로 전송이 끝난 경우
+    await tg.set_msg_obj(article, {"12345": bot.MessageHandle(12345, 1)})
+    await tg._send(article)
+    assert tg.bot.calls == []
+    assert tg._reserve("edit", {**article, "title": "edited"}) == pytest.approx(1, abs=0.05)
+    await tg.stop_consumer()
+
+
+@pytest.mark.asyncio
+async def test_telegram_release_clears_failed_targets():
+    """정지할 때 큐에 돌려놓은 작업은 실패했던 전송 대상도 다시 시도해야 함"""
+    tg = bot.TelegramBot("telegram", "123456:TEST", ["-1001", "-1002"], rate_limits={"group_per_minute": 0})
+    tg.bot = FakeTelegramApi(retry_after={"-1002": 10}, fail={"-1001"})  # type: ignore
+    article = generate_dummy_article(1)
+    await tg.send(article)
+    await asyncio.sleep(0.05)
+    assert tg._failed_targets == {(article["crawler_name"], 1): {"-1001"}}
+    data = await tg.to_dict()
+    assert [(job[0], job[1]["article_id"]) for job in data["queue"]] == [("send", 1)]
+    assert tg._failed_targets == {}
+    assert tg._pending_targets("send", article) == ["-1001", "-1002"]
+
+
+@pytest.mark.asyncio
+async def test_telegram_partial_send_then_delete():
+    """일부 전송 대상에만 보내고 돌려놓은 전송 뒤에 삭제가 들어오면, 이미 보낸 메시지를 삭제해야 함"""
+    tg = bot.TelegramBot("telegram", "123456:TEST", ["-1001", "-1002"], rate_limits={"group_per_minute": 0})
+    tg.bot = FakeTelegramApi(retry_after={"-1002": 10})  # type: ignore
+    article = generate_dummy_article(1)
+    await tg.send(article)
+    await asyncio.sleep(0.05)
+    await tg.stop_consumer()
+    assert await tg.get_msg_obj(article) == {"-1001": bot.MessageHandle(-1001, 101)}
+    await tg.delete(article)
+    data = await tg.to_dict()
+    assert [(job[0], job[1]["article_id"]) for job in data["queue"]] == [("delete", 1)]
+    # 아직 아무 곳에도 보내지 않은 전송은 삭제와 함께 취소
+    other = generate_dummy_article(2)
+    await tg.send(other)
+    await tg.delete(other)
+    assert (await tg.to_dict())["queue"] == []
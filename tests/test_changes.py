@@ -0,0 +1,44 @@
+from src import crawler
+
+from .test_article_collection import generate_dummy_article
+
+
+def make_collection(**changes) -> crawler.ArticleCache:
+    ac = crawler.ArticleCache()
+    for i in range(1, 4):
+        article = generate_dummy_article(i)
+        article["extra"] = {"price": "1,000원", "view": "10"}
+        ac[i] = {**article, **changes.get(str(i), {})}
+    return ac
+
+
+def test_detect_changes():
+    """변경 확인 항목이 바뀐 게시글만 바뀐 항목, 이전 값과 함께 반환해야 함"""
+    cached = make_collection()
+    recent = make_collection(
+        **{
+            "1": {"extra": {"price": "1,000원", "view": "99"}},  # 조회수만 변경
+            "2": {"is_end": True, "extra": {"price": "900원", "view": "10"}},
+            "3": {"title": "changed"},
+        }
+    )
+    changes = crawler.detect_changes(cached, recent)
+    assert [c["article"]["article_id"] for c in changes] == [2, 3]
+    assert changes[0]["fields"] == ("status", "price")
+    assert changes[0]["previous"] == {"status": False, "price": "1,000원"}
+    assert changes[1]["fields"] == ("title",)
+    assert changes[1]["article"] is cached[3]
+    # 게시글 캐시는 수정하지 않음
+    assert cached[3]["title"] == "Dummy article 3"
+
+
+def test_fingerprint_invalidation():
+    """변경 확인 항목을 다시 설정하면 지문이 새로 계산되어야 함"""
+    record = make_collection()[1]
+    fp = record.fingerprint
+    record["writer_name"] = "other"
+    assert record.fingerprint == fp
+    record["extra"] = {"price": "2,000원"}
+    assert record.fingerprint != fp
+    record.update(make_collection()[1])
+    assert record.fingerprint == fp
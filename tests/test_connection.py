@@ -0,0 +1,70 @@
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src import crawler
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(text=request.headers.get("Accept-Encoding", ""))
+
+    async def charset_page(request: web.Request) -> web.Response:
+        # charset 쿼리가 있으면 Content-Type 헤더에, 없으면 본문의 meta 태그에만 인코딩 표시
+        body = '<meta charset="euc-kr"><p>뽐뿌</p>'.encode("cp949")
+        if charset := request.query.get("charset"):
+            return web.Response(body=body, content_type="text/html", charset=charset)
+        return web.Response(body=body, headers={"Content-Type": "text/html"})
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    app.router.add_get("/charset", charset_page)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_reuse_stats(server):
+    """keep-alive 연결을 재사용하고, 연결 생성/재사용 수를 집계해야 함"""
+    session, stats = crawler.create_session({"limit_per_host": 1}, {"User-Agent": "test"})
+    async with session:
+        for _ in range(3):
+            async with session.get(server.make_url("/")) as resp:
+                assert "gzip" in await resp.text()
+    result = stats.snapshot(reset=True)
+    assert result["requests"] == 3
+    assert result["created"] == 1
+    assert result["reused"] == 2
+    assert result["reuse_ratio"] == pytest.approx(2 / 3)
+    assert stats.snapshot()["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_compression_disabled(server):
+    """압축을 사용하지 않는 경우 identity 인코딩을 요청해야 함"""
+    session, stats = crawler.create_session({"compression": False})
+    async with session:
+        async with session.get(server.make_url("/")) as resp:
+            assert await resp.text() == "identity"
+
+
+@pytest.mark.asyncio
+async def test_charset_cache(server):
+    """인코딩은 Content-Type 헤더, 호스트별로 기억한 값, 본문의 선언 순서로 정하고 EUC-KR 은 CP949 로 취급해야 함"""
+    charsets = crawler.CharsetCache()
+    session, _ = crawler.create_session()
+    async with session:
+        async with session.get(server.make_url("/charset")) as resp:
+            body = await resp.read()
+            assert charsets.resolve("a", resp, body) == "cp949"
+        async with session.get(server.make_url("/charset?charset=utf-8")) as resp:
+            assert charsets.resolve("b", resp, await resp.read()) == "utf-8"
+        # 헤더가 없는 응답은 기억해둔 값 사용
+        async with session.get(server.make_url("/charset")) as resp:
+            assert charsets.resolve("b", resp, await resp.read()) == "utf-8"
+    assert charsets.hosts == {"a": "cp949", "b": "utf-8"}
+    assert body.decode(charsets.hosts["a"]).endswith("<p>뽐뿌</p>")
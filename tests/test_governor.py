@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from src.crawler.governor import HostGovernor
+from src.util import TokenBucket
+
+
+def test_token_bucket_reserve():
+    """토큰이 없으면 예약 순서대로 1/rate 초 간격의 대기 시간을 반환해야 함"""
+    bucket = TokenBucket(2, 1)
+    now = bucket.updated
+    assert [bucket.reserve(now) for _ in range(4)] == [0, 0.5, 1.0, 1.5]
+    # 시간이 지나면 토큰이 다시 채워짐 (최대 capacity 개)
+    bucket = TokenBucket(2, 2)
+    assert [bucket.reserve(now + 10) for _ in range(3)] == [0, 0, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_governor_spreads_requests():
+    """같은 도메인(하위 도메인 포함)으로 보내는 요청은 설정한 속도에 맞춰 간격을 두고, 다른 호스트는 영향받지 않아야 함"""
+    governor = HostGovernor({"default_rps": 0, "hosts": {"example.com": 20}})
+    st = time.monotonic()
+    waits = await asyncio.gather(
+        governor.acquire("www.example.com"),
+        governor.acquire("m.example.com"),
+        governor.acquire("example.com"),
+        governor.acquire("other.com"),
+    )
+    assert time.monotonic() - st >= 0.09
+    assert waits[0] == 0 and waits[1] == pytest.approx(0.05, abs=0.01) and waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == 0
+    stats = governor.snapshot(reset=True)
+    assert stats["example.com"]["requests"] == 3
+    assert stats["example.com"]["delayed"] == 2
+    assert stats["example.com"]["delay_max"] == pytest.approx(0.1, abs=0.01)
+    assert stats["other.com"] == {"requests": 1, "delayed": 0, "delay_avg": 0, "delay_max": 0}
+    assert governor.snapshot() == {}
@@ -1,4 +1,11 @@
+import asyncio
+import time
 import tomllib
+from collections.abc import Mapping
+
+import pytest
+
+from src import crawler
 
 
 def test_version():
@@ -8,3 +15,131 @@ def test_version():
         pyproject = tomllib.load(f)
     project_version = pyproject["project"]["version"]
     assert project_version == __version__
+
+
+class SlowDummyCrawler(crawler.DummyCrawler):
+    """응답에 delay초가 걸리는 더미 크롤러"""
+
+    def __init__(self, name: str, delay: float) -> None:
+        super().__init__(name, [])
+        self.delay = delay
+        self.get_count = 0
+        self.known: Mapping[int, crawler.BaseArticle] | None = None
+
+    async def get(self, known: Mapping[int, crawler.BaseArticle] | None = None) -> crawler.ArticleCollection:
+        self.get_count += 1
+        self.known = known
+        await asyncio.sleep(self.delay)
+        return await super().get()
+
+
+async def make_manager(crawlers: dict[str, crawler.BaseCrawler]):
+    from src.main import BotManager
+
+    manager = BotManager()
+    manager.crawlers = crawlers
+    manager.bots = {}
+    manager.article_cache = {}
+    manager.connection_stats = crawler.ConnectionStats()
+    manager.scheduler.sync({name: {} for name in crawlers})
+    # 게시글 캐시 초기화
+    for name, cwr in crawlers.items():
+        manager.article_cache[name] = crawler.ArticleCache(await super(SlowDummyCrawler, cwr).get())
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_crawling_streams_results():
+    """먼저 끝난 크롤러의 결과는 느린 크롤러를 기다리지 않고 바로 전송해야 함"""
+    manager = await make_manager({"slow": SlowDummyCrawler("slow", 0.3), "fast": SlowDummyCrawler("fast", 0.01)})
+    sent: list[tuple[str, float]] = []
+
+    async def send(d):
+        if d["new"]:
+            sent.append((d["new"][0]["crawler_name"], time.monotonic()))
+
+    manager.send = send
+    st = time.monotonic()
+    results = await asyncio.gather(manager._run_crawler("slow"), manager._run_crawler("fast"))
+    assert [name for name, _ in sent] == ["fast", "slow"]
+    assert sent[0][1] - st < 0.2
+    assert [{a["crawler_name"] for a in result["new"]} for result in results] == [{"slow"}, {"fast"}]
+
+
+@pytest.mark.asyncio
+async def test_crawling_deadline():
+    """제한 시간을 넘긴 크롤러는 취소하고 실패로 처리해야 함"""
+    cwr = SlowDummyCrawler("slow", 1)
+    manager = await make_manager({"slow": cwr})
+    manager.scheduler.sync({"slow": {"deadline": 0.05}})
+    st = time.monotonic()
+    result = await manager._crawling("slow", cwr)
+    assert time.monotonic() - st < 0.5
+    assert result == {"new": [], "update": [], "remove": []}
+    assert cwr.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_crawling_single_flight():
+    """같은 크롤러의 크롤링이 진행 중이면 중복 실행하지 않아야 함"""
+    cwr = SlowDummyCrawler("slow", 0.1)
+    manager = await make_manager({"slow": cwr})
+    first, second = await asyncio.gather(manager._crawling("slow", cwr), manager._crawling("slow", cwr))
+    assert cwr.get_count == 1
+    assert cwr.known is manager.article_cache["slow"]
+    assert len(first["new"]) == 2
+    assert second == {"new": [], "update": [], "remove": []}
+
+
+def make_article(article_id: int, title: str, **extra) -> crawler.BaseArticle:
+    return {
+        "article_id": article_id,
+        "title": title,
+        "category": "",
+        "site_name": "dummy",
+        "board_name": "dummy",
+        "writer_name": "dummy",
+        "crawler_name": "dummy",
+        "url": f"https://example.com/{article_id}",
+        "is_end": False,
+        "extra": extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_compare_reports_changed_only():
+    """변경 확인 항목이 바뀐 게시글만 업데이트로 보고하고, 나머지 게시글도 캐시는 최신 값으로 갱신해야 함"""
+    cwr = SlowDummyCrawler("dummy", 0)
+    manager = await make_manager({"dummy": cwr})
+    cache = manager.article_cache["dummy"] = crawler.ArticleCache(
+        {i: make_article(i, f"title {i}", view="1") for i in (1, 2, 3)}
+    )
+    unchanged = cache[3]
+    recent = crawler.ArticleCollection(
+        {1: make_article(1, "new title", view="2"), 3: make_article(3, "title 3", view="2"), 4: make_article(4, "new")}
+    )
+    result = await manager._compare("dummy", cwr, recent)
+    assert [a["article_id"] for a in result["new"]] == [4]
+    assert [a["article_id"] for a in result["update"]] == [1]
+    assert [a["article_id"] for a in result["remove"]] == [2]
+    assert cache[1]["title"] == "new title" and cache[1]["extra"]["view"] == "2"
+    assert cache[3] is unchanged and cache[3]["extra"]["view"] == "2"
+    assert list(cache.keys()) == [1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_init_http_keeps_session():
+    """세션과 관계없는 설정만 바뀐 경우 진행 중인 크롤링이 사용하는 세션을 닫지 않아야 함"""
+    manager = await make_manager({})
+    manager.http_config = {}
+    manager.session, manager.connection_stats = crawler.create_session({})
+    session = manager.session
+    try:
+        await manager.init_http({"politeness": {"default_rps": 5}, "coalesce_ttl": 1, "timeout": 20})
+        assert manager.session is session and not session.closed
+        assert crawler.host_governor.config["default_rps"] == 5
+        await manager.init_http({"limit": 10})
+        assert manager.session is not session and session.closed
+    finally:
+        await manager.init_http({})
+        await manager.session.close()
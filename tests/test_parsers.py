@@ -0,0 +1,260 @@
+import copy
+import json
+import os
+
+import pytest
+from bs4.builder import builder_registry
+
+from src import crawler
+from src.crawler import rss
+from src.crawler.region import find_region, slice_regions
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# 저장된 게시판 페이지 목록: {이름: {crawler, file, encoding, type, url}}
+with open(os.path.join(FIXTURE_DIR, "fixtures.json"), "r", encoding="utf-8") as f:
+    FIXTURES: dict[str, dict[str, str]] = json.load(f)
+
+HTML_FIXTURES = [name for name, fixture in FIXTURES.items() if fixture["type"] == "html"]
+
+
+class _ClosedSession:
+    """네트워크 요청 없이 파싱만 하는 크롤러에 넘겨줄 세션 대용 객체"""
+
+    closed = True
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURE_DIR, FIXTURES[name]["file"]), "rb") as f:
+        return f.read().decode(FIXTURES[name]["encoding"])
+
+
+def make_crawler(name: str, **kwargs) -> crawler.BaseCrawler:
+    crawler_cls: type[crawler.BaseCrawler] = getattr(crawler, FIXTURES[name]["crawler"])
+    return crawler_cls(f"{name}_crawler", [FIXTURES[name]["url"]], session=_ClosedSession(), **kwargs)  # type: ignore
+
+
+@pytest.mark.parametrize("name", FIXTURES.keys())
+def test_parse_fixture(name):
+    """저장된 페이지를 기본 파서로 파싱한 결과 검증"""
+    data = make_crawler(name).parse(load_fixture(name))
+    assert len(data) >= 20
+    for article_id, article in data.items():
+        assert article["article_id"] == article_id
+        assert article["title"]
+        assert article["url"].startswith("https://")
+        assert str(article_id) in article["url"]
+        assert article["crawler_name"] == f"{name}_crawler"
+    if name in HTML_FIXTURES:
+        # RSS에는 핫딜 종료 여부 정보가 없음
+        assert any(article["is_end"] for article in data.values())
+        assert not all(article["is_end"] for article in data.values())
+
+
+@pytest.mark.skipif(builder_registry.lookup("lxml") is None, reason="lxml not installed")
+@pytest.mark.parametrize("name", HTML_FIXTURES)
+def test_parser_backend_parity(name):
+    """lxml 백엔드의 파싱 결과가 html.parser 백엔드와 동일해야 함"""
+    html = load_fixture(name)
+    expected = make_crawler(name, parser="html.parser").parse(html)
+    cwr = make_crawler(name, parser="lxml")
+    assert cwr.parser_backend == "lxml"
+    assert cwr.parse(html) == expected
+
+
+@pytest.mark.parametrize("backend", [b for b in crawler.PARSER_BACKENDS if builder_registry.lookup(b) is not None])
+@pytest.mark.parametrize("name", FIXTURES.keys())
+def test_parse_bytes(name, backend):
+    """디코딩하지 않은 응답 본문과 인코딩을 넘겨도 HTML 문자열을 파싱한 결과와 동일해야 함"""
+    with open(os.path.join(FIXTURE_DIR, FIXTURES[name]["file"]), "rb") as f:
+        raw = f.read()
+    cwr = make_crawler(name, parser=backend)
+    assert cwr.parse_page(raw, FIXTURES[name]["encoding"]) == cwr.parse_page(load_fixture(name))
+
+
+def test_parse_bytes_unknown_encoding():
+    """알 수 없는 인코딩의 응답 본문은 파서 백엔드에 넘기지 않고 파싱 실패로 처리해야 함"""
+    with open(os.path.join(FIXTURE_DIR, FIXTURES["ruliweb"]["file"]), "rb") as f:
+        raw = f.read()
+    for backend in crawler.PARSER_BACKENDS:
+        cwr = make_crawler("ruliweb", parser=backend)
+        assert not cwr.accepts_bytes("x-unknown")
+        assert cwr.parse_page(raw, "x-unknown") == {}
+
+
+@pytest.mark.parametrize("name", [name for name in HTML_FIXTURES if make_crawler(name).regions])
+def test_region_slicing_parity(name):
+    """게시글 목록 영역만 잘라내 파싱한 결과가 전체 파싱 결과와 동일해야 함"""
+    html = load_fixture(name)
+    cwr = make_crawler(name)
+    fragment = slice_regions(html, cwr.regions)
+    assert fragment is not None and len(fragment) < len(html)
+    assert cwr.parse(fragment) == cwr.parse(html)
+    assert cwr.parse_page(html) == cwr.parse(html)
+
+
+def test_region_slicing_fallback():
+    """영역을 찾지 못하거나 잘라낸 영역에 게시글이 없는 경우 전체 파싱"""
+    html = load_fixture("ruliweb")
+    cwr = make_crawler("ruliweb")
+    expected = cwr.parse(html)
+    cwr.regions = ('id="board_name"', 'class="no_such_region"')
+    assert cwr.parse_page(html) == expected
+    cwr.regions = ('id="board_name"',)
+    assert cwr.parse_page(html) == expected
+    # 잘라낸 영역의 게시글 수가 직전 파싱 결과보다 적으면 전체 파싱
+    cwr.regions = make_crawler("ruliweb").regions
+    cwr.parse = lambda fragment: dict(list(expected.items())[:3]) if len(fragment) < len(html) else expected
+    assert cwr.parse_page(html) == dict(list(expected.items())[:3])
+    assert cwr.parse_page(html, expected=len(expected)) == expected
+
+
+@pytest.mark.parametrize("name", HTML_FIXTURES)
+def test_known_articles_parity(name):
+    """모든 게시글을 이미 추적 중인 경우에도 전체 파싱 결과와 동일해야 함"""
+    html = load_fixture(name)
+    cwr = make_crawler(name)
+    expected = cwr.parse_page(html)
+    assert cwr.parse_page(html, known=copy.deepcopy(expected)) == expected
+
+
+def test_known_articles_changed():
+    """이미 추적 중인 게시글은 제목과 종료 여부만 새로 파싱하고 나머지 값은 기존 값을 유지"""
+    html = load_fixture("ruliweb")
+    cwr = make_crawler("ruliweb")
+    expected = cwr.parse_page(html)
+    article_id = next(iter(expected))
+    known = copy.deepcopy(expected)
+    known[article_id]["title"] = "이전 제목"
+    known[article_id]["is_end"] = not expected[article_id]["is_end"]
+    known[article_id]["extra"]["view"] = "-1"
+    data = cwr.parse_page(html, known=known)
+    assert data[article_id]["title"] == expected[article_id]["title"]
+    assert data[article_id]["is_end"] == expected[article_id]["is_end"]
+    assert data[article_id]["extra"]["view"] == "-1"
+    assert known[article_id]["title"] == "이전 제목"
+    # 추적 중이지 않은 게시글은 전체 파싱
+    del known[article_id]
+    assert cwr.parse_page(html, known=known)[article_id] == expected[article_id]
+
+
+@pytest.mark.asyncio
+async def test_known_articles_process():
+    """프로세스 풀에는 게시글 번호만 넘기고, 빠른 경로로 파싱된 게시글은 기존 데이터와 합쳐야 함"""
+    html = load_fixture("ruliweb")
+    executor = crawler.ParseExecutor("process", max_workers=1)
+    try:
+        cwr = make_crawler("ruliweb", executor=executor)
+        expected = cwr.parse_page(html)
+        article_id = next(iter(expected))
+        known = copy.deepcopy(expected)
+        known[article_id]["title"] = "이전 제목"
+        known[article_id]["extra"]["view"] = "-1"
+        partial = cwr.parse_page(html, known=frozenset(known))
+        assert set(partial[article_id]) == {"article_id", "crawler_name", "title", "is_end", "extra"}
+        data = await cwr.parsing(html, known=known)
+        assert data[article_id]["title"] == expected[article_id]["title"]
+        assert data[article_id]["extra"]["view"] == "-1"
+        assert {k: v for k, v in data.items() if k != article_id} == {
+            k: v for k, v in expected.items() if k != article_id
+        }
+    finally:
+        executor.shutdown()
+
+
+def test_find_region():
+    html = '<div class="a"><div>1</div><input id="b" value="x"><br/><div class="c">2<div></div></div></div><p>3</p>'
+    assert html[slice(*find_region(html, 'class="c"'))] == '<div class="c">2<div></div></div>'
+    assert html[slice(*find_region(html, 'class="a"'))] == html.removesuffix("<p>3</p>")
+    assert html[slice(*find_region(html, 'id="b"'))] == '<input id="b" value="x">'
+    assert find_region(html, 'class="d"') is None
+    # 태그 밖의 문자열
+    assert find_region('<p>class="a"</p>', 'class="a"') is None
+    # 닫히지 않은 태그
+    assert find_region('<div class="a"><div>', 'class="a"') is None
+    assert slice_regions(html, ('class="c"', 'id="b"', 'class="a"')) == html.removesuffix("<p>3</p>")
+    # 디코딩하지 않은 응답 본문
+    assert (
+        slice_regions(html.encode(), ('class="c"', 'id="b"'))
+        == b'<input id="b" value="x">\n<div class="c">2<div></div></div>'
+    )
+    # 주석, 스크립트/스타일 본문, 속성 값 안의 태그는 세지 않음
+    for inner in ("<!-- </div> -->", "<script>if (a</div>) {}</script>", "<style>/* <div> */</style>"):
+        doc = f'<div class="a">{inner}<div>1</div></div><p>2</p>'
+        assert doc[slice(*find_region(doc, 'class="a"'))] == doc.removesuffix("<p>2</p>")
+    doc = '<div class="a" title="<div>"><a href="#" data-x="</div>">1</a></div><p>2</p>'
+    assert doc[slice(*find_region(doc, 'class="a"'))] == doc.removesuffix("<p>2</p>")
+    assert find_region(doc.encode(), 'class="a"') == find_region(doc, 'class="a"')
+    # 대소문자를 구분하지 않음
+    assert find_region('<DIV class="a"><div></DIV></Div>x', 'class="a"') == (0, 32)
+
+
+class AtomCrawler(crawler.BaseRSSCrawler):
+    feed = {
+        "site_name": "Atom",
+        "item": "atom:entry",
+        "fields": {"title": "atom:title", "link": "atom:link", "writer_name": "atom:author/atom:name"},
+        "link_pattern": r"/(?P<board>\w+)/(?P<id>\d+)$",
+        "url": "https://example.com/{board}/{id}",
+        "board_name_separator": "|",
+    }
+
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Example | Hotdeal</title>
+<entry><title>First</title><link href="https://example.com/deal/2"/><author><name>a</name></author></entry>
+<entry><title>Second</title><link href="https://example.com/deal/1"/><author><name>b</name></author></entry>
+<entry><title>No link</title><author><name>c</name></author></entry>
+</feed>"""
+
+
+def test_rss_atom_feed():
+    """설정만으로 Atom 피드를 파싱할 수 있어야 함"""
+    cwr = AtomCrawler("atom", ["https://example.com/feed"], session=_ClosedSession())  # type: ignore
+    data = cwr.parse(ATOM_FEED)
+    assert list(data.keys()) == [2, 1]
+    assert data[2]["title"] == "First"
+    assert data[2]["board_name"] == "Hotdeal"
+    assert data[2]["writer_name"] == "a"
+    assert data[1]["url"] == "https://example.com/deal/1"
+
+
+@pytest.mark.parametrize("name", [name for name, fixture in FIXTURES.items() if fixture["type"] == "rss"])
+def test_rss_chunked_parse(name, monkeypatch):
+    """피드를 잘게 나눠 읽어도 결과가 같아야 하고, 잘못된 XML은 빈 결과를 반환해야 함"""
+    xml = load_fixture(name)
+    cwr = make_crawler(name)
+    expected = cwr.parse(xml)
+    monkeypatch.setattr(rss, "CHUNK_SIZE", 7)
+    assert cwr.parse(xml) == expected
+    assert cwr.parse(xml[: len(xml) // 2]) == {}
+
+
+def test_unknown_parser_backend_fallback():
+    """알 수 없는 백엔드가 설정된 경우 html.parser 사용"""
+    cwr = make_crawler("ruliweb", parser="unknown")
+    assert cwr.parser_backend == "html.parser"
+
+
+@pytest.mark.asyncio
+async def test_benchmark_runner():
+    """벤치마크 도구가 네트워크 없이 저장된 페이지로 측정 결과를 반환해야 함"""
+    from src.tools.benchmark import run_benchmark
+
+    results = await run_benchmark(1, [crawler.DEFAULT_PARSER_BACKEND], ["ruliweb", "ppomppu_rss"])
+    assert [r["fixture"] for r in results] == ["ruliweb", "ppomppu_rss"]
+    for r in results:
+        assert r["articles"] >= 20
+        assert r["time_mean"] > 0
+        assert r["peak_memory"] > 0
+
+
+def test_memory_benchmark_runner():
+    """메모리 벤치마크 도구가 게시글 캐시의 게시글당 메모리 사용량을 측정해야 함"""
+    from src.tools.memory_benchmark import run_benchmark
+
+    results = run_benchmark(100, ["ruliweb"])
+    assert [r["fixture"] for r in results] == ["ruliweb"]
+    assert results[0]["articles"] >= 100
+    assert 0 < results[0]["record_per_article"] < results[0]["dict_per_article"]
@@ -0,0 +1,58 @@
+import email.utils
+import time
+
+import pytest
+
+from src.crawler.retry import BreakerRegistry, RetryPolicy, parse_retry_after
+
+
+def test_retry_delay_backoff():
+    """재시도 대기 시간은 0 ~ min(max_delay, base_delay * 2^n) 범위의 무작위 값"""
+    policy = RetryPolicy({"attempts": 5, "base_delay": 1, "max_delay": 4})
+    for attempt, upper in enumerate([1, 2, 4, 4]):
+        delays = [policy.delay(attempt) for _ in range(100)]
+        assert all(0 <= d <= upper for d in delays)
+    assert [policy.should_retry(n) for n in range(5)] == [True, True, True, True, False]
+
+
+def test_retry_after():
+    policy = RetryPolicy({"max_retry_after": 10})
+    assert policy.delay(0, 3) == 3
+    assert policy.delay(0, 30) is None
+    assert parse_retry_after("5") == 5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("invalid") is None
+    http_date = email.utils.formatdate(time.time() + 60, usegmt=True)
+    assert parse_retry_after(http_date) == pytest.approx(60, abs=2)
+
+
+def test_circuit_breaker():
+    """연속 실패 시 열리고, 복구 시간이 지나면 시험 요청 하나만 허용하며, 성공하면 닫혀야 함"""
+    registry = BreakerRegistry({"failure_threshold": 2, "recovery_timeout": 0.05, "half_open_max": 1})
+    breaker = registry.get("example.com")
+    assert registry.get("example.com") is breaker
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    # 시험 요청 실패 시 다시 열림
+    breaker.record_failure()
+    assert breaker.state == "open"
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+    assert registry.snapshot() == {"example.com": {"state": "closed", "failures": 0, "open_remaining": 0.0}}
+
+
+def test_circuit_breaker_retry_after():
+    """서버가 긴 대기 시간을 요구하면 실패 횟수와 관계없이 그 시간동안 열려있어야 함"""
+    registry = BreakerRegistry({"failure_threshold": 5, "recovery_timeout": 1})
+    breaker = registry.get("example.com")
+    breaker.record_failure(retry_after=300)
+    assert breaker.state == "open"
+    assert breaker.snapshot()["open_remaining"] > 290
@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+import pytest
+
+from src.scheduler import CrawlerSchedule, Scheduler
+
+ADAPTIVE = {"interval": 60, "min_interval": 10, "max_interval": 300}
+
+
+def test_default_fixed_interval():
+    """설정이 없는 경우 기존과 같이 60초 고정 주기"""
+    schedule = CrawlerSchedule("test", {})
+    assert schedule.next_delay(0, False, 0) == 60
+    assert schedule.next_delay(10, False, 60) == 60
+    assert schedule.next_delay(0, False, 120) == 60
+
+
+def test_hot_board_shrinks_interval():
+    """새 글이 자주 올라오는 게시판은 최소 주기까지 줄어들어야 함"""
+    schedule = CrawlerSchedule("hot", ADAPTIVE)
+    now = 0.0
+    delays = []
+    for _ in range(10):
+        delay = schedule.next_delay(5, False, now)
+        delays.append(delay)
+        now += delay
+    assert delays[0] == 60
+    assert delays[-1] == 10
+    assert delays == sorted(delays, reverse=True)
+
+
+def test_cold_board_grows_interval():
+    """새 글이 없는 게시판은 주기가 조금씩 늘어나 최대 주기까지 늘어나야 함"""
+    schedule = CrawlerSchedule("cold", ADAPTIVE)
+    now = 0.0
+    delays = []
+    for _ in range(10):
+        delay = schedule.next_delay(0, False, now)
+        delays.append(delay)
+        now += delay
+    assert delays[1] == 90
+    assert delays[-1] == 300
+
+
+def test_failure_backoff():
+    """실패 시 연속 실패 횟수만큼 주기가 늘어나고, 성공하면 원래 주기로 돌아와야 함"""
+    schedule = CrawlerSchedule("fail", {"backoff": 2, "max_backoff": 300})
+    assert [schedule.next_delay(0, True, 0) for _ in range(4)] == [120, 240, 300, 300]
+    assert schedule.next_delay(0, False, 0) == 60
+
+
+def test_jitter_bounds():
+    schedule = CrawlerSchedule("jitter", {"jitter": 0.1})
+    delays = [schedule.next_delay(0, False, i * 60) for i in range(50)]
+    assert all(54 <= d <= 66 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_scheduler_order_and_single_flight():
+    """실행 시각 순서대로 꺼내고, 실행 중인 크롤러는 결과 보고 전까지 다시 꺼내지 않아야 함"""
+    scheduler = Scheduler()
+    scheduler.sync({"a": {}, "b": {"interval": 30, "min_interval": 30, "max_interval": 30}})
+    now = time.monotonic()
+    assert sorted(scheduler.pop_due(now)) == ["a", "b"]
+    assert scheduler.pop_due(now + 1000) == []
+    scheduler.report("a", 0, False, now)
+    scheduler.report("b", 0, False, now)
+    assert scheduler.next_wakeup(time.monotonic()) == pytest.approx(30, abs=1)
+    assert scheduler.pop_due(time.monotonic() + 31) == ["b"]
+    assert scheduler.pop_due(time.monotonic() + 61) == ["a"]
+
+
+def test_scheduler_sync_removes_crawler():
+    scheduler = Scheduler()
+    scheduler.sync({"a": {}, "b": {}})
+    scheduler.sync({"b": {}})
+    assert scheduler.pop_due() == ["b"]
+    assert scheduler.report("a", 0, False, 0) == 0
+    assert scheduler.next_wakeup() is None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_wakes_on_report():
+    """대기 중 새 예약이 생기면 바로 깨어나야 함"""
+    scheduler = Scheduler()
+    scheduler.sync({"a": {"interval": 0, "min_interval": 0, "max_interval": 0}})
+    assert scheduler.pop_due() == ["a"]
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.05, scheduler.report, "a", 0, False, time.monotonic())
+    st = time.monotonic()
+    await scheduler.wait(timeout=5)
+    assert time.monotonic() - st < 1
+    assert scheduler.pop_due() == ["a"]
@@ -0,0 +1,54 @@
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from src import crawler
+from src.tools.replay_server import ReplayServer
+
+
+@pytest_asyncio.fixture
+async def server():
+    server = ReplayServer(2, {"seed": 1, "new_posts": 2, "edit_rate": 1, "end_rate": 1, "delete_rate": 1})
+    await server.start()
+    yield server
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_board_mutations(server):
+    """가상 게시판을 크롤러로 파싱할 수 있고, 단계가 진행되면 새 글/수정/품절/삭제가 반영되어야 함"""
+    async with aiohttp.ClientSession() as session:
+        cwr = crawler.RuliwebCrawler("replay", [server.board_url(0)], session=session)
+        before = await cwr.get()
+        assert len(before) == 28
+        mutations = server.advance()
+        after = await cwr.get()
+    assert mutations["new"] == 4 and mutations["edit"] == 2 and mutations["delete"] == 2
+    assert len(after) == 27
+    assert len(after.keys() - before.keys()) == 2
+    assert any(article["is_end"] for article in after.values())
+    assert server.get_stats()["requests"]["requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fixture_page(server):
+    """저장된 페이지를 원래 인코딩 그대로 제공해야 함"""
+    async with aiohttp.ClientSession() as session:
+        cwr = crawler.PpomppuCrawler("replay", [server.fixture_url("ppomppu")], session=session)
+        data = await cwr.get()
+    assert len(data) >= 20
+
+
+@pytest.mark.asyncio
+async def test_error_response():
+    """설정한 확률로 오류 응답을 보내야 함"""
+    server = ReplayServer(1, {"error_rate": 1, "error_codes": [503]})
+    await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(server.board_url(0)) as resp:
+                assert resp.status == 503
+                assert resp.headers["Retry-After"] == "1"
+    finally:
+        await server.close()
+    assert server.get_stats()["status"] == {"503": 1}